@@ -2,27 +2,61 @@
 # Copyright 2025 The Charmarr Project
 # See LICENSE file for licensing details.
 
-"""Detached HTTP server serving the charmarr topology graph in
-`nodegraph-api` plugin format.
+"""Detached HTTP server aggregating the charmarr fleet topology graph
+in `nodegraph-api` plugin format.
 
 Usage:
-    _graph_daemon.py <port> <data_file>
+    _graph_daemon.py <port> <members_file>
 
-`data_file` is a JSON file with `{"nodes": [...], "edges": [...]}` written
-by the charm reconciler. The server serves:
+`members_file` is a JSON file written by the charm reconciler:
+
+    {"interval": 30, "timeout": 2, "deadline": 5, "workers": 8,
+     "members": [{"id": "charmarr/radarr", "app": "radarr",
+                  "model": "charmarr", "url": "http://...:9099/metrics"}]}
+
+and is re-read whenever its mtime changes. The daemon polls every
+member's topology endpoint concurrently each `interval` (each poll
+bounded by `timeout`, the whole round by `deadline`), sending the
+member's last ETag/Last-Modified so unchanged endpoints can answer 304.
+Each member's parsed topology is cached by body digest, and the graph
+is only rebuilt and re-serialized when a member's topology or
+reachability changes. The server serves:
 
 - ``GET /api/health`` -> "ok"
 - ``GET /api/graph/fields`` -> static schema definition
-- ``GET /api/graph/data`` -> contents of `<data_file>`
+- ``GET /api/graph/data`` -> the current aggregated graph
+- ``GET /metrics`` -> per-member poll success and latency
+
+CORS open so the Grafana plugin can fetch cross-origin. Threading,
+gzip and ETag handling come from _daemon_core, copied alongside.
 
-CORS open so the Grafana plugin can fetch cross-origin.
+Standard library only: the charm's virtualenv is not on the path of a
+detached child.
 """
 
+import hashlib
 import json
+import os
+import re
 import sys
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, NamedTuple
 
-DATA_FILE = sys.argv[2]
+from _daemon_core import Payload, serve
+
+JSON = "application/json"
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+CONFIG_POLL_INTERVAL = 5.0
+
+_EDGE_LINE_RE = re.compile(r"^charmarr_relation_edge\{([^}]*)\} 1")
+_BOUND_LINE_RE = re.compile(r"^charmarr_relation_bound\{([^}]*)\} (\d+)")
+_LABEL_RE = re.compile(r'(\w+)="([^"]*)"')
+_REMOTE_PROXY_RE = re.compile(r"^remote-[0-9a-f]{32}$")
 
 FIELDS = {
     "edges_fields": [
@@ -56,36 +90,373 @@ FIELDS = {
     ],
 }
 
+HEALTH = Payload(b'"ok"', JSON)
+FIELDS_PAYLOAD = Payload(json.dumps(FIELDS).encode(), JSON)
+
+
+class Topology(NamedTuple):
+    """What one member's topology exposition says about it."""
+
+    # (from_app, relation, to_app), peers by their bare juju-local name
+    edges: frozenset[tuple[str, str, str]]
+    bound: int
+    required_unbound: tuple[str, ...]
+    optional_unbound: tuple[str, ...]
+
+
+def parse_topology(text: str) -> Topology:
+    """Parse the charmarr_relation_* lines of a topology exposition."""
+    edges: set[tuple[str, str, str]] = set()
+    bound = 0
+    required_unbound: list[str] = []
+    optional_unbound: list[str] = []
+    for line in text.splitlines():
+        if edge_match := _EDGE_LINE_RE.match(line):
+            labels = dict(_LABEL_RE.findall(edge_match.group(1)))
+            from_app = labels.get("from_app", "")
+            to_app = labels.get("to_app", "")
+            relation = labels.get("relation", "")
+            if from_app and to_app and relation:
+                edges.add((from_app, relation, to_app))
+        elif bound_match := _BOUND_LINE_RE.match(line):
+            labels = dict(_LABEL_RE.findall(bound_match.group(1)))
+            relation_name = labels.get("relation", "")
+            if bound_match.group(2) == "1":
+                bound += 1
+            elif labels.get("required") == "true":
+                required_unbound.append(relation_name)
+            else:
+                optional_unbound.append(relation_name)
+    return Topology(frozenset(edges), bound, tuple(required_unbound), tuple(optional_unbound))
+
+
+def _node_id(app: str, model: str) -> str:
+    return f"{model}/{app}" if model else app
 
-class _Handler(BaseHTTPRequestHandler):
-    def log_message(self, format, *args):
-        del format, args  # silence access logs
-
-    def _send_json(self, body: bytes) -> None:
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.end_headers()
-        self.wfile.write(body)
-
-    def do_GET(self) -> None:
-        if self.path == "/api/health":
-            self._send_json(b'"ok"')
-            return
-        if self.path == "/api/graph/fields":
-            self._send_json(json.dumps(FIELDS).encode())
-            return
-        if self.path == "/api/graph/data":
-            try:
-                with open(DATA_FILE, "rb") as fh:
-                    body = fh.read()
-            except FileNotFoundError:
-                body = json.dumps({"nodes": [], "edges": []}).encode()
-            self._send_json(body)
-            return
-        self.send_error(404)
+
+def build_graph(members: list["Member"]) -> dict[str, list[dict[str, Any]]]:
+    """Aggregate the members' last known topologies into one graph.
+
+    Node identity is composite (model/app) so same-named apps in
+    different models (e.g. a local `plex` and a cross-model `plex`) do
+    not collide. Members without a topology (unreachable, or not polled
+    yet) are still rendered, as red `offline` nodes.
+
+    Edges from a member's exposition reference peers by their bare
+    juju-local name only. We resolve that name to a composite node id by
+    preferring a peer in the same model as the member, falling back to
+    any model that contains a node with that name, and falling back again
+    to a placeholder under the member's own model so cross-model peers
+    that don't publish to crowsnest still show up in the graph.
+    """
+    # Display-side metadata for each composite node id: (app, model).
+    node_meta: dict[str, tuple[str, str]] = {}
+    # Reverse index of bare app name -> set of composite node ids,
+    # used when resolving edge endpoints.
+    ids_by_app: dict[str, set[str]] = defaultdict(set)
+    reachable: dict[str, Topology] = {}
+    edges_set: set[tuple[str, str, str, str]] = set()
+    for member in members:
+        node_meta[member.id] = (member.app, member.model)
+        ids_by_app[member.app].add(member.id)
+        if member.topology is not None:
+            reachable[member.id] = member.topology
+            # Defer endpoint resolution until every member's metadata is
+            # collected; keep the source model alongside the raw labels.
+            edges_set.update((member.model, *edge) for edge in member.topology.edges)
+
+    # Drop ghost edges from CMR'd peers that also speak crowsnest. A
+    # local charm sees its remote CMR peer as `remote-<32hex>` (Juju's
+    # SAAS proxy name) and emits topology edges with that name. If the
+    # peer publishes itself via crowsnest under its real name, both
+    # sides record the same logical relation - the local one gets
+    # synthesized into a ghost `remote-<hex>` node. Drop a
+    # `remote-<hex>` edge if any other edge in the set covers the same
+    # `(relation, other_endpoint)` pair from a non-remote side.
+    real_sources: dict[tuple[str, str], set[str]] = defaultdict(set)
+    real_targets: dict[tuple[str, str], set[str]] = defaultdict(set)
+    for _, from_app, relation, to_app in edges_set:
+        if not _REMOTE_PROXY_RE.match(from_app):
+            real_sources[(relation, to_app)].add(from_app)
+        if not _REMOTE_PROXY_RE.match(to_app):
+            real_targets[(relation, from_app)].add(to_app)
+
+    def _is_ghost_remote_edge(edge: tuple[str, str, str, str]) -> bool:
+        _, from_app, relation, to_app = edge
+        if _REMOTE_PROXY_RE.match(from_app) and real_sources[(relation, to_app)]:
+            return True
+        return bool(_REMOTE_PROXY_RE.match(to_app) and real_targets[(relation, from_app)])
+
+    edges_set = {e for e in edges_set if not _is_ghost_remote_edge(e)}
+
+    def _resolve(app: str, source_model: str) -> str:
+        candidates = ids_by_app.get(app, set())
+        same_model = _node_id(app, source_model)
+        if same_model in candidates:
+            return same_model
+        if candidates:
+            return next(iter(sorted(candidates)))
+        placeholder = _node_id(app, source_model)
+        node_meta.setdefault(placeholder, (app, source_model))
+        ids_by_app[app].add(placeholder)
+        return placeholder
+
+    resolved_edges = {
+        (_resolve(from_app, source_model), relation, _resolve(to_app, source_model))
+        for source_model, from_app, relation, to_app in edges_set
+    }
+
+    all_node_ids = set(node_meta) | {n for e in resolved_edges for n in (e[0], e[2])}
+    # Multi-model fleets benefit from a model hint under each node;
+    # single-model deployments don't, so keep the title blank when
+    # there's only one model in play.
+    distinct_models = {model for _, model in node_meta.values() if model}
+    show_model_title = len(distinct_models) > 1
+
+    # arc__* values must sum to 1 per Grafana node graph docs - raw
+    # counts cause the panel to silently drop all but the first arc.
+    # Three colors:
+    #   green  = required relations that are wired
+    #   red    = required relations declared but unbound (real breakage)
+    #   yellow = optional relations declared but unbound (informational)
+    def _arcs(topology: Topology | None) -> tuple[float, float, float]:
+        if topology is None:
+            return (0.0, 1.0, 0.0)
+        required = len(topology.required_unbound)
+        optional = len(topology.optional_unbound)
+        total = topology.bound + required + optional
+        if total == 0:
+            return (1.0, 0.0, 0.0)
+        return (topology.bound / total, required / total, optional / total)
+
+    nodes = []
+    for node_id in sorted(all_node_ids):
+        app, model = node_meta.get(node_id, (node_id, ""))
+        topology = reachable.get(node_id)
+        bound_arc, missing_arc, optional_arc = _arcs(topology)
+        title = "offline" if topology is None else (model if show_model_title else "")
+        nodes.append(
+            {
+                "id": node_id,
+                "mainstat": app,
+                "title": title,
+                "arc__bound": bound_arc,
+                "arc__missing": missing_arc,
+                "arc__optional": optional_arc,
+                "detail__model": model,
+                "detail__missing_required": ", ".join(
+                    sorted(topology.required_unbound if topology else ())
+                ),
+                "detail__missing_optional": ", ".join(
+                    sorted(topology.optional_unbound if topology else ())
+                ),
+            }
+        )
+
+    edges = [
+        {
+            "id": f"{from_id}->{relation}->{to_id}",
+            "source": from_id,
+            "target": to_id,
+            "mainstat": relation,
+        }
+        for from_id, relation, to_id in sorted(resolved_edges)
+    ]
+
+    return {"nodes": nodes, "edges": edges}
+
+
+def fetch(url: str, timeout: float, validators: dict[str, str]) -> tuple[bytes | None, dict]:
+    """Conditionally GET url: (None, validators) on 304, else (body, new validators)."""
+    headers = {}
+    if etag := validators.get("etag"):
+        headers["If-None-Match"] = etag
+    if last_modified := validators.get("last_modified"):
+        headers["If-Modified-Since"] = last_modified
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            received = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None, validators
+        raise
+    return body, {k: v for k, v in received.items() if v}
+
+
+class Member:
+    """One fleet member: its last poll outcome and cached topology."""
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        self.id = str(spec["id"])
+        self.app = str(spec["app"])
+        self.model = str(spec.get("model", ""))
+        self.url = str(spec["url"])
+        self.topology: Topology | None = None
+        self.validators: dict[str, str] = {}
+        self.digest = ""
+        self.seconds = 0.0
+
+    def apply(self, result: tuple[bytes | None, dict] | None, seconds: float) -> bool:
+        """Record a poll result (None on failure); True if the graph must change."""
+        self.seconds = seconds
+        if result is None:
+            changed = self.topology is not None
+            self.topology, self.validators, self.digest = None, {}, ""
+            return changed
+        body, self.validators = result
+        if body is None:
+            # 304: the endpoint vouches for our cached topology
+            return False
+        digest = hashlib.sha256(body).hexdigest()
+        if digest == self.digest and self.topology is not None:
+            # Endpoints without validators still skip the re-parse
+            return False
+        self.digest = digest
+        self.topology = parse_topology(body.decode(errors="replace"))
+        return True
+
+
+class Fleet:
+    """Members built from the member list, polled and aggregated in a loop."""
+
+    def __init__(self, members_file: str) -> None:
+        self._members_file = members_file
+        self._mtime = 0.0
+        self._members: dict[str, Member] = {}
+        self.interval = 30.0
+        self.timeout = 2.0
+        self.deadline = 5.0
+        self.workers = 8
+        self.round_seconds = 0.0
+        self.graph_payload = Payload(json.dumps(build_graph([])).encode(), JSON)
+        self.metrics_payload = Payload(b"", METRICS_CONTENT_TYPE)
+
+    def reload_if_changed(self) -> bool:
+        """Re-read the member list; keep the caches of members that stayed."""
+        try:
+            mtime = os.stat(self._members_file).st_mtime
+        except FileNotFoundError:
+            return False
+        if mtime == self._mtime:
+            return False
+        try:
+            with open(self._members_file) as fh:
+                config = json.load(fh)
+            specs = config.get("members", [])
+            members = {}
+            for spec in specs:
+                member = Member(spec)
+                known = self._members.get(member.id)
+                members[member.id] = known if known and known.url == member.url else member
+            self.interval = float(config.get("interval", self.interval))
+            self.timeout = float(config.get("timeout", self.timeout))
+            self.deadline = float(config.get("deadline", self.deadline))
+            self.workers = int(config.get("workers", self.workers))
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        self._members = members
+        self._mtime = mtime
+        return True
+
+    def poll(self) -> bool:
+        """Poll every member concurrently; True if any member's state changed.
+
+        Members that have not answered by the deadline count as failed and
+        their polls are abandoned; results are only applied here, on the
+        loop thread, so a straggler never touches a Member.
+        """
+        members = list(self._members.values())
+        if not members:
+            return False
+        start = time.monotonic()
+
+        def timed_fetch(member: Member) -> tuple[tuple[bytes | None, dict], float]:
+            began = time.monotonic()
+            return fetch(member.url, self.timeout, member.validators), time.monotonic() - began
+
+        pool = ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(members))))
+        try:
+            futures = [(member, pool.submit(timed_fetch, member)) for member in members]
+            wait([future for _, future in futures], timeout=self.deadline)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self.round_seconds = time.monotonic() - start
+
+        changed = False
+        for member, future in futures:
+            if future.done() and future.exception() is None:
+                result, seconds = future.result()
+                changed |= member.apply(result, seconds)
+            else:
+                changed |= member.apply(None, self.round_seconds)
+        return changed
+
+    def rebuild(self, graph: bool) -> None:
+        """Swap in fresh payloads; the graph only when it may have changed."""
+        members = list(self._members.values())
+        if graph:
+            self.graph_payload = Payload(json.dumps(build_graph(members)).encode(), JSON)
+        metrics = render_metrics(members, self.round_seconds)
+        self.metrics_payload = Payload(metrics.encode(), METRICS_CONTENT_TYPE)
+
+    def loop(self) -> None:
+        next_due = 0.0
+        while True:
+            reloaded = self.reload_if_changed()
+            now = time.monotonic()
+            if reloaded or now >= next_due:
+                # A new or changed member list is polled straight away
+                changed = self.poll()
+                self.rebuild(graph=reloaded or changed)
+                next_due = now + self.interval
+            time.sleep(max(0.5, min(next_due - time.monotonic(), CONFIG_POLL_INTERVAL)))
+
+
+def render_metrics(members: list[Member], round_seconds: float) -> str:
+    """Prometheus text exposition of the last poll round."""
+    lines = [
+        "# HELP charmarr_crowsnest_member_poll_success "
+        "1 if the fleet member's topology endpoint answered the last poll.",
+        "# TYPE charmarr_crowsnest_member_poll_success gauge",
+    ]
+    lines += [
+        f'charmarr_crowsnest_member_poll_success{{member="{m.id}"}} '
+        f"{0.0 if m.topology is None else 1.0}"
+        for m in members
+    ]
+    lines += [
+        "# HELP charmarr_crowsnest_member_poll_duration_seconds "
+        "Duration of the last topology poll of the fleet member.",
+        "# TYPE charmarr_crowsnest_member_poll_duration_seconds gauge",
+    ]
+    lines += [
+        f'charmarr_crowsnest_member_poll_duration_seconds{{member="{m.id}"}} {m.seconds}'
+        for m in members
+    ]
+    lines += [
+        "# HELP charmarr_crowsnest_fleet_poll_duration_seconds "
+        "Wall-clock duration of the last concurrent poll of the whole fleet.",
+        "# TYPE charmarr_crowsnest_fleet_poll_duration_seconds gauge",
+        f"charmarr_crowsnest_fleet_poll_duration_seconds {round_seconds}",
+    ]
+    return "\n".join(lines) + "\n"
 
 
 if __name__ == "__main__":
-    HTTPServer(("0.0.0.0", int(sys.argv[1])), _Handler).serve_forever()
+    fleet = Fleet(sys.argv[2])
+    threading.Thread(target=fleet.loop, daemon=True).start()
+    serve(
+        int(sys.argv[1]),
+        {
+            "/api/health": lambda: HEALTH,
+            "/api/graph/fields": lambda: FIELDS_PAYLOAD,
+            "/api/graph/data": lambda: fleet.graph_payload,
+            "/metrics": lambda: fleet.metrics_payload,
+        },
+        headers={"Access-Control-Allow-Origin": "*"},
+    )
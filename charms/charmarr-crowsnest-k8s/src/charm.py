@@ -7,13 +7,12 @@
 import json
 import logging
 import os
-import re
+import signal
 import subprocess
 import sys
-from collections import defaultdict
+import time
 from pathlib import Path
 
-import httpx
 import ops
 from charmlibs.interfaces.sloth import SlothProvider
 from charms.grafana_k8s.v0.grafana_dashboard import GrafanaDashboardProvider
@@ -51,19 +50,22 @@ logger = logging.getLogger(__name__)
 
 SLO_DIR = Path(__file__).parent / "slos"
 GRAPH_DAEMON_SCRIPT = Path(__file__).parent / "_graph_daemon.py"
+DAEMON_CORE_SCRIPT = Path(__file__).parent / "_daemon_core.py"
 
 GRAPH_PORT = 9098
 INGRESS_PORT = 80
 GRAPH_PID_FILE = Path("/tmp/charmarr-graph.pid")
-GRAPH_DATA_FILE = Path("/tmp/charmarr-graph.json")
+GRAPH_MEMBERS_FILE = Path("/tmp/charmarr-graph-members.json")
 GRAPH_SCRIPT_FILE = Path("/tmp/charmarr-graph-server.py")
+# Imported by the daemon script, so it must sit next to it under this name
+DAEMON_CORE_FILE = Path("/tmp/_daemon_core.py")
 
+# Fleet polling, done by the graph daemon (see _graph_daemon.py)
+POLL_INTERVAL = 30.0
 POLL_TIMEOUT = 2.0
-
-_EDGE_LINE_RE = re.compile(r"^charmarr_relation_edge\{([^}]*)\} 1")
-_BOUND_LINE_RE = re.compile(r"^charmarr_relation_bound\{([^}]*)\} (\d+)")
-_LABEL_RE = re.compile(r'(\w+)="([^"]*)"')
-_REMOTE_PROXY_RE = re.compile(r"^remote-[0-9a-f]{32}$")
+# The whole fleet is polled concurrently and must answer within this
+POLL_DEADLINE = 5.0
+POLL_WORKERS = 8
 
 GRAFANA_DATASOURCE_TYPE = "hamedkarbasi93-nodegraphapi-datasource"
 
@@ -82,7 +84,11 @@ class CharmarrCrowsnestCharm(ops.CharmBase):
         )
         self._metrics_endpoint = MetricsEndpointProvider(
             self,
-            jobs=[self._topology.scrape_job],
+            jobs=[
+                self._topology.scrape_job,
+                # Fleet poll success/latency from the graph daemon
+                {"static_configs": [{"targets": [f"*:{GRAPH_PORT}"]}]},
+            ],
         )
         self._grafana_dashboards = GrafanaDashboardProvider(self)
         self._log_forwarder = LogForwarder(self, relation_name="logging")
@@ -156,233 +162,75 @@ class CharmarrCrowsnestCharm(ops.CharmBase):
         documents = [f.read_text().strip() for f in files]
         return "\n---\n".join(documents)
 
-    def _build_aggregate_graph(self) -> dict:
-        """Poll each fleet member's topology endpoint and aggregate.
+    def _fleet_members(self) -> list[dict[str, str]]:
+        """The crowsnest providers as graph daemon member entries.
 
         Fleet members are discovered dynamically via the `crowsnest`
         relation; each provider publishes its in-cluster topology URL plus
-        the publishing charm's app name and model name. Node identity in
-        the rendered graph is composite (model/app) so same-named apps in
-        different models (e.g. a local `plex` and a cross-model `plex`)
-        do not collide. Failures to reach any individual member are
-        logged and skipped - the graph reflects what's reachable now.
-
-        Edges from a polled member's metric file reference peers by their
-        bare juju-local name only. We resolve that name to a composite
-        node id by preferring a peer in the same model as the polling
-        member, falling back to any model that contains a node with that
-        name, and falling back again to a placeholder under the source's
-        own model so cross-model peers that don't publish to crowsnest
-        still show up in the graph.
-
-        Returns nodes + edges in the `nodegraph-api` plugin's expected
-        format.
+        the publishing charm's app name and model name. The member id is
+        composite (model/app) so same-named apps in different models do
+        not collide in the graph.
         """
-        edges_set: set[tuple[str, str, str, str]] = set()
-        bound_by_node: dict[str, dict[str, int]] = defaultdict(
-            lambda: {"bound": 0, "req_unbound": 0, "opt_unbound": 0}
-        )
-        missing_by_node: dict[str, dict[str, list[str]]] = defaultdict(
-            lambda: {"required": [], "optional": []}
-        )
-        reachable_nodes: set[str] = set()
-        # Display-side metadata for each composite node id: (app, model).
-        node_meta: dict[str, tuple[str, str]] = {}
-        # Reverse index of bare app name -> set of composite node ids,
-        # used when resolving edge endpoints.
-        ids_by_app: dict[str, set[str]] = defaultdict(set)
-
-        def _node_id(app: str, model: str) -> str:
-            return f"{model}/{app}" if model else app
-
-        members = self._fleet.get_providers()
-
-        with httpx.Client(timeout=POLL_TIMEOUT) as client:
-            for member in members:
-                url = member.topology_url
-                # Provider data carries app_name/model_name as of
-                # charmarr-lib-core 0.18; tolerate older providers (and
-                # older locked test fixtures) by reading via getattr and
-                # falling back to URL-parsing for app, leaving model blank.
-                # Single-model fleet behaves identically to before in that
-                # case.
-                member_app = (
-                    getattr(member, "app_name", "") or url.split("//", 1)[-1].split(".", 1)[0]
-                )
-                member_model = getattr(member, "model_name", "")
-                member_id = _node_id(member_app, member_model)
-
-                node_meta[member_id] = (member_app, member_model)
-                ids_by_app[member_app].add(member_id)
-
-                try:
-                    response = client.get(url)
-                    response.raise_for_status()
-                    payload = response.text
-                except httpx.HTTPError as e:
-                    logger.debug("topology poll for %s (%s) failed: %s", member_id, url, e)
-                    continue
-
-                reachable_nodes.add(member_id)
-                for line in payload.splitlines():
-                    if edge_match := _EDGE_LINE_RE.match(line):
-                        labels = dict(_LABEL_RE.findall(edge_match.group(1)))
-                        from_app = labels.get("from_app", "")
-                        to_app = labels.get("to_app", "")
-                        relation = labels.get("relation", "")
-                        if from_app and to_app and relation:
-                            # Defer endpoint resolution until every member's
-                            # metadata is collected; store the source model
-                            # alongside the raw labels.
-                            edges_set.add((member_model, from_app, relation, to_app))
-                    elif bound_match := _BOUND_LINE_RE.match(line):
-                        labels = dict(_LABEL_RE.findall(bound_match.group(1)))
-                        required = labels.get("required") == "true"
-                        bound = bound_match.group(2) == "1"
-                        relation_name = labels.get("relation", "")
-                        if bound:
-                            bound_by_node[member_id]["bound"] += 1
-                        elif required:
-                            bound_by_node[member_id]["req_unbound"] += 1
-                            missing_by_node[member_id]["required"].append(relation_name)
-                        else:
-                            bound_by_node[member_id]["opt_unbound"] += 1
-                            missing_by_node[member_id]["optional"].append(relation_name)
-
-        # Drop ghost edges from CMR'd peers that also speak crowsnest. A
-        # local charm sees its remote CMR peer as `remote-<32hex>` (Juju's
-        # SAAS proxy name) and emits topology edges with that name. If the
-        # peer publishes itself via crowsnest under its real name, both
-        # sides record the same logical relation - the local one gets
-        # synthesized into a ghost `remote-<hex>` node. Drop a
-        # `remote-<hex>` edge if any other edge in the set covers the same
-        # `(relation, other_endpoint)` pair from a non-remote side.
-        real_sources: dict[tuple[str, str], set[str]] = defaultdict(set)
-        real_targets: dict[tuple[str, str], set[str]] = defaultdict(set)
-        for _, from_app, relation, to_app in edges_set:
-            if not _REMOTE_PROXY_RE.match(from_app):
-                real_sources[(relation, to_app)].add(from_app)
-            if not _REMOTE_PROXY_RE.match(to_app):
-                real_targets[(relation, from_app)].add(to_app)
-
-        def _is_ghost_remote_edge(edge: tuple[str, str, str, str]) -> bool:
-            _, from_app, relation, to_app = edge
-            if _REMOTE_PROXY_RE.match(from_app) and real_sources[(relation, to_app)]:
-                return True
-            return bool(_REMOTE_PROXY_RE.match(to_app) and real_targets[(relation, from_app)])
-
-        edges_set = {e for e in edges_set if not _is_ghost_remote_edge(e)}
-
-        def _resolve(app: str, source_model: str) -> str:
-            """Map a bare app name from a metric file to a composite node id.
-
-            Prefer a same-model peer when one exists, otherwise any known
-            node with that app name, otherwise synthesize a placeholder id
-            attributed to the polling member's model so the edge still
-            renders.
-            """
-            candidates = ids_by_app.get(app, set())
-            same_model = _node_id(app, source_model)
-            if same_model in candidates:
-                return same_model
-            if candidates:
-                return next(iter(sorted(candidates)))
-            placeholder = _node_id(app, source_model)
-            node_meta.setdefault(placeholder, (app, source_model))
-            ids_by_app[app].add(placeholder)
-            return placeholder
-
-        resolved_edges: set[tuple[str, str, str]] = set()
-        for source_model, from_app, relation, to_app in edges_set:
-            resolved_edges.add(
-                (
-                    _resolve(from_app, source_model),
-                    relation,
-                    _resolve(to_app, source_model),
-                )
-            )
-
-        all_node_ids = set(node_meta) | {n for e in resolved_edges for n in (e[0], e[2])}
-        # Multi-model fleets benefit from a model hint under each node;
-        # single-model deployments don't, so keep the title blank when
-        # there's only one model in play.
-        distinct_models = {model for _, model in node_meta.values() if model}
-        show_model_title = len(distinct_models) > 1
-
-        # arc__* values must sum to 1 per Grafana node graph docs - raw
-        # counts cause the panel to silently drop all but the first arc.
-        # Three colors:
-        #   green  = required relations that are wired
-        #   red    = required relations declared but unbound (real breakage)
-        #   yellow = optional relations declared but unbound (informational)
-        def _arcs(node_id: str) -> tuple[float, float, float]:
-            if node_id not in reachable_nodes:
-                return (0.0, 1.0, 0.0)
-            counts = bound_by_node[node_id]
-            total = counts["bound"] + counts["req_unbound"] + counts["opt_unbound"]
-            if total == 0:
-                return (1.0, 0.0, 0.0)
-            return (
-                counts["bound"] / total,
-                counts["req_unbound"] / total,
-                counts["opt_unbound"] / total,
-            )
-
-        nodes = []
-        for node_id in sorted(all_node_ids):
-            app, model = node_meta.get(node_id, (node_id, ""))
-            bound_arc, missing_arc, optional_arc = _arcs(node_id)
-            req_missing = sorted(missing_by_node[node_id]["required"])
-            opt_missing = sorted(missing_by_node[node_id]["optional"])
-            if node_id in reachable_nodes:
-                title = model if show_model_title else ""
-            else:
-                title = "offline"
-            nodes.append(
-                {
-                    "id": node_id,
-                    "mainstat": app,
-                    "title": title,
-                    "arc__bound": bound_arc,
-                    "arc__missing": missing_arc,
-                    "arc__optional": optional_arc,
-                    "detail__model": model,
-                    "detail__missing_required": ", ".join(req_missing),
-                    "detail__missing_optional": ", ".join(opt_missing),
-                }
-            )
-
-        edges = [
+        members = []
+        for member in self._fleet.get_providers():
+            url = member.topology_url
+            # Provider data carries app_name/model_name as of
+            # charmarr-lib-core 0.18; tolerate older providers (and
+            # older locked test fixtures) by reading via getattr and
+            # falling back to URL-parsing for app, leaving model blank.
+            # Single-model fleet behaves identically to before in that
+            # case.
+            app = getattr(member, "app_name", "") or url.split("//", 1)[-1].split(".", 1)[0]
+            model = getattr(member, "model_name", "")
+            member_id = f"{model}/{app}" if model else app
+            members.append({"id": member_id, "app": app, "model": model, "url": url})
+        return members
+
+    def _write_members_file(self) -> None:
+        """Hand the graph daemon the fleet member list, only if it changed.
+
+        The daemon polls the members and aggregates the graph on its own;
+        it re-polls straight away when this file's mtime moves, so an
+        unchanged list must not be rewritten.
+        """
+        content = json.dumps(
             {
-                "id": f"{from_id}->{relation}->{to_id}",
-                "source": from_id,
-                "target": to_id,
-                "mainstat": relation,
-            }
-            for from_id, relation, to_id in sorted(resolved_edges)
-        ]
-
-        return {"nodes": nodes, "edges": edges}
-
-    def _write_graph_file(self) -> None:
-        try:
-            graph = self._build_aggregate_graph()
-        except Exception:
-            logger.exception("Failed to aggregate topology graph")
+                "interval": POLL_INTERVAL,
+                "timeout": POLL_TIMEOUT,
+                "deadline": POLL_DEADLINE,
+                "workers": POLL_WORKERS,
+                "members": self._fleet_members(),
+            },
+            sort_keys=True,
+        )
+        if self._read_if_exists(GRAPH_MEMBERS_FILE) == content:
             return
-        GRAPH_DATA_FILE.write_text(json.dumps(graph))
+        # Never let the daemon see a half-written member list
+        tmp = GRAPH_MEMBERS_FILE.with_suffix(".tmp")
+        tmp.write_text(content)
+        os.replace(tmp, GRAPH_MEMBERS_FILE)
 
     def _ensure_graph_daemon_running(self) -> None:
-        if self._pid_alive(self._read_graph_pid()):
-            return
-
-        GRAPH_SCRIPT_FILE.write_text(GRAPH_DAEMON_SCRIPT.read_text())
+        script = GRAPH_DAEMON_SCRIPT.read_text()
+        core = DAEMON_CORE_SCRIPT.read_text()
+        pid = self._read_graph_pid()
+        if self._pid_alive(pid):
+            if (
+                self._read_if_exists(GRAPH_SCRIPT_FILE) == script
+                and self._read_if_exists(DAEMON_CORE_FILE) == core
+            ):
+                return
+            # The charm was upgraded underneath a running daemon: replace it
+            self._stop_graph_daemon(pid)  # type: ignore[arg-type]
+
+        DAEMON_CORE_FILE.write_text(core)
+        GRAPH_SCRIPT_FILE.write_text(script)
 
         # `start_new_session=True` is LOAD-BEARING for the same reason as the
         # topology daemon - detaches the child from the charm hook's process
         # group so it survives hook exit. See charmarr_lib.core._topology.
         proc = subprocess.Popen(
-            [sys.executable, str(GRAPH_SCRIPT_FILE), str(GRAPH_PORT), str(GRAPH_DATA_FILE)],
+            [sys.executable, str(GRAPH_SCRIPT_FILE), str(GRAPH_PORT), str(GRAPH_MEMBERS_FILE)],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             stdin=subprocess.DEVNULL,
@@ -391,6 +239,20 @@ class CharmarrCrowsnestCharm(ops.CharmBase):
         GRAPH_PID_FILE.write_text(str(proc.pid))
         logger.info("Spawned charmarr-graph aggregator on port %d (pid=%d)", GRAPH_PORT, proc.pid)
 
+    def _stop_graph_daemon(self, pid: int) -> None:
+        os.kill(pid, signal.SIGTERM)
+        # Let it release the port before the replacement binds it
+        for _ in range(20):
+            if not self._pid_alive(pid):
+                return
+            time.sleep(0.1)
+
+    def _read_if_exists(self, path: Path) -> str | None:
+        try:
+            return path.read_text()
+        except FileNotFoundError:
+            return None
+
     def _read_graph_pid(self) -> int | None:
         try:
             return int(GRAPH_PID_FILE.read_text().strip())
@@ -438,7 +300,7 @@ class CharmarrCrowsnestCharm(ops.CharmBase):
     def _reconcile(self, _: ops.EventBase) -> None:
         """Refresh topology, graph aggregator, ingress, and SLO catalog."""
         self._topology.reconcile()
-        self._write_graph_file()
+        self._write_members_file()
         self._ensure_graph_daemon_running()
         # Both ports must appear on the K8s Service so consumers can reach
         # them via the Service VIP (otherwise the cluster IP returns 502
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Microbenchmark for the charm-spawned HTTP daemons.
+
+Starts the graph daemon on a free port against a synthetic fleet (every
+member served by one local topology endpoint), waits for the first
+aggregation, then hammers /api/graph/data from concurrent keep-alive
+clients and reports requests/sec and p50/p99 latency for plain, gzip and
+conditional (If-None-Match) requests.
+
+Usage:
+    python tests/benchmark/bench_daemon.py [--clients N] [--requests N] [--nodes N]
+
+Standard library only; not part of the unit suite.
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from _daemon_core import Payload, make_handler  # noqa: E402
+
+PATH = "/api/graph/data"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _topology(nodes: int) -> bytes:
+    lines = [
+        f'charmarr_relation_edge{{relation="r",from_app="app-{n}",to_app="app-{n + 1}"}} 1'
+        for n in range(nodes - 1)
+    ]
+    return "\n".join(lines).encode()
+
+
+def _serve_topology(nodes: int) -> int:
+    payload = Payload(_topology(nodes), "text/plain")
+    routes = {"/metrics": lambda: payload}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(routes))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_address[1]
+
+
+def _wait_ready(port: int) -> None:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", PATH)
+            if json.loads(conn.getresponse().read())["edges"]:
+                return
+        except OSError:
+            pass
+        time.sleep(0.05)
+    raise RuntimeError("graph daemon did not aggregate the fleet")
+
+
+def _client(port: int, requests: int, headers: dict, latencies: list[float]) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    for _ in range(requests):
+        start = time.perf_counter()
+        conn.request("GET", PATH, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def _run(port: int, clients: int, requests: int, headers: dict) -> tuple[float, float, float]:
+    per_client: list[list[float]] = [[] for _ in range(clients)]
+    threads = [
+        threading.Thread(target=_client, args=(port, requests, headers, latencies))
+        for latencies in per_client
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies = sorted(lat for client in per_client for lat in client)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return len(latencies) / elapsed, statistics.median(latencies) * 1000, p99 * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--nodes", type=int, default=200)
+    args = parser.parse_args()
+
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"http://127.0.0.1:{_serve_topology(args.nodes)}/metrics"
+        members = Path(tmp) / "members.json"
+        members.write_text(
+            json.dumps(
+                {
+                    "members": [
+                        {"id": f"app-{n}", "app": f"app-{n}", "url": url}
+                        for n in range(args.nodes)
+                    ]
+                }
+            )
+        )
+        proc = subprocess.Popen(
+            [sys.executable, str(SRC / "_graph_daemon.py"), str(port), str(members)],
+            cwd=SRC,
+        )
+        try:
+            _wait_ready(port)
+            conn = http.client.HTTPConnection("127.0.0.1", port)
+            conn.request("GET", PATH)
+            response = conn.getresponse()
+            etag = response.getheader("ETag") or ""
+            size = len(response.read())
+            conn.close()
+
+            print(f"{args.clients} clients x {args.requests} requests, {size} byte body")
+            print(f"{'mode':<12} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+            for mode, headers in (
+                ("plain", {}),
+                ("gzip", {"Accept-Encoding": "gzip"}),
+                ("conditional", {"Accept-Encoding": "gzip", "If-None-Match": etag}),
+            ):
+                rate, p50, p99 = _run(port, args.clients, args.requests, headers)
+                print(f"{mode:<12} {rate:>10.0f} {p50:>8.2f} {p99:>8.2f}")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the shared daemon HTTP core."""
+
+import gzip
+import http.client
+import os
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from _daemon_core import FilePayload, Payload, make_handler
+
+BODY = b'{"nodes": [], "edges": []}' * 40
+
+
+@pytest.fixture
+def server(tmp_path):
+    data = tmp_path / "graph.json"
+    data.write_bytes(BODY)
+    routes = {"/data": FilePayload(str(data), "application/json", b"{}")}
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(routes))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address[1], data
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(port: int, path: str = "/data", **headers: str) -> tuple[int, dict, bytes]:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    conn.request("GET", path, headers={k.replace("_", "-"): v for k, v in headers.items()})
+    response = conn.getresponse()
+    result = response.status, dict(response.getheaders()), response.read()
+    conn.close()
+    return result
+
+
+def test_gzip_only_when_accepted(server):
+    port, _ = server
+
+    status, headers, body = _get(port, Accept_Encoding="gzip, deflate")
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == BODY
+
+    _, headers, body = _get(port, Accept_Encoding="gzip;q=0")
+    assert "Content-Encoding" not in headers
+    assert body == BODY
+
+
+def test_matching_etag_is_not_modified(server):
+    port, _ = server
+    _, headers, _ = _get(port)
+
+    status, _, body = _get(port, If_None_Match=headers["ETag"])
+    assert status == 304
+    assert body == b""
+    assert _get(port, If_None_Match='"stale"')[0] == 200
+
+
+def test_file_payload_reloads_on_change(server):
+    port, data = server
+    etag = _get(port)[1]["ETag"]
+
+    data.write_bytes(b'{"nodes": ["new"]}')
+    os.utime(data, ns=(0, 10**9))
+    status, headers, body = _get(port, If_None_Match=etag)
+    assert status == 200
+    assert body == b'{"nodes": ["new"]}'
+    assert headers["ETag"] != etag
+
+
+def test_missing_file_serves_default(tmp_path):
+    route = FilePayload(str(tmp_path / "missing.json"), "application/json", b"{}")
+    assert route().body == b"{}"
+    # Too small to be worth compressing
+    assert Payload(b"{}", "application/json").gzipped is None
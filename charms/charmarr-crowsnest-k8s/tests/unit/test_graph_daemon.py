@@ -0,0 +1,156 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the graph daemon's fleet polling and aggregation."""
+
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+import _graph_daemon
+from _daemon_core import Payload, make_handler
+from _graph_daemon import Fleet, Member, build_graph, fetch
+
+SAMPLE_METRICS = b"""\
+# HELP charmarr_relation_bound x
+# TYPE charmarr_relation_bound gauge
+charmarr_relation_bound{relation="download-client",role="requires",required="true"} 1
+charmarr_relation_bound{relation="vpn-gateway",role="requires",required="false"} 0
+# HELP charmarr_relation_edge x
+# TYPE charmarr_relation_edge gauge
+charmarr_relation_edge{relation="download-client",from_app="radarr",to_app="qbittorrent"} 1
+charmarr_relation_edge{relation="media-storage",from_app="radarr",to_app="storage"} 1
+"""
+
+
+def _member(app: str, model: str = "", body: bytes | None = None) -> Member:
+    member_id = f"{model}/{app}" if model else app
+    member = Member({"id": member_id, "app": app, "model": model, "url": f"http://{app}"})
+    if body is not None:
+        member.apply((body, {}), 0.1)
+    return member
+
+
+def test_graph_builds_nodes_and_edges():
+    """Reachable members' expositions translate into nodes + edges."""
+    graph = build_graph(
+        [
+            _member("radarr", body=SAMPLE_METRICS),
+            _member("qbittorrent", body=b""),
+            _member("storage", body=b""),
+        ]
+    )
+
+    edge_keys = {(e["source"], e["mainstat"], e["target"]) for e in graph["edges"]}
+    assert edge_keys == {
+        ("radarr", "download-client", "qbittorrent"),
+        ("radarr", "media-storage", "storage"),
+    }
+    radarr = next(n for n in graph["nodes"] if n["id"] == "radarr")
+    assert (radarr["arc__bound"], radarr["arc__optional"]) == (0.5, 0.5)
+    assert radarr["detail__missing_optional"] == "vpn-gateway"
+
+
+def test_unreachable_members_are_offline_nodes():
+    graph = build_graph([_member("radarr"), _member("qbittorrent")])
+
+    assert graph["edges"] == []
+    titles = {n["mainstat"]: n["title"] for n in graph["nodes"]}
+    assert titles == {"radarr": "offline", "qbittorrent": "offline"}
+    for node in graph["nodes"]:
+        assert (node["arc__bound"], node["arc__missing"], node["arc__optional"]) == (0, 1, 0)
+
+
+def test_cmr_ghost_node_is_dropped():
+    """A CMR'd peer that also publishes crowsnest does not produce a ghost.
+
+    Local arrs see their CMR peer as `remote-<32hex>` (Juju SAAS proxy
+    name); the peer's own topology publishes the same relation under its
+    real app name, so the `remote-<hex>` edge must be dropped.
+    """
+    radarr = (
+        b'charmarr_relation_edge{relation="media-manager",'
+        b'from_app="remote-544ffced2a034c8e8f43edda783ffa53",to_app="radarr-anime"} 1\n'
+    )
+    seerr = (
+        b'charmarr_relation_edge{relation="media-manager",'
+        b'from_app="seerr",to_app="radarr-anime"} 1\n'
+    )
+    graph = build_graph(
+        [
+            _member("radarr-anime", "charmarr", radarr),
+            _member("seerr", "charmarr-pietro", seerr),
+        ]
+    )
+
+    assert not any("remote-" in n["id"] for n in graph["nodes"])
+    assert [(e["source"], e["target"]) for e in graph["edges"]] == [
+        ("charmarr-pietro/seerr", "charmarr/radarr-anime")
+    ]
+
+
+def test_unchanged_topology_does_not_rebuild():
+    member = _member("radarr", body=SAMPLE_METRICS)
+
+    assert member.apply((SAMPLE_METRICS, {}), 0.1) is False
+    assert member.apply((None, {"etag": '"a"'}), 0.1) is False
+    assert member.apply(None, 2.0) is True
+    assert member.topology is None
+    assert member.apply((SAMPLE_METRICS, {}), 0.1) is True
+
+
+@pytest.fixture
+def topology_server():
+    payload = {"current": Payload(SAMPLE_METRICS, "text/plain")}
+    httpd = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler({"/metrics": lambda: payload["current"]})
+    )
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/metrics", payload
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_conditional_fetch(topology_server):
+    url, payload = topology_server
+
+    body, validators = fetch(url, 2, {})
+    assert body == SAMPLE_METRICS
+    assert fetch(url, 2, validators) == (None, validators)
+
+    payload["current"] = Payload(b"", "text/plain")
+    assert fetch(url, 2, validators)[0] == b""
+
+
+def test_poll_round_is_bounded_by_deadline(tmp_path):
+    """A hung member costs at most the deadline and is recorded as offline."""
+    release = threading.Event()
+
+    def _fetch(url: str, timeout: float, validators: dict) -> tuple[bytes, dict]:
+        if "hung" in url:
+            release.wait(5)
+        return SAMPLE_METRICS, {}
+
+    members_file = tmp_path / "members.json"
+    specs = [{"id": app, "app": app, "url": f"http://{app}"} for app in ("radarr", "hung")]
+    members_file.write_text(json.dumps({"deadline": 0.3, "members": specs}))
+    fleet = Fleet(str(members_file))
+    assert fleet.reload_if_changed()
+
+    with patch.object(_graph_daemon, "fetch", side_effect=_fetch):
+        start = time.monotonic()
+        assert fleet.poll() is True
+        elapsed = time.monotonic() - start
+        release.set()
+    fleet.rebuild(graph=True)
+
+    assert elapsed < 2
+    titles = {n["id"]: n["title"] for n in json.loads(fleet.graph_payload.body)["nodes"]}
+    assert (titles["hung"], titles["radarr"]) == ("offline", "")
+    metrics = fleet.metrics_payload.body.decode()
+    assert 'charmarr_crowsnest_member_poll_success{member="hung"} 0.0' in metrics
+    assert 'charmarr_crowsnest_member_poll_success{member="radarr"} 1.0' in metrics
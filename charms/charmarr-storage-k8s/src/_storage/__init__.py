@@ -2,10 +2,19 @@
 
 from ._common import create_static_pvc, get_pv, get_pvc, log_static_pv_size_mismatch
 from ._hostpath import create_hostpath_pv, reconcile_existing_hostpath_pv
+from ._k8s_cache import K8sReadCache, build_k8s_api_counters
 from ._native_nfs import create_nfs_pv, reconcile_existing_nfs_pv
+from ._permissions import PermissionCheckCache, permission_check_fingerprint
+from ._profiler import ReconcileProfiler
+from ._publish import RelationPublisher
 from ._quantity import parse_quantity_to_bytes
 
 __all__ = [
+    "K8sReadCache",
+    "PermissionCheckCache",
+    "ReconcileProfiler",
+    "RelationPublisher",
+    "build_k8s_api_counters",
     "create_hostpath_pv",
     "create_nfs_pv",
     "create_static_pvc",
@@ -13,6 +22,7 @@ __all__ = [
     "get_pvc",
     "log_static_pv_size_mismatch",
     "parse_quantity_to_bytes",
+    "permission_check_fingerprint",
     "reconcile_existing_hostpath_pv",
     "reconcile_existing_nfs_pv",
 ]
@@ -0,0 +1,143 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Dispatch-scoped read-through cache in front of K8sResourceManager.
+
+A single hook reads the same objects over and over - the storage charm
+looks its PVC up for backend detection, phase checks, status and the
+metrics exposition. K8sReadCache serves repeated get()/exists() of the
+resource kinds it was told to cache from memory for the rest of the
+dispatch (404s included), drops a kind whenever we write to it, and counts
+every request that actually reaches the API server so the totals can be
+exported next to the topology metrics.
+
+Only kinds whose state the charm owns should be cached: anything polled
+for progress within a hook (Jobs) must keep going to the API server.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from lightkube import ApiError
+from lightkube.core.client import Client
+from lightkube.types import CascadeType, PatchType
+
+from charmarr_lib.core import K8sResourceManager, MetricFamily, MetricSample
+
+
+class K8sReadCache(K8sResourceManager):
+    """K8sResourceManager that dedupes reads within one dispatch.
+
+    Wraps the manager that talks to the API server, so it can be handed to
+    anything that takes a K8sResourceManager.
+
+    Attributes:
+        requests: API requests sent during this dispatch, by verb.
+        hits: Reads served from the cache during this dispatch.
+    """
+
+    def __init__(self, manager: K8sResourceManager, cacheable: Iterable[type]) -> None:
+        # No super().__init__(): every call goes through the wrapped manager
+        self._manager = manager
+        self._cacheable = frozenset(cacheable)
+        self._objects: dict[tuple[Any, ...], Any] = {}
+        self.requests: Counter[str] = Counter()
+        self.hits = 0
+
+    @property
+    def client(self) -> Client:
+        """The wrapped manager's lightkube client; calls on it bypass the cache."""
+        return self._manager.client
+
+    def get(self, resource_type: type[Any], name: str, namespace: str | None = None) -> Any:
+        """Cached equivalent of K8sResourceManager.get()."""
+        key = (resource_type, name, namespace)
+        cacheable = resource_type in self._cacheable
+        if cacheable and key in self._objects:
+            self.hits += 1
+            cached = self._objects[key]
+            if isinstance(cached, ApiError):
+                raise cached
+            return cached
+        self.requests["get"] += 1
+        try:
+            result = self._manager.get(resource_type, name, namespace)
+        except ApiError as e:
+            if cacheable and e.status.code == 404:
+                self._objects[key] = e
+            raise
+        if cacheable:
+            self._objects[key] = result
+        return result
+
+    def exists(self, resource_type: type[Any], name: str, namespace: str | None = None) -> bool:
+        """Cached equivalent of K8sResourceManager.exists()."""
+        try:
+            self.get(resource_type, name, namespace)
+        except ApiError as e:
+            if e.status.code == 404:
+                return False
+            raise
+        return True
+
+    def patch(
+        self,
+        resource_type: type[Any],
+        name: str,
+        obj: dict[str, Any] | Any,
+        namespace: str | None = None,
+        patch_type: PatchType = PatchType.STRATEGIC,
+    ) -> Any:
+        """K8sResourceManager.patch(), dropping cached reads of the kind."""
+        self._write("patch", resource_type)
+        return self._manager.patch(resource_type, name, obj, namespace, patch_type)
+
+    def apply(self, resource: Any, force: bool = False) -> Any:
+        """K8sResourceManager.apply(), dropping cached reads of the kind."""
+        self._write("apply", type(resource))
+        return self._manager.apply(resource, force=force)
+
+    def delete(
+        self,
+        resource_type: type[Any],
+        name: str,
+        namespace: str | None = None,
+        cascade: CascadeType = CascadeType.BACKGROUND,
+    ) -> bool:
+        """K8sResourceManager.delete(), dropping cached reads of the kind."""
+        self._write("delete", resource_type)
+        return self._manager.delete(resource_type, name, namespace, cascade)
+
+    def invalidate(self, resource_type: type[Any] | None = None) -> None:
+        """Forget cached reads of one resource kind, or of every kind."""
+        if resource_type is None:
+            self._objects.clear()
+            return
+        for key in [k for k in self._objects if k[0] is resource_type]:
+            del self._objects[key]
+
+    def _write(self, verb: str, resource_type: type[Any]) -> None:
+        self.invalidate(resource_type)
+        self.requests[verb] += 1
+
+
+def build_k8s_api_counters(requests: Mapping[str, int], hits: int) -> list[MetricFamily]:
+    """Build the cumulative Kubernetes API counters for the topology exposition."""
+    return [
+        MetricFamily(
+            name="charmarr_k8s_api_requests_total",
+            type="counter",
+            help="Kubernetes API requests sent by the charm across hooks, by verb.",
+            samples=[
+                MetricSample(labels={"verb": verb}, value=float(count))
+                for verb, count in sorted(requests.items())
+            ],
+        ),
+        MetricFamily(
+            name="charmarr_k8s_cache_hits_total",
+            type="counter",
+            help="Kubernetes reads served from the dispatch-scoped cache across hooks.",
+            samples=[MetricSample(value=float(hits))],
+        ),
+    ]
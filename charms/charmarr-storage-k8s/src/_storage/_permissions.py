@@ -0,0 +1,74 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Remembered storage permission check results.
+
+check_storage_permissions() proves write access by running a Job that
+mounts the shared PVC as puid:pgid. Re-running it on every leader hook
+only reconfirms what we already know, at the cost of a pod per hook.
+PermissionCheckCache keeps the last completed result in StoredState,
+keyed by everything that could change the answer - the PVC's UID, the PV
+it is bound to, puid, pgid, mount path and backend - and hands it back
+until one of those moves or the result is older than its revalidation
+interval. Failures are revalidated sooner than passes so that fixing
+ownership on the NFS export or host path is picked up without a config
+change.
+"""
+
+import hashlib
+import logging
+import time
+
+import ops
+from lightkube.resources.core_v1 import PersistentVolumeClaim
+
+logger = logging.getLogger(__name__)
+
+PASSED_REVALIDATE_SECONDS = 24 * 60 * 60
+FAILED_REVALIDATE_SECONDS = 5 * 60
+
+
+def permission_check_fingerprint(
+    pvc: PersistentVolumeClaim, *, puid: int, pgid: int, mount_path: str, backend: str
+) -> str:
+    """Digest of the inputs a permission check result depends on."""
+    uid = pvc.metadata.uid if pvc.metadata else None
+    volume = pvc.spec.volumeName if pvc.spec else None
+    material = f"{uid}|{volume}|{puid}|{pgid}|{mount_path}|{backend}"
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class PermissionCheckCache(ops.Object):
+    """Last completed permission check result, valid for one fingerprint."""
+
+    _stored = ops.StoredState()
+
+    def __init__(self, charm: ops.CharmBase) -> None:
+        super().__init__(charm, "permission-check-cache")
+        self._stored.set_default(fingerprint="", passed=False, message="", checked_at=0.0)
+        charm.framework.observe(charm.on.upgrade_charm, self._on_upgrade_charm)
+
+    def _on_upgrade_charm(self, _: ops.UpgradeCharmEvent) -> None:
+        # A new charm lib may check differently; don't trust the old answer
+        self.reset()
+
+    def lookup(self, fingerprint: str) -> tuple[bool, str] | None:
+        """(passed, message) of the last check for fingerprint, if still fresh."""
+        if not self._stored.fingerprint or self._stored.fingerprint != fingerprint:
+            return None
+        max_age = PASSED_REVALIDATE_SECONDS if self._stored.passed else FAILED_REVALIDATE_SECONDS
+        if time.time() - self._stored.checked_at >= max_age:
+            logger.info("Permission check result expired, revalidating")
+            return None
+        return self._stored.passed, self._stored.message
+
+    def record(self, fingerprint: str, passed: bool, message: str = "") -> None:
+        """Remember a completed check result for fingerprint."""
+        self._stored.fingerprint = fingerprint
+        self._stored.passed = passed
+        self._stored.message = message
+        self._stored.checked_at = time.time()
+
+    def reset(self) -> None:
+        """Forget the last result so the next reconcile checks again."""
+        self._stored.fingerprint = ""
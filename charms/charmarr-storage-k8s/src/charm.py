@@ -5,6 +5,7 @@
 """Charmarr Storage Charm - workload-less charm for shared PVC management."""
 
 import logging
+from collections import Counter
 from enum import StrEnum
 
 import ops
@@ -23,6 +24,11 @@ from lightkube.models.meta_v1 import ObjectMeta
 from lightkube.resources.core_v1 import PersistentVolume, PersistentVolumeClaim
 
 from _storage import (
+    K8sReadCache,
+    PermissionCheckCache,
+    ReconcileProfiler,
+    RelationPublisher,
+    build_k8s_api_counters,
     create_hostpath_pv,
     create_nfs_pv,
     create_static_pvc,
@@ -30,6 +36,7 @@ from _storage import (
     get_pvc,
     log_static_pv_size_mismatch,
     parse_quantity_to_bytes,
+    permission_check_fingerprint,
     reconcile_existing_hostpath_pv,
     reconcile_existing_nfs_pv,
 )
@@ -76,12 +83,17 @@ class CharmarrStorageCharm(ops.CharmBase):
     _pvc_name = "charmarr-shared-media"
     _pv_name = "charmarr-shared-media-pv"
     _mount_path = "/data"
+    _stored = ops.StoredState()
 
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._stored.set_default(k8s_api_requests={}, k8s_cache_hits=0)
+        self._profiler = ReconcileProfiler(self)
+        self._publisher = RelationPublisher(self)
+        self._permission_cache = PermissionCheckCache(self)
         self._storage_provider = MediaStorageProvider(self, "media-storage")
         self._crowsnest = CrowsnestProvider(self, "crowsnest")
-        self._k8s: K8sResourceManager | None = None
+        self._k8s: K8sReadCache | None = None
         self._cached_pvc_backend: BackendType | None = None
         self._resize_error: str | None = None
         self._permission_error: str | None = None
@@ -118,14 +130,35 @@ class CharmarrStorageCharm(ops.CharmBase):
         observe_events(self, reconcilable_events_k8s_workloadless, self._reconcile)
         framework.observe(self.on.collect_unit_status, self._on_collect_unit_status)
         framework.observe(self.on.remove, self._on_remove)
+        framework.observe(framework.on.pre_commit, self._on_pre_commit)
 
     @property
     def k8s(self) -> K8sResourceManager:
-        """Lazily initialize K8s resource manager."""
+        """Lazily initialize K8s resource manager behind a dispatch-scoped read cache."""
         if self._k8s is None:
-            self._k8s = K8sResourceManager()
+            self._k8s = K8sReadCache(
+                K8sResourceManager(), cacheable=(PersistentVolume, PersistentVolumeClaim)
+            )
         return self._k8s
 
+    def _on_pre_commit(self, _: ops.EventBase) -> None:
+        """Persist this dispatch's Kubernetes API counters."""
+        if self._k8s is None:
+            return
+        requests = self._stored.k8s_api_requests
+        for verb, count in self._k8s.requests.items():
+            requests[verb] = requests.get(verb, 0) + count
+        self._stored.k8s_cache_hits += self._k8s.hits
+
+    def _build_k8s_api_counters(self) -> list[MetricFamily]:
+        """Cumulative Kubernetes API counters, including this dispatch so far."""
+        requests = Counter(dict(self._stored.k8s_api_requests))
+        hits = self._stored.k8s_cache_hits
+        if self._k8s is not None:
+            requests.update(self._k8s.requests)
+            hits += self._k8s.hits
+        return build_k8s_api_counters(requests, hits)
+
     def _detect_pvc_backend(self) -> BackendType | None:
         """Detect which backend type created the existing PVC.
 
@@ -187,6 +220,8 @@ class CharmarrStorageCharm(ops.CharmBase):
         bind state and permission-check state are not derivable from
         kube-state-metrics in a way that ties back to this charm, so we
         publish them here. PVC capacity/usage lives in cAdvisor + KSM.
+        Kubernetes API counters and the reconcile step timings from
+        ReconcileProfiler are appended last.
         """
         backend = str(self.config.get("backend-type") or "unknown")
 
@@ -247,22 +282,27 @@ class CharmarrStorageCharm(ops.CharmBase):
                     samples=capacity_samples,
                 )
             )
+        families.extend(self._build_k8s_api_counters())
+        families.extend(self._profiler.build_metrics())
         return families
 
     def _reconcile(self, event: ops.EventBase) -> None:
         """Reconcile desired state with actual K8s state."""
-        self._topology.reconcile()
+        with self._profiler.step("topology"):
+            self._topology.reconcile()
         self.unit.set_ports(self._topology.port)
         # The topology endpoint is a cluster-internal concern - crowsnest polls
         # it from inside the same K8s cluster. Hardcode the in-cluster Service
         # FQDN; never expose this URL externally.
-        self._crowsnest.publish_data(
+        self._publisher.publish(
+            "crowsnest",
             CrowsnestProviderData(
                 topology_url=(
                     f"http://{self.app.name}.{self.model.name}"
                     f".svc.cluster.local:{self._topology.port}/metrics"
                 )
-            )
+            ),
+            self._crowsnest.publish_data,
         )
 
         if not self.unit.is_leader():
@@ -276,33 +316,52 @@ class CharmarrStorageCharm(ops.CharmBase):
             return
 
         backend_type = self.config.get("backend-type")
-        if backend_type == BackendType.STORAGE_CLASS.value:
-            self._reconcile_storage_class_pvc()
-        elif backend_type == BackendType.NATIVE_NFS.value:
-            self._reconcile_native_nfs()
-        elif backend_type == BackendType.HOSTPATH.value:
-            self._reconcile_hostpath()
-
-        if not self._run_permission_check():
+        with self._profiler.step("volume"):
+            if backend_type == BackendType.STORAGE_CLASS.value:
+                self._reconcile_storage_class_pvc()
+            elif backend_type == BackendType.NATIVE_NFS.value:
+                self._reconcile_native_nfs()
+            elif backend_type == BackendType.HOSTPATH.value:
+                self._reconcile_hostpath()
+
+        with self._profiler.step("permission-check"):
+            permitted = self._run_permission_check()
+        if not permitted:
             return
 
-        self._publish_relation_data()
+        with self._profiler.step("publish"):
+            self._publish_relation_data()
 
     def _run_permission_check(self) -> bool:
         """Run permission check when PVC exists.
 
         For WaitForFirstConsumer storage classes, the permission check Job
-        will be the first consumer that triggers PVC binding.
+        will be the first consumer that triggers PVC binding. A completed
+        result is remembered against the PVC, puid/pgid and backend, so the
+        Job only runs again when one of those changes or the result expires.
 
         Returns:
             True if check passed, False if pending or failed.
         """
-        pvc_phase = self._get_pvc_phase()
-        if pvc_phase is None:
+        pvc = get_pvc(self.k8s, self._pvc_name, self.model.name)
+        if pvc is None or pvc.status is None:
             return False
 
         puid = int(self.config.get("puid", 1000))
         pgid = int(self.config.get("pgid", 1000))
+        fingerprint = permission_check_fingerprint(
+            pvc,
+            puid=puid,
+            pgid=pgid,
+            mount_path=self._mount_path,
+            backend=str(self.config.get("backend-type")),
+        )
+
+        cached = self._permission_cache.lookup(fingerprint)
+        if cached is not None:
+            passed, message = cached
+            logger.debug("Using cached permission check result")
+            return self._set_permission_result(passed, message)
 
         try:
             result = check_storage_permissions(
@@ -314,27 +373,35 @@ class CharmarrStorageCharm(ops.CharmBase):
                 mount_path=self._mount_path,
             )
         except Exception:
-            self._permission_error = "Permission check failed. Bad storage backend"
-            self._permission_check_pending = False
-            self._storage_provider.clear_data()
+            self._permission_cache.reset()
+            self._set_permission_result(False, "Permission check failed. Bad storage backend")
             logger.error("Permission check error: %s", self._permission_error)
             return False
 
-        if result.status == PermissionCheckStatus.FAILED:
-            self._permission_error = result.message
-            self._permission_check_pending = False
-            self._storage_provider.clear_data()
-            logger.error("Permission check failed: %s", result.message)
+        if result.status == PermissionCheckStatus.PENDING:
+            # Don't publish yet, wait for check to complete
+            self._permission_check_pending = True
+            logger.info("Permission check in progress")
             return False
-        elif result.status == PermissionCheckStatus.PASSED:
-            self._permission_error = None
-            self._permission_check_pending = False
+
+        passed = result.status == PermissionCheckStatus.PASSED
+        self._permission_cache.record(fingerprint, passed, result.message or "")
+        # The result is remembered, so the finished Job has nothing left to tell us
+        delete_permission_check_job(self.k8s, self.model.name, self._pvc_name)
+        if passed:
             logger.info("Permission check passed")
-            return True
+        else:
+            logger.error("Permission check failed: %s", result.message)
+        return self._set_permission_result(passed, result.message or "")
 
-        # PENDING - don't publish yet, wait for check to complete
-        self._permission_check_pending = True
-        logger.info("Permission check in progress")
+    def _set_permission_result(self, passed: bool, message: str) -> bool:
+        """Record a completed permission check outcome for status and metrics."""
+        self._permission_check_pending = False
+        if passed:
+            self._permission_error = None
+            return True
+        self._permission_error = message
+        self._publisher.clear("media-storage", self._storage_provider.clear_data)
         return False
 
     def _is_config_valid(self) -> bool:
@@ -484,7 +551,7 @@ class CharmarrStorageCharm(ops.CharmBase):
             puid=puid,
             pgid=pgid,
         )
-        self._storage_provider.publish_data(data)
+        self._publisher.publish("media-storage", data, self._storage_provider.publish_data)
 
     def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
         """Collect unit statuses from all components."""
@@ -0,0 +1,84 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the dispatch-scoped Kubernetes read cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from conftest import make_api_error_404, make_pvc
+from lightkube import ApiError
+from lightkube.resources.batch_v1 import Job
+from lightkube.resources.core_v1 import PersistentVolumeClaim
+
+from _storage import K8sReadCache, build_k8s_api_counters
+
+
+def _cache() -> tuple[K8sReadCache, MagicMock]:
+    manager = MagicMock()
+    manager.get.return_value = make_pvc(phase="Bound")
+    return K8sReadCache(manager, cacheable=(PersistentVolumeClaim,)), manager
+
+
+def test_repeated_reads_hit_the_cache():
+    cache, manager = _cache()
+
+    for _ in range(3):
+        cache.get(PersistentVolumeClaim, "charmarr-shared-media", "test-model")
+
+    manager.get.assert_called_once()
+    assert cache.requests == {"get": 1}
+    assert cache.hits == 2
+
+
+def test_write_invalidates_the_kind():
+    cache, manager = _cache()
+    pvc = cache.get(PersistentVolumeClaim, "charmarr-shared-media", "test-model")
+
+    cache.apply(pvc, force=True)
+    cache.get(PersistentVolumeClaim, "charmarr-shared-media", "test-model")
+
+    manager.apply.assert_called_once_with(pvc, force=True)
+    assert manager.get.call_count == 2
+    assert cache.requests == {"get": 2, "apply": 1}
+
+
+def test_not_found_is_cached():
+    cache, manager = _cache()
+    manager.get.side_effect = make_api_error_404()
+
+    for _ in range(2):
+        with pytest.raises(ApiError):
+            cache.get(PersistentVolumeClaim, "charmarr-shared-media", "test-model")
+
+    manager.get.assert_called_once()
+
+
+def test_exists_is_served_from_the_cache():
+    cache, manager = _cache()
+    manager.get.side_effect = make_api_error_404()
+
+    assert not cache.exists(PersistentVolumeClaim, "charmarr-shared-media", "test-model")
+    assert not cache.exists(PersistentVolumeClaim, "charmarr-shared-media", "test-model")
+    manager.get.assert_called_once()
+    manager.exists.assert_not_called()
+
+
+def test_uncached_kinds_always_reach_the_api():
+    cache, manager = _cache()
+    cache.get(Job, "charmarr-permission-check", "test-model")
+    cache.get(Job, "charmarr-permission-check", "test-model")
+
+    assert manager.get.call_count == 2
+    assert cache.hits == 0
+
+
+def test_counters():
+    families = build_k8s_api_counters({"patch": 1, "get": 3}, hits=5)
+
+    requests, hits = families
+    assert requests.name == "charmarr_k8s_api_requests_total"
+    by_verb = {s.labels["verb"]: s.value for s in requests.samples}
+    assert by_verb == {"get": 3.0, "patch": 1.0}
+    assert hits.samples[0].value == 5.0
+    assert requests.type == hits.type == "counter"
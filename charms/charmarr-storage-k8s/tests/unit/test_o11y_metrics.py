@@ -12,7 +12,7 @@ def _gauges_by_name(families):
 
 
 def test_gauges_when_no_pvc(ctx, mock_k8s):
-    """No PVC exists yet: 3 gauges, no capacity series."""
+    """No PVC exists yet: 3 gauges plus the API counters, no capacity series."""
     mock_k8s.get.side_effect = make_api_error_404()
 
     state = State(
@@ -28,6 +28,8 @@ def test_gauges_when_no_pvc(ctx, mock_k8s):
         "charmarr_storage_consumers_total",
         "charmarr_storage_pvc_bound",
         "charmarr_storage_permission_check_ok",
+        "charmarr_k8s_api_requests_total",
+        "charmarr_k8s_cache_hits_total",
     }
     assert by_name["charmarr_storage_pvc_bound"].samples[0].value == 0.0
     assert by_name["charmarr_storage_pvc_bound"].samples[0].labels["backend"] == "storage-class"
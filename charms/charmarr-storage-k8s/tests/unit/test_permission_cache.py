@@ -0,0 +1,88 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for remembering storage permission check results."""
+
+import dataclasses
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import ops
+from conftest import make_pvc
+from lightkube.resources.batch_v1 import Job
+from ops.testing import Relation, State
+
+from _storage._permissions import PASSED_REVALIDATE_SECONDS
+from charmarr_lib.core import PermissionCheckStatus
+
+CONFIG = {"backend-type": "storage-class", "storage-class": "local-path"}
+
+
+def _job_reads(mock_k8s) -> int:
+    return sum(1 for c in mock_k8s.get.call_args_list if c.args[0] is Job)
+
+
+def test_passed_result_is_reused(ctx, mock_k8s):
+    """A passed check is not repeated, and its Job is cleaned up right away."""
+    mock_k8s._custom_get_return = make_pvc("Bound")
+
+    state = ctx.run(ctx.on.config_changed(), State(leader=True, config=CONFIG))
+    job_reads = _job_reads(mock_k8s)
+    assert job_reads > 0
+    assert any(c.args[0] is Job for c in mock_k8s.delete.call_args_list)
+    mock_k8s.delete.reset_mock()
+
+    state = ctx.run(ctx.on.update_status(), state)
+
+    assert _job_reads(mock_k8s) == job_reads
+    mock_k8s.delete.assert_not_called()
+    assert state.unit_status == ops.ActiveStatus()
+
+
+def test_rechecks_when_ownership_changes(ctx, mock_k8s):
+    mock_k8s._custom_get_return = make_pvc("Bound")
+
+    state = ctx.run(ctx.on.config_changed(), State(leader=True, config=CONFIG))
+    job_reads = _job_reads(mock_k8s)
+
+    ctx.run(ctx.on.config_changed(), dataclasses.replace(state, config={**CONFIG, "puid": 1001}))
+
+    assert _job_reads(mock_k8s) > job_reads
+
+
+def test_rechecks_when_result_expires(ctx, mock_k8s):
+    mock_k8s._custom_get_return = make_pvc("Bound")
+
+    state = ctx.run(ctx.on.config_changed(), State(leader=True, config=CONFIG))
+    job_reads = _job_reads(mock_k8s)
+
+    later = time.time() + PASSED_REVALIDATE_SECONDS + 1
+    with patch("_storage._permissions.time.time", return_value=later):
+        ctx.run(ctx.on.update_status(), state)
+
+    assert _job_reads(mock_k8s) > job_reads
+
+
+def test_media_storage_republished_after_failure_recovers(ctx, mock_k8s):
+    """Clearing the databag on failure must not leave a stale publish digest."""
+    mock_k8s._custom_get_return = make_pvc("Bound")
+    relation = Relation(endpoint="media-storage", interface="media-storage")
+    state = State(leader=True, config=CONFIG, relations=[relation])
+    results = [
+        SimpleNamespace(status=status, message="")
+        for status in (
+            PermissionCheckStatus.PASSED,
+            PermissionCheckStatus.FAILED,
+            PermissionCheckStatus.PASSED,
+        )
+    ]
+    now = time.time()
+
+    with patch("charm.check_storage_permissions", side_effect=results):
+        for step in range(3):
+            later = now + step * (PASSED_REVALIDATE_SECONDS + 1)
+            with patch("_storage._permissions.time.time", return_value=later):
+                state = ctx.run(ctx.on.update_status(), state)
+            published = state.get_relation(relation.id).local_app_data
+            assert bool(published) == (step != 1)
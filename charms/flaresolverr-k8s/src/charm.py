@@ -19,6 +19,8 @@ from charms.istio_beacon_k8s.v0.service_mesh import (
 from charms.loki_k8s.v1.loki_push_api import LogForwarder
 from charms.prometheus_k8s.v0.prometheus_scrape import MetricsEndpointProvider
 
+from _pebble import reconcile_layer
+from _publish import RelationPublisher
 from charmarr_lib.core import (
     CharmarrTopology,
     CharmarrTopologyRelation,
@@ -45,7 +47,9 @@ class FlareSolverrCharm(ops.CharmBase):
 
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._publisher = RelationPublisher(self)
         self._container = self.unit.get_container(CONTAINER_NAME)
+        self._workload_ready: bool | None = None
 
         self._topology = CharmarrTopology(
             self,
@@ -104,13 +108,15 @@ class FlareSolverrCharm(ops.CharmBase):
         # The topology endpoint is a cluster-internal concern - crowsnest polls
         # it from inside the same K8s cluster. Hardcode the in-cluster Service
         # FQDN; never expose this URL externally.
-        self._crowsnest.publish_data(
+        self._publisher.publish(
+            "crowsnest",
             CrowsnestProviderData(
                 topology_url=(
                     f"http://{self.app.name}.{self.model.name}"
                     f".svc.cluster.local:{self._topology.port}/metrics"
                 )
-            )
+            ),
+            self._crowsnest.publish_data,
         )
 
         if not self._container.can_connect():
@@ -119,7 +125,7 @@ class FlareSolverrCharm(ops.CharmBase):
         self._configure_pebble()
         self.unit.set_ports(PORT, self._topology.port)
 
-        if self._is_workload_ready():
+        if self._probe_workload_ready():
             self._publish_relation_data()
 
     def _configure_pebble(self) -> None:
@@ -164,8 +170,7 @@ class FlareSolverrCharm(ops.CharmBase):
             }
         )
 
-        self._container.add_layer("flaresolverr", layer, combine=True)
-        self._container.replan()
+        reconcile_layer(self._container, "flaresolverr", layer)
 
     def _publish_relation_data(self) -> None:
         """Publish FlareSolverr URL to related applications."""
@@ -173,7 +178,7 @@ class FlareSolverrCharm(ops.CharmBase):
             return
 
         data = FlareSolverrProviderData(url=self._internal_url)
-        self._flaresolverr.publish_data(data)
+        self._publisher.publish("flaresolverr", data, self._flaresolverr.publish_data)
 
     def _is_workload_ready(self) -> bool:
         """Check if FlareSolverr is responding to health checks."""
@@ -184,6 +189,21 @@ class FlareSolverrCharm(ops.CharmBase):
         except (urllib.error.URLError, TimeoutError):
             return False
 
+    def _probe_workload_ready(self) -> bool:
+        """Probe the workload and remember the result for collect-status."""
+        self._workload_ready = self._is_workload_ready()
+        return self._workload_ready
+
+    def _observed_workload_ready(self) -> bool:
+        """Workload readiness for collect-status without another request to it.
+
+        Reuses this dispatch's probe from the reconcile if there was one and
+        only probes when the reconcile did not get that far.
+        """
+        if self._workload_ready is not None:
+            return self._workload_ready
+        return self._probe_workload_ready()
+
     def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
         """Collect all unit statuses. Framework picks the worst."""
         self._collect_pebble_status(event)
@@ -199,7 +219,7 @@ class FlareSolverrCharm(ops.CharmBase):
         if not self._container.can_connect():
             return
 
-        if not self._is_workload_ready():
+        if not self._observed_workload_ready():
             event.add_status(ops.WaitingStatus("Starting FlareSolverr"))
         else:
             event.add_status(ops.ActiveStatus())
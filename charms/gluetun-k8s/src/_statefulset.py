@@ -0,0 +1,181 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""One GET and at most one PATCH of the app StatefulSet per hook.
+
+reconcile_storage_volume, reconcile_gateway_client and friends each read
+the app StatefulSet and strategic-merge patch it on their own, so a single
+reconcile can roll the pod twice in quick succession. StatefulSetBatch is
+the K8sResourceManager handed to those helpers: the first GET of the app
+StatefulSet is cached, every PATCH is folded into one pending
+strategic-merge patch (and reflected in later GETs), and flush() sends it
+only if the merged object actually differs from what was read.
+
+Anything else - other resources, other patch types, apply/delete - goes
+straight to the wrapped manager, flushing first if it touches the app
+StatefulSet.
+"""
+
+import copy
+import logging
+from typing import Any
+
+from lightkube.core.client import Client
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.types import CascadeType, PatchType
+
+from charmarr_lib.core import K8sResourceManager
+
+logger = logging.getLogger(__name__)
+
+# Strategic-merge keys of the list fields the charm helpers touch
+_MERGE_KEYS = {
+    "containers": "name",
+    "env": "name",
+    "initContainers": "name",
+    "ports": "containerPort",
+    "volumeDevices": "devicePath",
+    "volumeMounts": "mountPath",
+    "volumes": "name",
+}
+
+
+def _as_dict(obj: Any) -> Any:
+    return obj.to_dict() if hasattr(obj, "to_dict") else obj
+
+
+def _merge_list(base: list[Any], patch: list[Any], key: str, keep_directives: bool) -> list[Any]:
+    merged = copy.deepcopy(base)
+    for item in patch:
+        if not isinstance(item, dict) or key not in item:
+            merged.append(copy.deepcopy(item))
+            continue
+        at = next(
+            (i for i, m in enumerate(merged) if isinstance(m, dict) and m.get(key) == item[key]),
+            None,
+        )
+        if item.get("$patch") == "delete" and not keep_directives:
+            if at is not None:
+                del merged[at]
+        elif at is None:
+            merged.append(copy.deepcopy(item))
+        elif item.get("$patch") == "delete":
+            merged[at] = copy.deepcopy(item)
+        else:
+            merged[at] = strategic_merge(merged[at], item, keep_directives=keep_directives)
+    return merged
+
+
+def strategic_merge(base: Any, patch: Any, *, keep_directives: bool = False) -> Any:
+    """Apply a strategic-merge patch to base (the subset of semantics the helpers use).
+
+    With keep_directives, null values and $patch: delete entries are kept
+    instead of applied, which is how two patches are combined into one.
+    """
+    if not isinstance(base, dict) or not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    merged = copy.deepcopy(base)
+    for name, value in patch.items():
+        if value is None and not keep_directives:
+            merged.pop(name, None)
+        elif name in _MERGE_KEYS and isinstance(value, list) and isinstance(base.get(name), list):
+            merged[name] = _merge_list(base[name], value, _MERGE_KEYS[name], keep_directives)
+        else:
+            merged[name] = strategic_merge(base.get(name), value, keep_directives=keep_directives)
+    return merged
+
+
+class StatefulSetBatch(K8sResourceManager):
+    """K8sResourceManager that folds app StatefulSet patches into one."""
+
+    def __init__(self, manager: K8sResourceManager, name: str, namespace: str) -> None:
+        # No super().__init__(): every call goes through the wrapped manager
+        self._manager = manager
+        self._name = name
+        self._namespace = namespace
+        self._current: Any = None
+        self._pending: dict[str, Any] = {}
+
+    @property
+    def client(self) -> Client:
+        """The wrapped manager's lightkube client; calls on it bypass the batch."""
+        return self._manager.client
+
+    def _is_target(self, resource_type: type[Any], name: str, namespace: str | None) -> bool:
+        return resource_type is StatefulSet and name == self._name and namespace == self._namespace
+
+    def get(self, resource_type: type[Any], name: str, namespace: str | None = None) -> Any:
+        """Cached GET of the app StatefulSet, with pending patches applied."""
+        if not self._is_target(resource_type, name, namespace):
+            return self._manager.get(resource_type, name, namespace)
+        if self._current is None:
+            self._current = self._manager.get(resource_type, name, namespace)
+        if not self._pending:
+            return self._current
+        return StatefulSet.from_dict(strategic_merge(_as_dict(self._current), self._pending))
+
+    def exists(self, resource_type: type[Any], name: str, namespace: str | None = None) -> bool:
+        """Pass-through exists."""
+        return self._manager.exists(resource_type, name, namespace)
+
+    def patch(
+        self,
+        resource_type: type[Any],
+        name: str,
+        obj: dict[str, Any] | Any,
+        namespace: str | None = None,
+        patch_type: PatchType = PatchType.STRATEGIC,
+    ) -> Any:
+        """Fold a strategic-merge patch of the app StatefulSet into the pending one.
+
+        Nothing is sent until flush(), so there is no patched object to return.
+        """
+        if (
+            not self._is_target(resource_type, name, namespace)
+            or patch_type != PatchType.STRATEGIC
+        ):
+            self._flush_if_target(resource_type, name, namespace)
+            return self._manager.patch(resource_type, name, obj, namespace, patch_type=patch_type)
+        self._pending = strategic_merge(self._pending, _as_dict(obj), keep_directives=True)
+        return None
+
+    def apply(self, resource: Any, force: bool = False) -> Any:
+        """Pass-through apply; flushes first if resource is the app StatefulSet."""
+        metadata = getattr(resource, "metadata", None)
+        self._flush_if_target(
+            type(resource),
+            getattr(metadata, "name", None) or "",
+            getattr(metadata, "namespace", None),
+        )
+        return self._manager.apply(resource, force=force)
+
+    def delete(
+        self,
+        resource_type: type[Any],
+        name: str,
+        namespace: str | None = None,
+        cascade: CascadeType = CascadeType.BACKGROUND,
+    ) -> bool:
+        """Pass-through delete; flushes first if it targets the app StatefulSet."""
+        self._flush_if_target(resource_type, name, namespace)
+        return self._manager.delete(resource_type, name, namespace, cascade=cascade)
+
+    def _flush_if_target(self, resource_type: type[Any], name: str, namespace: str | None) -> None:
+        if self._is_target(resource_type, name, namespace):
+            self.flush()
+            self._current = None
+
+    def flush(self) -> bool:
+        """Send the pending patch if it changes the StatefulSet; True if one was sent."""
+        if not self._pending:
+            return False
+        pending, self._pending = self._pending, {}
+        if self._current is not None:
+            original = _as_dict(self._current)
+            if strategic_merge(original, pending) == original:
+                logger.debug("StatefulSet %s already up to date, not patching", self._name)
+                return False
+        self._manager.patch(StatefulSet, self._name, pending, self._namespace)
+        self._current = None
+        logger.info("Patched StatefulSet %s", self._name)
+        return True
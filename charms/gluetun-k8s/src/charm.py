@@ -6,6 +6,9 @@
 
 import json
 import logging
+from collections import Counter
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 import httpx
@@ -20,11 +23,18 @@ from ops.pebble import Layer
 from pydantic import BaseModel
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from _k8s_cache import K8sReadCache, build_k8s_api_counters
+from _pebble import reconcile_layer
+from _profiler import ReconcileProfiler
+from _publish import RelationPublisher
+from _secrets import SecretCache
 from _speedtest import handle_speedtest
+from _statefulset import StatefulSetBatch
 from charmarr_lib.core import (
-    CharmarrTopology,
+    CharmarrChargedTopology,
     CharmarrTopologyRelation,
     K8sResourceManager,
+    MetricFamily,
     observe_events,
     reconcilable_events_k8s,
 )
@@ -50,6 +60,7 @@ PROVIDERS_REQUIRING_ADDRESSES = frozenset({"mullvad", "custom"})
 GLUETUN_HTTP_PORT = 8000
 PRIVATE_KEY_ATTRIBUTE = "private-key"
 GLUETUN_API_TIMEOUT = 5.0
+GLUETUN_API_FAST_TIMEOUT = 2.0
 HEALTH_CHECK_RETRIES = 5
 HEALTH_CHECK_WAIT_MIN = 2
 HEALTH_CHECK_WAIT_MAX = 5
@@ -66,18 +77,28 @@ class VPNHealthStatus(BaseModel, frozen=True):
 class GluetunCharm(ops.CharmBase):
     """Gluetun VPN gateway charm."""
 
+    _stored = ops.StoredState()
+
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._stored.set_default(cluster_dns_ip="", k8s_api_requests={}, k8s_cache_hits=0)
+        self._secrets = SecretCache(self)
+        self._publisher = RelationPublisher(self)
+        self._profiler = ReconcileProfiler(self)
         self._container = self.unit.get_container(GLUETUN_CONTAINER_NAME)
         self._exporter_container = self.unit.get_container(GLUETUN_EXPORTER_CONTAINER_NAME)
         self._vpn_gateway = VPNGatewayProvider(self, "vpn-gateway")
-        self._k8s: K8sResourceManager | None = None
+        self._k8s: K8sReadCache | None = None
+        self._statefulset: StatefulSetBatch | None = None
+        self._vpn_health: VPNHealthStatus | None = None
+        self._vpn_health_retried = False
 
-        self._topology = CharmarrTopology(
+        self._topology = CharmarrChargedTopology(
             self,
             relations=[
                 CharmarrTopologyRelation("vpn-gateway", role="provides", required=False),
             ],
+            extra_exposition=self._build_exposition,
         )
         self._crowsnest = CrowsnestProvider(self, "crowsnest")
         self._metrics_endpoint = MetricsEndpointProvider(
@@ -100,14 +121,27 @@ class GluetunCharm(ops.CharmBase):
         observe_events(self, reconcilable_events_k8s, self._reconcile)
         framework.observe(self.on.collect_unit_status, self._on_collect_unit_status)
         framework.observe(self.on.speedtest_action, self._on_speedtest_action)
+        framework.observe(framework.on.pre_commit, self._on_pre_commit)
 
     @property
     def k8s(self) -> K8sResourceManager:
-        """Lazily initialize K8s resource manager."""
+        """Lazily initialize K8s resource manager behind a dispatch-scoped read cache."""
         if self._k8s is None:
-            self._k8s = K8sResourceManager()
+            self._k8s = K8sReadCache(K8sResourceManager(), cacheable=(StatefulSet,))
         return self._k8s
 
+    @property
+    def statefulset(self) -> K8sResourceManager:
+        """K8s manager that folds this hook's app StatefulSet patches into one."""
+        if self._statefulset is None:
+            self._statefulset = StatefulSetBatch(self.k8s, self.app.name, self.model.name)
+        return self._statefulset
+
+    def _flush_statefulset(self) -> None:
+        """Send this hook's folded app StatefulSet patch, if there is one."""
+        if self._statefulset is not None:
+            self._statefulset.flush()
+
     def _get_config_str(self, key: str, default: str = "", *, lowercase: bool = False) -> str:
         """Get a config value as a stripped string."""
         value = str(self.config.get(key, default)).strip()
@@ -207,8 +241,8 @@ class GluetunCharm(ops.CharmBase):
             return None
 
         try:
-            secret = self.model.get_secret(id=str(secret_id))
-            content = secret.get_content(refresh=True)
+            secret = self._secrets.get(id=str(secret_id))
+            content = self._secrets.get_content(secret)
             return content.get(PRIVATE_KEY_ATTRIBUTE)
         except (ops.SecretNotFoundError, ops.ModelError):
             return None
@@ -292,15 +326,9 @@ class GluetunCharm(ops.CharmBase):
             }
         )
 
-    @retry(
-        stop=stop_after_attempt(HEALTH_CHECK_RETRIES),
-        wait=wait_exponential(min=HEALTH_CHECK_WAIT_MIN, max=HEALTH_CHECK_WAIT_MAX),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException, ValueError)),
-        reraise=True,
-    )
-    def _fetch_public_ip(self) -> str:
-        """Fetch public IP from gluetun API with retries."""
-        with httpx.Client(timeout=GLUETUN_API_TIMEOUT) as client:
+    def _fetch_public_ip(self, timeout: float = GLUETUN_API_TIMEOUT) -> str:
+        """Fetch public IP from gluetun API in a single attempt."""
+        with httpx.Client(timeout=timeout) as client:
             response = client.get(f"http://localhost:{GLUETUN_HTTP_PORT}/v1/publicip/ip")
             response.raise_for_status()
             data = response.json()
@@ -309,10 +337,43 @@ class GluetunCharm(ops.CharmBase):
                 raise ValueError("No public IP in response")
             return public_ip
 
-    def _check_vpn_health(self) -> VPNHealthStatus:
-        """Check VPN connection status via gluetun API."""
+    @retry(
+        stop=stop_after_attempt(HEALTH_CHECK_RETRIES),
+        wait=wait_exponential(min=HEALTH_CHECK_WAIT_MIN, max=HEALTH_CHECK_WAIT_MAX),
+        retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException, ValueError)),
+        reraise=True,
+    )
+    def _fetch_public_ip_with_retries(self) -> str:
+        """Fetch public IP from gluetun API with retries."""
+        return self._fetch_public_ip()
+
+    def _check_vpn_health(self, *, retrying: bool = False) -> VPNHealthStatus:
+        """Check VPN connection status via gluetun API, memoized per dispatch.
+
+        By default this is a single short attempt, so status collection and
+        actions never stall on a down tunnel. retrying=True backs off for up
+        to ~40s and is reserved for reconcile, where the published
+        vpn_connected flag should not flap while the tunnel comes up. A
+        failed fast probe does not satisfy a later retrying call; any other
+        result is shared by every caller in the hook.
+        """
+        cached = self._vpn_health
+        if cached and (cached.connected or self._vpn_health_retried or not retrying):
+            return cached
+
+        fetch: Callable[[], str] = (
+            self._fetch_public_ip_with_retries
+            if retrying
+            else partial(self._fetch_public_ip, GLUETUN_API_FAST_TIMEOUT)
+        )
+        self._vpn_health = self._probe_vpn_health(fetch)
+        self._vpn_health_retried = retrying
+        return self._vpn_health
+
+    def _probe_vpn_health(self, fetch: Callable[[], str]) -> VPNHealthStatus:
+        """Map the outcome of a public IP fetch to a health status."""
         try:
-            public_ip = self._fetch_public_ip()
+            public_ip = fetch()
             return VPNHealthStatus(connected=True, external_ip=public_ip)
         except httpx.ConnectError:
             return VPNHealthStatus(connected=False, error="Gluetun API not reachable")
@@ -326,7 +387,7 @@ class GluetunCharm(ops.CharmBase):
     def _is_gluetun_privileged(self) -> bool:
         """Check if gluetun container has privileged security context."""
         try:
-            sts = self.k8s.get(StatefulSet, self.app.name, self.model.name)
+            sts = self.statefulset.get(StatefulSet, self.app.name, self.model.name)
         except ApiError:
             return False
 
@@ -345,8 +406,10 @@ class GluetunCharm(ops.CharmBase):
     def _ensure_gluetun_privileged(self) -> bool:
         """Ensure gluetun container has privileged security context.
 
+        The patch is queued on the StatefulSet batch; the caller flushes it.
+
         Returns:
-            True if patch was applied (pod will restart), False if already privileged.
+            True if a patch was queued (pod will restart), False if already privileged.
         """
         if self._is_gluetun_privileged():
             return False
@@ -364,7 +427,7 @@ class GluetunCharm(ops.CharmBase):
                 }
             }
         }
-        self.k8s.patch(StatefulSet, self.app.name, patch, self.model.name)
+        self.statefulset.patch(StatefulSet, self.app.name, patch, self.model.name)
         logger.info("Patched gluetun container to privileged mode")
         return True
 
@@ -419,8 +482,35 @@ class GluetunCharm(ops.CharmBase):
         if not self._exporter_container.can_connect():
             return
         layer = self._build_exporter_layer()
-        self._exporter_container.add_layer(GLUETUN_EXPORTER_SERVICE_NAME, layer, combine=True)
-        self._exporter_container.replan()
+        reconcile_layer(self._exporter_container, GLUETUN_EXPORTER_SERVICE_NAME, layer)
+
+    def _build_exposition(self) -> list[MetricFamily]:
+        """Extra topology exposition: Kubernetes API counters and reconcile step timings."""
+        return self._build_k8s_api_counters() + self._profiler.build_metrics()
+
+    def _on_pre_commit(self, _: ops.EventBase) -> None:
+        """Persist this dispatch's Kubernetes API counters."""
+        if self._k8s is None:
+            return
+        requests = self._stored.k8s_api_requests
+        for verb, count in self._k8s.requests.items():
+            requests[verb] = requests.get(verb, 0) + count
+        self._stored.k8s_cache_hits += self._k8s.hits
+
+    def _build_k8s_api_counters(self) -> list[MetricFamily]:
+        """Cumulative Kubernetes API counters, including this dispatch so far."""
+        requests = Counter(dict(self._stored.k8s_api_requests))
+        hits = self._stored.k8s_cache_hits
+        if self._k8s is not None:
+            requests.update(self._k8s.requests)
+            hits += self._k8s.hits
+        return build_k8s_api_counters(requests, hits)
+
+    def _get_cluster_dns_ip(self) -> str:
+        """Cluster DNS Service IP, looked up once and kept in StoredState (it never changes)."""
+        if not self._stored.cluster_dns_ip:
+            self._stored.cluster_dns_ip = get_cluster_dns_ip(self.k8s)
+        return self._stored.cluster_dns_ip
 
     def _reconcile(self, event: ops.EventBase) -> None:
         """Reconcile charm state with desired configuration.
@@ -435,19 +525,22 @@ class GluetunCharm(ops.CharmBase):
         7. Push iptables rules and configure Pebble layer
         8. Check VPN health and publish provider data
         """
-        self._topology.reconcile()
+        with self._profiler.step("topology"):
+            self._topology.reconcile()
         self.unit.set_ports(self._topology.port)
         # The topology endpoint is a cluster-internal concern - crowsnest polls
         # it from inside the same K8s cluster. Hardcode the in-cluster Service
         # FQDN; never expose this URL externally. Gluetun is outside the mesh
         # so no AppPolicy is needed - the K8s Service port (above) is enough.
-        self._crowsnest.publish_data(
+        self._publisher.publish(
+            "crowsnest",
             CrowsnestProviderData(
                 topology_url=(
                     f"http://{self.app.name}.{self.model.name}"
                     f".svc.cluster.local:{self._topology.port}/metrics"
                 )
-            )
+            ),
+            self._crowsnest.publish_data,
         )
 
         # NOTE: charmarr v1 does not support scaling.
@@ -455,10 +548,10 @@ class GluetunCharm(ops.CharmBase):
         # This acts as a guardrail if someone scales the application beyond 1.
         if not self.unit.is_leader():
             if self._container.can_connect():
-                self._container.add_layer(
+                reconcile_layer(
+                    self._container,
                     f"{GLUETUN_CONTAINER_NAME}-check",
                     Layer({"checks": self._build_readiness_check()}),
-                    combine=True,
                 )
             return
 
@@ -479,7 +572,11 @@ class GluetunCharm(ops.CharmBase):
             logger.warning("Override mode: config validation bypassed, gluetun may misbehave")
 
         # Returns True if patch applied (pod restarting), False if already privileged
-        if self._ensure_gluetun_privileged():
+        with self._profiler.step("privileged"):
+            patched = self._ensure_gluetun_privileged()
+        if patched:
+            with self._profiler.step("statefulset-patch"):
+                self._flush_statefulset()
             return
 
         if not self._container.can_connect():
@@ -490,26 +587,33 @@ class GluetunCharm(ops.CharmBase):
             return
 
         # Configure Pebble layer and start service
-        self._push_iptables_post_rules()
-        layer = self._build_pebble_layer(private_key)
-        self._container.add_layer("gluetun", layer, combine=True)
-        self._container.replan()
+        with self._profiler.step("pebble-layer"):
+            self._push_iptables_post_rules()
+            layer = self._build_pebble_layer(private_key)
+            reconcile_layer(self._container, "gluetun", layer)
 
         # Reconcile gluetun-exporter sidecar
-        self._reconcile_exporter()
+        with self._profiler.step("exporter"):
+            self._reconcile_exporter()
+
+        # Check VPN status and publish to relations (retrying: consumers act on it)
+        with self._profiler.step("vpn-health"):
+            health = self._check_vpn_health(retrying=True)
+        with self._profiler.step("gateway"):
+            cluster_dns_ip = self._get_cluster_dns_ip()
+            provider_data = self._build_provider_data(health, cluster_dns_ip)
+            reconcile_gateway(
+                manager=self.statefulset,
+                statefulset_name=self.app.name,
+                namespace=self.model.name,
+                data=provider_data,
+                input_cidrs=[],  # gluetun handles INPUT rules via post-rules.txt
+            )
+            self._publisher.publish("vpn-gateway", provider_data, self._vpn_gateway.publish_data)
 
-        # Check VPN status and publish to relations
-        health = self._check_vpn_health()
-        cluster_dns_ip = get_cluster_dns_ip(self.k8s)
-        provider_data = self._build_provider_data(health, cluster_dns_ip)
-        reconcile_gateway(
-            manager=self.k8s,
-            statefulset_name=self.app.name,
-            namespace=self.model.name,
-            data=provider_data,
-            input_cidrs=[],  # gluetun handles INPUT rules via post-rules.txt
-        )
-        self._vpn_gateway.publish_data(provider_data)
+        # Send the StatefulSet changes above as one patch, so the pod rolls at most once
+        with self._profiler.step("statefulset-patch"):
+            self._flush_statefulset()
 
     def _on_speedtest_action(self, event: ops.ActionEvent) -> None:
         """Run a LibreSpeed throughput test through the VPN tunnel."""
@@ -5,6 +5,7 @@
 
 from unittest.mock import patch
 
+import httpx
 import ops
 from ops.testing import Container, Secret, State
 
@@ -117,3 +118,57 @@ def test_reconcile_calls_gateway_even_when_vpn_disconnected(ctx, mock_k8s_privil
         mock_gateway.assert_called_once()
         provider_data = mock_gateway.call_args.kwargs["data"]
         assert provider_data.vpn_connected is False
+
+
+def _health_state() -> State:
+    secret = Secret(tracked_content={"private-key": "test-key"})
+    return State(
+        leader=True,
+        containers=[GLUETUN_CONTAINER, GLUETUN_EXPORTER_CONTAINER],
+        config={
+            "cluster-cidrs": "10.1.0.0/16",
+            "vpn-provider": "nordvpn",
+            "wireguard-private-key-secret": secret.id,
+        },
+        secrets=[secret],
+    )
+
+
+def test_fast_health_probe_is_single_attempt_and_memoized(ctx):
+    """Status-path probes make one short attempt, shared across the hook."""
+    from charm import GluetunCharm
+
+    with (
+        patch("charm.K8sResourceManager"),
+        patch.object(
+            GluetunCharm, "_fetch_public_ip", side_effect=httpx.ConnectError("down")
+        ) as fetch,
+        ctx(ctx.on.collect_unit_status(), _health_state()) as mgr,
+    ):
+        first = mgr.charm._check_vpn_health()
+        second = mgr.charm._check_vpn_health()
+        mgr.run()
+
+    assert first is second
+    assert first.error == "Gluetun API not reachable"
+    fetch.assert_called_once()
+
+
+def test_retrying_probe_overrides_failed_fast_probe(ctx):
+    """A retrying call re-probes after a failed fast probe and its result is shared."""
+    from charm import GluetunCharm
+
+    with (
+        patch("charm.K8sResourceManager"),
+        patch.object(GluetunCharm, "_fetch_public_ip", side_effect=httpx.ConnectError("down")),
+        patch.object(
+            GluetunCharm, "_fetch_public_ip_with_retries", return_value="185.112.34.56"
+        ) as fetch_with_retries,
+        ctx(ctx.on.collect_unit_status(), _health_state()) as mgr,
+    ):
+        assert not mgr.charm._check_vpn_health().connected
+        assert mgr.charm._check_vpn_health(retrying=True).connected
+        assert mgr.charm._check_vpn_health().external_ip == "185.112.34.56"
+        mgr.run()
+
+    fetch_with_retries.assert_called_once()
@@ -17,6 +17,9 @@ from _overseerr._constants import (
     SETTINGS_FILE,
     WEBUI_PORT,
 )
+from _overseerr._pebble import LayerDiff, is_check_up, reconcile_layer
+from _overseerr._publish import RelationPublisher
+from _overseerr._secrets import SecretCache
 
 __all__ = [
     "API_KEY_SECRET_LABEL",
@@ -30,6 +33,11 @@ __all__ = [
     "SERVICE_NAME",
     "SETTINGS_FILE",
     "WEBUI_PORT",
+    "LayerDiff",
     "OverseerrApi",
     "OverseerrApiError",
+    "RelationPublisher",
+    "SecretCache",
+    "is_check_up",
+    "reconcile_layer",
 ]
@@ -0,0 +1,109 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Change-suppressed relation publishing.
+
+The interface providers and requirers rewrite their databag on every hook,
+and any byte-level difference - dict keys or a set serialized in a new order,
+say - fires relation-changed on every peer, which reconciles and publishes
+back. RelationPublisher canonicalizes each payload (sorted keys, sorted
+members of set-typed fields; lists keep their order, which may be meaningful),
+hashes it together with the relation ids it is going to, and only calls
+publish_data() when that digest moved. Secret grants are tracked the
+same way so secret-grant is issued once per relation, not once per hook.
+
+Digests are unit-local StoredState, so they are dropped on leader-elected
+and upgrade-charm: a new leader, or a charm lib with a new wire format,
+always writes once. Emptying a databag must go through clear(), which drops
+the endpoint's digest too; otherwise republishing the old content would be
+suppressed and the databag would stay empty.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import ops
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+logger = logging.getLogger(__name__)
+
+PayloadT = TypeVar("PayloadT", bound=BaseModel)
+
+
+def _normalize(value: Any) -> Any:
+    # Walk the model itself rather than model_dump(mode="json"), which turns
+    # sets into lists and loses which collections are declared unordered
+    if isinstance(value, BaseModel):
+        return {name: _normalize(getattr(value, name)) for name in type(value).model_fields}
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, set | frozenset):
+        items = [_normalize(v) for v in value]
+        return sorted(items, key=lambda v: json.dumps(v, sort_keys=True))
+    if isinstance(value, list | tuple):
+        return [_normalize(v) for v in value]
+    return to_jsonable_python(value)
+
+
+def canonical_payload(data: BaseModel) -> str:
+    """Serialize data so that equal content always yields the same string.
+
+    Dict keys and set members are ordered; list order is kept, since the
+    schema only declares a collection unordered by typing it as a set.
+    """
+    return json.dumps(_normalize(data), sort_keys=True, separators=(",", ":"))
+
+
+class RelationPublisher(ops.Object):
+    """Writes relation data and secret grants only when they change."""
+
+    _stored = ops.StoredState()
+
+    def __init__(self, charm: ops.CharmBase) -> None:
+        super().__init__(charm, "relation-publisher")
+        self._stored.set_default(digests={}, grants={})
+        charm.framework.observe(charm.on.leader_elected, self._on_reset)
+        charm.framework.observe(charm.on.upgrade_charm, self._on_reset)
+        for endpoint in charm.meta.relations:
+            charm.framework.observe(charm.on[endpoint].relation_broken, self._on_relation_broken)
+
+    def _on_reset(self, _: ops.EventBase) -> None:
+        self._stored.digests = {}
+        self._stored.grants = {}
+
+    def _on_relation_broken(self, event: ops.RelationBrokenEvent) -> None:
+        relation_id = event.relation.id
+        for key in [k for k, v in self._stored.grants.items() if v == relation_id]:
+            del self._stored.grants[key]
+
+    def publish(self, endpoint: str, data: PayloadT, write: Callable[[PayloadT], None]) -> bool:
+        """Call write(data) unless the same content already went to the same relations.
+
+        Returns True if the data was written.
+        """
+        relation_ids = sorted(r.id for r in self.model.relations.get(endpoint, ()))
+        material = f"{relation_ids}|{canonical_payload(data)}"
+        digest = hashlib.sha256(material.encode()).hexdigest()
+        if self._stored.digests.get(endpoint) == digest:
+            logger.debug("Relation data for %s unchanged, not republishing", endpoint)
+            return False
+        write(data)
+        self._stored.digests[endpoint] = digest
+        return True
+
+    def clear(self, endpoint: str, clear: Callable[[], None]) -> None:
+        """Call clear() to empty endpoint's databag; the next publish() always writes."""
+        clear()
+        self._stored.digests.pop(endpoint, None)
+
+    def grant(self, secret: ops.Secret, relation: ops.Relation) -> None:
+        """secret.grant(relation), once per secret and relation."""
+        key = f"{secret.id or secret.label}:{relation.id}"
+        if key in self._stored.grants:
+            return
+        secret.grant(relation)
+        self._stored.grants[key] = relation.id
@@ -0,0 +1,61 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Hook-scoped cache in front of Juju secret lookups.
+
+Every model.get_secret() and get_content(refresh=True) is a secret-get
+round-trip to the controller, and the same secret is looked up from
+reconcile, publishing, the topology callback and collect-status. SecretCache
+fetches each secret once per dispatch and drops everything whenever a
+secret's content may have changed.
+"""
+
+import ops
+
+
+class SecretCache(ops.Object):
+    """Per-dispatch cache of secrets and their content.
+
+    Invalidated on secret-changed and secret-rotate, and by set_content().
+    Misses (SecretNotFoundError) are not cached, so a secret added later in
+    the same hook is found on the next lookup.
+    """
+
+    def __init__(self, charm: ops.CharmBase) -> None:
+        super().__init__(charm, "secret-cache")
+        self._model = charm.model
+        self._secrets: dict[tuple[str, str], ops.Secret] = {}
+        self._contents: dict[str, dict[str, str]] = {}
+        charm.framework.observe(charm.on.secret_changed, self._on_secret_event)
+        charm.framework.observe(charm.on.secret_rotate, self._on_secret_event)
+
+    def _on_secret_event(self, _: ops.EventBase) -> None:
+        self.invalidate()
+
+    def get(self, *, id: str | None = None, label: str | None = None) -> ops.Secret:
+        """Cached equivalent of model.get_secret(id=..., label=...)."""
+        key = ("id", id) if id else ("label", label or "")
+        secret = self._secrets.get(key)
+        if secret is None:
+            secret = self._model.get_secret(id=id, label=label)
+            self._secrets[key] = secret
+        return secret
+
+    def get_content(self, secret: ops.Secret) -> dict[str, str]:
+        """Cached equivalent of secret.get_content(refresh=True)."""
+        key = secret.id or secret.label or ""
+        content = self._contents.get(key)
+        if content is None:
+            content = secret.get_content(refresh=True)
+            self._contents[key] = content
+        return dict(content)
+
+    def set_content(self, secret: ops.Secret, content: dict[str, str]) -> None:
+        """Write new secret content and drop every cached entry."""
+        secret.set_content(content)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget every cached secret and its content."""
+        self._secrets.clear()
+        self._contents.clear()
@@ -38,6 +38,10 @@ from _overseerr import (
     WEBUI_PORT,
     OverseerrApi,
     OverseerrApiError,
+    RelationPublisher,
+    SecretCache,
+    is_check_up,
+    reconcile_layer,
 )
 from charmarr_lib.core import (
     ContentVariant,
@@ -65,7 +69,11 @@ class OverseerrCharm(ops.CharmBase):
 
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._secrets = SecretCache(self)
+        self._publisher = RelationPublisher(self)
         self._container = self.unit.get_container(CONTAINER_NAME)
+        self._workload_ready: bool | None = None
+        self._app_initialized: bool | None = None
 
         self._media_manager = MediaManagerRequirer(self, "media-manager")
         self._media_server = MediaServerRequirer(self, "media-server")
@@ -108,10 +116,10 @@ class OverseerrCharm(ops.CharmBase):
     def _ensure_api_key_secret(self, api_key: str) -> str:
         """Ensure API key is stored in Juju secret, return secret ID."""
         try:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            stored = secret.get_content(refresh=True)["api-key"]
+            secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+            stored = self._secrets.get_content(secret)["api-key"]
             if stored != api_key:
-                secret.set_content({"api-key": api_key})
+                self._secrets.set_content(secret, {"api-key": api_key})
                 logger.info("Updated API key secret (drift detected)")
             return self._get_secret_id(secret)
         except ops.SecretNotFoundError:
@@ -144,6 +152,27 @@ class OverseerrCharm(ops.CharmBase):
         except OverseerrApiError:
             return False
 
+    def _is_app_initialized(self, api: OverseerrApi) -> bool:
+        """Whether Overseerr's setup wizard is done; asked once per dispatch."""
+        if self._app_initialized is None:
+            self._app_initialized = api.is_initialized()
+        return self._app_initialized
+
+    def _probe_workload_ready(self, api_key: str) -> bool:
+        """Probe the workload and remember the result for collect-status."""
+        self._workload_ready = self._is_workload_ready(api_key)
+        return self._workload_ready
+
+    def _observed_workload_ready(self) -> bool:
+        """Workload readiness for collect-status without another request to it.
+
+        Reuses this dispatch's probe from the reconcile if there was one, else
+        reads the state Pebble keeps for the ready check.
+        """
+        if self._workload_ready is not None:
+            return self._workload_ready
+        return is_check_up(self._container, f"{CONTAINER_NAME}-ready")
+
     def _build_readiness_check(self) -> dict:
         """Build Pebble readiness check."""
         return {
@@ -192,8 +221,8 @@ class OverseerrCharm(ops.CharmBase):
     def _get_provider_api_key(self, secret_id: str) -> str | None:  # pragma: no cover
         """Retrieve API key from provider's Juju secret."""
         try:
-            secret = self.model.get_secret(id=secret_id)
-            return secret.get_content(refresh=True).get("api-key")
+            secret = self._secrets.get(id=secret_id)
+            return self._secrets.get_content(secret).get("api-key")
         except ops.SecretNotFoundError:
             return None
 
@@ -418,7 +447,7 @@ class OverseerrCharm(ops.CharmBase):
             requester=RequestManager.OVERSEERR,
             instance_name=self.app.name,
         )
-        self._media_manager.publish_data(data)
+        self._publisher.publish("media-manager", data, self._media_manager.publish_data)
         logger.info("Published media manager requirer data")
 
     def _configure_ingress(self) -> None:
@@ -474,10 +503,10 @@ class OverseerrCharm(ops.CharmBase):
 
         if not self.unit.is_leader():
             if self._container.can_connect():
-                self._container.add_layer(
+                reconcile_layer(
+                    self._container,
                     f"{CONTAINER_NAME}-check",
                     {"checks": self._build_readiness_check()},
-                    combine=True,
                 )
             return
 
@@ -498,8 +527,7 @@ class OverseerrCharm(ops.CharmBase):
         ensure_pebble_user(self._container, DEFAULT_PUID, DEFAULT_PGID, username="overseerr")
 
         layer = self._build_pebble_layer()
-        self._container.add_layer(SERVICE_NAME, layer, combine=True)
-        self._container.replan()
+        reconcile_layer(self._container, SERVICE_NAME, layer)
 
         self.unit.set_ports(WEBUI_PORT)
 
@@ -513,18 +541,18 @@ class OverseerrCharm(ops.CharmBase):
         self._ensure_api_key_secret(api_key)
 
         try:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
+            secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
             sync_secret_rotation_policy(
                 secret, str(self.config.get("api-key-rotation", "disabled"))
             )
         except ops.SecretNotFoundError:
             logger.warning("API key secret not found when syncing rotation policy")
 
-        if not self._is_workload_ready(api_key):
+        if not self._probe_workload_ready(api_key):
             return
 
         with self._get_api_client(api_key) as api:
-            if api.is_initialized():
+            if self._is_app_initialized(api):
                 self._reconcile_media_managers(api)
 
     def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
@@ -567,12 +595,12 @@ class OverseerrCharm(ops.CharmBase):
             event.add_status(ops.WaitingStatus("Waiting for API key"))
             return
 
-        if not self._is_workload_ready(api_key):
+        if not self._observed_workload_ready():
             event.add_status(ops.WaitingStatus("Waiting for workload"))
             return
 
         with self._get_api_client(api_key) as api:
-            if not api.is_initialized():
+            if not self._is_app_initialized(api):
                 event.add_status(ops.WaitingStatus("Complete setup in web UI"))
                 return
 
@@ -586,7 +614,7 @@ class OverseerrCharm(ops.CharmBase):
             return
 
         new_api_key = generate_api_key()
-        event.secret.set_content({"api-key": new_api_key})
+        self._secrets.set_content(event.secret, {"api-key": new_api_key})
         logger.info("Rotated API key secret")
 
         if not self._container.can_connect():
@@ -6,6 +6,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from ops.pebble import Layer
 from ops.testing import Container, Context, Exec
 
 from charm import OverseerrCharm
@@ -18,6 +19,24 @@ OVERSEERR_CONTAINER = Container(
     },
 )
 
+# The ready check as the charm layers it; Scenario only accepts a CheckInfo
+# that matches a check in the container's plan
+OVERSEERR_READY_LAYER = Layer(
+    {
+        "checks": {
+            "overseerr-ready": {
+                "override": "replace",
+                "level": "ready",
+                "http": {"url": "http://localhost:5055/api/v1/status"},
+                "period": "10s",
+                "timeout": "5s",
+                "threshold": 3,
+                "startup": "enabled",
+            }
+        }
+    }
+)
+
 
 @pytest.fixture
 def ctx() -> Context[OverseerrCharm]:
@@ -6,9 +6,9 @@
 from unittest.mock import patch
 
 import ops
-from ops.testing import Container, State
+from ops.testing import CheckInfo, Container, State
 
-from .conftest import OVERSEERR_CONTAINER
+from .conftest import OVERSEERR_CONTAINER, OVERSEERR_READY_LAYER
 
 
 def test_status_waiting_for_pebble(ctx):
@@ -75,12 +75,14 @@ def test_status_active_when_ready(ctx):
         name="overseerr",
         can_connect=True,
         service_statuses={"overseerr": ops.pebble.ServiceStatus.ACTIVE},
+        layers={"overseerr": OVERSEERR_READY_LAYER},
+        check_infos={CheckInfo("overseerr-ready", level=ops.pebble.CheckLevel.READY)},
     )
 
     with (
         patch("charm.OverseerrCharm._get_api_key", return_value="test-api-key"),
         patch("charm.OverseerrCharm._is_service_running", return_value=True),
-        patch("charm.OverseerrCharm._is_workload_ready", return_value=True),
+        patch("charm.OverseerrCharm._is_workload_ready") as probe,
         patch("charm.OverseerrCharm._get_api_client") as mock_api_client,
     ):
         mock_api_client.return_value.__enter__.return_value.is_initialized.return_value = True
@@ -92,3 +94,4 @@ def test_status_active_when_ready(ctx):
     assert isinstance(state.unit_status, ops.ActiveStatus)
     assert "Deprecated" in state.unit_status.message
     assert "seerr-k8s" in state.unit_status.message
+    probe.assert_not_called()
@@ -9,6 +9,8 @@ from _plex._api import (
     PlexApiError,
     PlexApiResponseError,
     PlexLibrary,
+    PlexLibrarySpec,
+    plan_missing_libraries,
 )
 from _plex._claim import (
     ensure_custom_connection,
@@ -36,6 +38,12 @@ from _plex._o11y import (
     METRICS_PORT,
     METRICS_SERVICE_NAME,
 )
+from _plex._ownership import reconcile_ownership
+from _plex._pebble import LayerDiff, reconcile_layer
+from _plex._preferences import PlexPreferences
+from _plex._profiler import ReconcileProfiler
+from _plex._publish import RelationPublisher
+from _plex._statefulset import StatefulSetBatch
 
 __all__ = [
     "CONTAINER_NAME",
@@ -53,14 +61,23 @@ __all__ = [
     "PREFERENCES_FILE",
     "SERVICE_NAME",
     "WEBUI_PORT",
+    "LayerDiff",
     "PlexApi",
     "PlexApiConnectionError",
     "PlexApiError",
     "PlexApiResponseError",
     "PlexLibrary",
+    "PlexLibrarySpec",
+    "PlexPreferences",
+    "ReconcileProfiler",
+    "RelationPublisher",
+    "StatefulSetBatch",
     "ensure_custom_connection",
     "exchange_claim_token",
     "extract_machine_identifier",
     "extract_online_token",
     "inject_online_token",
+    "plan_missing_libraries",
+    "reconcile_layer",
+    "reconcile_ownership",
 ]
@@ -4,6 +4,7 @@
 """Plex API client for library management."""
 
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from types import TracebackType
 from typing import Self
@@ -43,6 +44,35 @@ class PlexLibrary:
     location: list[str]
 
 
+@dataclass(frozen=True)
+class PlexLibrarySpec:
+    """A library the charm wants to exist at a given path."""
+
+    name: str
+    type: str
+    location: str
+
+
+def _normalize_path(path: str) -> str:
+    return path.rstrip("/") or "/"
+
+
+def plan_missing_libraries(
+    index: dict[str, PlexLibrary], desired: Iterable[PlexLibrarySpec]
+) -> list[PlexLibrarySpec]:
+    """Diff desired libraries against a path index from get_library_index().
+
+    Returns the specs whose location has no library yet, at most one per
+    path, in the order they were given.
+    """
+    missing: dict[str, PlexLibrarySpec] = {}
+    for spec in desired:
+        path = _normalize_path(spec.location)
+        if path not in index and path not in missing:
+            missing[path] = spec
+    return list(missing.values())
+
+
 class PlexApi:
     """Plex Media Server API client for library management."""
 
@@ -88,7 +118,7 @@ class PlexApi:
     def get_libraries(self) -> list[PlexLibrary]:
         """Get all library sections."""
         response = self._request("GET", "/library/sections")
-        root = ElementTree.fromstring(response.text)
+        root = ElementTree.fromstring(response.content)
 
         libraries = []
         for directory in root.findall(".//Directory"):
@@ -103,10 +133,20 @@ class PlexApi:
             )
         return libraries
 
+    def get_library_index(self) -> dict[str, PlexLibrary]:
+        """Fetch all sections once and index them by location path."""
+        return {
+            _normalize_path(location): library
+            for library in self.get_libraries()
+            for location in library.location
+        }
+
     def library_exists_for_path(self, path: str) -> bool:
-        """Check if a library exists for the given path."""
-        libraries = self.get_libraries()
-        return any(path in lib.location for lib in libraries)
+        """Check if a library exists for the given path.
+
+        Fetches every section; use get_library_index() when checking many paths.
+        """
+        return _normalize_path(path) in self.get_library_index()
 
     def create_library(
         self,
@@ -0,0 +1,107 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Per-dispatch Preferences.xml model.
+
+The claim, custom-connection and exporter steps all need values from
+Preferences.xml. Pulling the file over Pebble (and regex-scanning it) in
+each step costs several round-trips per hook. PlexPreferences pulls and
+parses it once, serves typed accessors from the parsed attributes, and
+batches edits into a single push on flush().
+"""
+
+import logging
+from xml.etree import ElementTree
+
+import ops
+
+from _plex._claim import ensure_custom_connection, inject_online_token
+from _plex._constants import PREFERENCES_FILE
+
+logger = logging.getLogger(__name__)
+
+
+class PlexPreferences:
+    """Preferences.xml pulled once per dispatch, with batched writes.
+
+    A missing file is not cached: Plex creates it shortly after its first
+    start, possibly later in the same hook, so the next access retries.
+    """
+
+    def __init__(self, container: ops.Container, path: str = PREFERENCES_FILE) -> None:
+        self._container = container
+        self._path = path
+        self._content: str | None = None
+        self._attrs: dict[str, str] = {}
+        self._dirty = False
+
+    def _load(self) -> bool:
+        """Pull and parse the file on first use; True if it is available."""
+        if self._content is not None:
+            return True
+        try:
+            content = self._container.pull(self._path).read()
+        except (ops.pebble.PathError, FileNotFoundError):
+            return False
+
+        try:
+            self._attrs = dict(ElementTree.fromstring(content).attrib)
+        except ElementTree.ParseError as e:
+            logger.warning("Failed to parse %s: %s", self._path, e)
+            self._attrs = {}
+        self._content = content
+        return True
+
+    @property
+    def exists(self) -> bool:
+        """True if Plex has written Preferences.xml."""
+        return self._load()
+
+    @property
+    def online_token(self) -> str | None:
+        """PlexOnlineToken, present once the server is claimed."""
+        if not self._load():
+            return None
+        return self._attrs.get("PlexOnlineToken") or None
+
+    @property
+    def machine_identifier(self) -> str | None:
+        """ProcessedMachineIdentifier, written by Plex on first start."""
+        if not self._load():
+            return None
+        return self._attrs.get("ProcessedMachineIdentifier") or None
+
+    @property
+    def custom_connections(self) -> list[str]:
+        """URLs from the comma-separated customConnections attribute."""
+        if not self._load():
+            return []
+        value = self._attrs.get("customConnections", "")
+        return [url.strip() for url in value.split(",") if url.strip()]
+
+    def set_online_token(self, token: str) -> bool:
+        """Stage a new PlexOnlineToken for the next flush(); False if no file."""
+        if not self._load() or self._content is None:
+            return False
+        if self._attrs.get("PlexOnlineToken") != token:
+            self._content = inject_online_token(self._content, token)
+            self._attrs["PlexOnlineToken"] = token
+            self._dirty = True
+        return True
+
+    def add_custom_connection(self, url: str) -> bool:
+        """Stage url into customConnections; False if already present or no file."""
+        if not self._load() or self._content is None or url in self.custom_connections:
+            return False
+        self._content = ensure_custom_connection(self._content, url)
+        self._attrs["customConnections"] = ",".join([*self.custom_connections, url])
+        self._dirty = True
+        return True
+
+    def flush(self) -> bool:
+        """Push staged edits in a single write; True if the file was written."""
+        if not self._dirty or self._content is None:
+            return False
+        self._container.push(self._path, self._content)
+        self._dirty = False
+        return True
@@ -43,23 +43,27 @@ from _plex import (
     METRICS_SERVICE_NAME,
     PLEX_BINARY,
     PLEX_DATA_DIR,
-    PREFERENCES_FILE,
     SERVICE_NAME,
     WEBUI_PORT,
     PlexApi,
     PlexApiError,
-    ensure_custom_connection,
+    PlexLibrarySpec,
+    PlexPreferences,
+    ReconcileProfiler,
+    RelationPublisher,
+    StatefulSetBatch,
     exchange_claim_token,
-    extract_machine_identifier,
-    extract_online_token,
-    inject_online_token,
+    plan_missing_libraries,
+    reconcile_layer,
+    reconcile_ownership,
 )
 from charmarr_lib.core import (
-    CharmarrTopology,
+    CharmarrChargedTopology,
     CharmarrTopologyRelation,
     ContentVariant,
     K8sResourceManager,
     MediaManager,
+    MetricFamily,
     ensure_pebble_user,
     observe_events,
     reconcilable_events_k8s,
@@ -84,17 +88,22 @@ class PlexCharm(ops.CharmBase):
 
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._profiler = ReconcileProfiler(self)
+        self._publisher = RelationPublisher(self)
         self._container = self.unit.get_container(CONTAINER_NAME)
         self._exporter_container = self.unit.get_container(METRICS_CONTAINER_NAME)
+        self._preferences = PlexPreferences(self._container)
         self._k8s: K8sResourceManager | None = None
+        self._statefulset: StatefulSetBatch | None = None
 
-        self._topology = CharmarrTopology(
+        self._topology = CharmarrChargedTopology(
             self,
             relations=[
                 CharmarrTopologyRelation("media-storage", role="requires", required=True),
                 CharmarrTopologyRelation("media-manager", role="requires", required=False),
                 CharmarrTopologyRelation("media-server", role="provides", required=False),
             ],
+            extra_exposition=self._build_exposition,
         )
         self._metrics_endpoint = MetricsEndpointProvider(
             self,
@@ -162,6 +171,18 @@ class PlexCharm(ops.CharmBase):
             self._k8s = K8sResourceManager()
         return self._k8s
 
+    @property
+    def statefulset(self) -> K8sResourceManager:
+        """K8s manager that folds this hook's app StatefulSet patches into one."""
+        if self._statefulset is None:
+            self._statefulset = StatefulSetBatch(self.k8s, self.app.name, self.model.name)
+        return self._statefulset
+
+    def _flush_statefulset(self) -> None:
+        """Send this hook's folded app StatefulSet patch, if there is one."""
+        if self._statefulset is not None:
+            self._statefulset.flush()
+
     def _is_server_claimed(self) -> bool:
         """Check if Plex server is already claimed.
 
@@ -170,12 +191,7 @@ class PlexCharm(ops.CharmBase):
         """
         if not self._container.can_connect():
             return False
-
-        try:
-            content = self._container.pull(PREFERENCES_FILE).read()
-            return "PlexOnlineToken" in content
-        except (ops.pebble.PathError, FileNotFoundError):
-            return False
+        return self._preferences.online_token is not None
 
     def _get_claim_token(self) -> str | None:
         """Get claim token from config if server is unclaimed.
@@ -193,6 +209,8 @@ class PlexCharm(ops.CharmBase):
     def _claim_server(self, claim_token: str, force: bool = False) -> tuple[bool, str]:
         """Claim server using the provided claim token.
 
+        The token is staged on the Preferences model; callers flush it.
+
         Args:
             claim_token: Plex claim token from plex.tv/claim
             force: If True, overwrite existing PlexOnlineToken
@@ -206,12 +224,10 @@ class PlexCharm(ops.CharmBase):
         if self._is_server_claimed() and not force:
             return True, "Server already claimed"
 
-        try:
-            content = self._container.pull(PREFERENCES_FILE).read()
-        except (ops.pebble.PathError, FileNotFoundError):
+        if not self._preferences.exists:
             return False, "Preferences.xml not found - wait for Plex to initialize"
 
-        machine_id = extract_machine_identifier(content)
+        machine_id = self._preferences.machine_identifier
         if not machine_id:
             return False, "ProcessedMachineIdentifier not found - wait for Plex to initialize"
 
@@ -219,8 +235,7 @@ class PlexCharm(ops.CharmBase):
         if not online_token:
             return False, "Failed to exchange claim token - token may be expired or invalid"
 
-        updated_content = inject_online_token(content, online_token)
-        self._container.push(PREFERENCES_FILE, updated_content)
+        self._preferences.set_online_token(online_token)
         logger.info("Server claimed successfully")
         return True, "Server claimed successfully"
 
@@ -236,14 +251,7 @@ class PlexCharm(ops.CharmBase):
 
     def _ensure_internal_url(self) -> None:
         """Ensure internal K8s service URL is in Plex custom connections."""
-        try:
-            content = self._container.pull(PREFERENCES_FILE).read()
-        except (ops.pebble.PathError, FileNotFoundError):
-            return
-
-        updated = ensure_custom_connection(content, self._internal_url)
-        if updated != content:
-            self._container.push(PREFERENCES_FILE, updated)
+        if self._preferences.add_custom_connection(self._internal_url):
             logger.info("Added internal URL to custom connections: %s", self._internal_url)
 
     def _build_readiness_check(self) -> dict:
@@ -297,7 +305,7 @@ class PlexCharm(ops.CharmBase):
         """Reconcile hardware transcoding (/dev/dri mount) based on config."""
         enabled = bool(self.config.get("hardware-transcoding", False))
         reconcile_hardware_transcoding(
-            manager=self.k8s,
+            manager=self.statefulset,
             statefulset_name=self.app.name,
             namespace=self.model.name,
             container_name=CONTAINER_NAME,
@@ -306,11 +314,7 @@ class PlexCharm(ops.CharmBase):
 
     def _get_online_token(self) -> str | None:  # pragma: no cover
         """Get PlexOnlineToken from Preferences.xml for API authentication."""
-        try:
-            content = self._container.pull(PREFERENCES_FILE).read()
-            return extract_online_token(content)
-        except (ops.pebble.PathError, FileNotFoundError):
-            return None
+        return self._preferences.online_token
 
     def _get_library_name(self, provider: MediaManagerProviderData) -> str:  # pragma: no cover
         """Generate Plex library name based on media manager provider data."""
@@ -349,22 +353,28 @@ class PlexCharm(ops.CharmBase):
                     logger.debug("Plex server not ready for library reconciliation")
                     return
 
-                for provider in providers:
-                    for root_folder in provider.root_folders:
-                        if api.library_exists_for_path(root_folder):
-                            logger.debug("Library already exists for path: %s", root_folder)
-                            continue
-
-                        name = self._get_library_name(provider)
-                        library_type = self._get_library_type(provider.manager)
-
-                        logger.info(
-                            "Creating Plex library '%s' (%s) at %s",
-                            name,
-                            library_type,
-                            root_folder,
-                        )
-                        api.create_library(name, library_type, root_folder)
+                desired = [
+                    PlexLibrarySpec(
+                        name=self._get_library_name(provider),
+                        type=self._get_library_type(provider.manager),
+                        location=root_folder,
+                    )
+                    for provider in providers
+                    for root_folder in provider.root_folders
+                ]
+                # One section listing per reconcile, diffed against every root folder
+                missing = plan_missing_libraries(api.get_library_index(), desired)
+                if not missing:
+                    logger.debug("All %d Plex libraries already exist", len(desired))
+
+                for spec in missing:
+                    logger.info(
+                        "Creating Plex library '%s' (%s) at %s",
+                        spec.name,
+                        spec.type,
+                        spec.location,
+                    )
+                    api.create_library(spec.name, spec.type, spec.location)
 
         except PlexApiError as e:
             logger.warning("Failed to reconcile Plex libraries: %s", e)
@@ -436,8 +446,11 @@ class PlexCharm(ops.CharmBase):
         if not self._exporter_container.can_connect():
             return
         layer = self._build_exporter_layer(online_token)
-        self._exporter_container.add_layer(METRICS_SERVICE_NAME, layer, combine=True)
-        self._exporter_container.replan()
+        reconcile_layer(self._exporter_container, METRICS_SERVICE_NAME, layer)
+
+    def _build_exposition(self) -> list[MetricFamily]:
+        """Extra topology exposition: reconcile step timings."""
+        return self._profiler.build_metrics()
 
     def _reconcile(self, _: ops.EventBase) -> None:
         """Reconcile charm state with desired configuration.
@@ -453,25 +466,28 @@ class PlexCharm(ops.CharmBase):
         8. Configure Pebble layer with claim token (if unclaimed)
         9. Start workload
         """
-        self._topology.reconcile()
+        with self._profiler.step("topology"):
+            self._topology.reconcile()
         # The topology endpoint is a cluster-internal concern - crowsnest polls
         # it from inside the same K8s cluster. Hardcode the in-cluster Service
         # FQDN; never expose this URL externally.
-        self._crowsnest.publish_data(
+        self._publisher.publish(
+            "crowsnest",
             CrowsnestProviderData(
                 topology_url=(
                     f"http://{self.app.name}.{self.model.name}"
                     f".svc.cluster.local:{self._topology.port}/metrics"
                 )
-            )
+            ),
+            self._crowsnest.publish_data,
         )
 
         if not self.unit.is_leader():
             if self._container.can_connect():
-                self._container.add_layer(
+                reconcile_layer(
+                    self._container,
                     f"{CONTAINER_NAME}-check",
                     {"checks": self._build_readiness_check()},
-                    combine=True,
                 )
             return
 
@@ -482,7 +498,8 @@ class PlexCharm(ops.CharmBase):
                 self.app.name,
             )
 
-        self._configure_ingress()
+        with self._profiler.step("ingress"):
+            self._configure_ingress()
 
         if not self._container.can_connect():
             return
@@ -492,67 +509,82 @@ class PlexCharm(ops.CharmBase):
             return
 
         # Mount shared storage PVC
-        reconcile_storage_volume(
-            manager=self.k8s,
-            statefulset_name=self.app.name,
-            namespace=self.model.name,
-            container_name=CONTAINER_NAME,
-            pvc_name=storage.pvc_name,
-            mount_path=storage.mount_path,
-            pgid=storage.pgid,
-        )
+        with self._profiler.step("storage-volume"):
+            reconcile_storage_volume(
+                manager=self.statefulset,
+                statefulset_name=self.app.name,
+                namespace=self.model.name,
+                container_name=CONTAINER_NAME,
+                pvc_name=storage.pvc_name,
+                mount_path=storage.mount_path,
+                pgid=storage.pgid,
+            )
 
         # Reconcile hardware transcoding
-        self._reconcile_hardware_transcoding()
-
-        # Fix /config ownership (Juju storage mounts as root)
-        self._container.exec(["chown", "-R", f"{storage.puid}:{storage.pgid}", "/config"]).wait()
-
-        # Ensure Plex data directory exists
-        self._container.exec(
-            ["mkdir", "-p", PLEX_DATA_DIR],
-            user_id=storage.puid,
-            group_id=storage.pgid,
-        ).wait()
-
-        # Plex codecs require /run/plex-temp (created by s6-overlay in LinuxServer image)
-        self._container.exec(["mkdir", "-p", "/run/plex-temp"]).wait()
-        self._container.exec(["chown", f"{storage.puid}:{storage.pgid}", "/run/plex-temp"]).wait()
-
-        # Ensure user/group exist for Pebble's user-id/group-id
-        ensure_pebble_user(self._container, storage.puid, storage.pgid, username="plex")
-
-        # Configure Pebble layer and start service
-        layer = self._build_pebble_layer(storage.puid, storage.pgid)
-        self._container.add_layer(SERVICE_NAME, layer, combine=True)
-        self._container.replan()
-
-        # Claim server if token configured and server is unclaimed
-        if claim_token := self._get_claim_token():
-            self._claim_server(claim_token)
-
-        # Ensure internal URL is in custom connections for service discovery
-        self._ensure_internal_url()
+        with self._profiler.step("hardware-transcoding"):
+            self._reconcile_hardware_transcoding()
+
+        # Send the StatefulSet changes above as one patch, so the pod rolls at most once
+        with self._profiler.step("statefulset-patch"):
+            self._flush_statefulset()
+
+        with self._profiler.step("ownership"):
+            # Fix /config ownership (Juju storage mounts as root), only walking the tree on drift
+            reconcile_ownership(self._container, "/config", storage.puid, storage.pgid)
+
+            # Ensure Plex data directory exists
+            self._container.exec(
+                ["mkdir", "-p", PLEX_DATA_DIR],
+                user_id=storage.puid,
+                group_id=storage.pgid,
+            ).wait()
+
+            # Plex codecs require /run/plex-temp (created by s6-overlay in LinuxServer image)
+            self._container.exec(["mkdir", "-p", "/run/plex-temp"]).wait()
+            self._container.exec(
+                ["chown", f"{storage.puid}:{storage.pgid}", "/run/plex-temp"]
+            ).wait()
+
+        # Configure Pebble user and layer, (re)starting the service only if the plan changed
+        with self._profiler.step("pebble-layer"):
+            ensure_pebble_user(self._container, storage.puid, storage.pgid, username="plex")
+            layer = self._build_pebble_layer(storage.puid, storage.pgid)
+            reconcile_layer(self._container, SERVICE_NAME, layer)
+
+        with self._profiler.step("preferences"):
+            # Claim server if token configured and server is unclaimed
+            if claim_token := self._get_claim_token():
+                self._claim_server(claim_token)
+
+            # Ensure internal URL is in custom connections for service discovery
+            self._ensure_internal_url()
+
+            # Persist claim + custom connection edits in a single push
+            self._preferences.flush()
 
         # Reconcile plex-exporter sidecar - only after server is claimed
         # (exporter needs the online_token from Preferences.xml).
         if online_token := self._get_online_token():
-            self._reconcile_exporter(online_token)
+            with self._profiler.step("exporter"):
+                self._reconcile_exporter(online_token)
 
         self.unit.set_ports(WEBUI_PORT, self._topology.port)
 
         # Publish media-server data for request managers (Overseerr)
-        self._media_server.publish_data(
+        self._publisher.publish(
+            "media-server",
             MediaServerProviderData(
                 name=self.app.name,
                 api_url=self._internal_url,
-            )
+            ),
+            self._media_server.publish_data,
         )
 
         # Reconcile Plex libraries from media-manager relations (requires claimed server)
         online_token = self._get_online_token()
         if online_token:
-            self._reconcile_libraries(online_token)
+            with self._profiler.step("libraries"):
+                self._reconcile_libraries(online_token)
 
     def _on_force_reclaim_action(self, event: ops.ActionEvent) -> None:
         """Handle force-reclaim action to reclaim server with new account."""
@@ -562,6 +594,7 @@ class PlexCharm(ops.CharmBase):
             return
 
         success, message = self._claim_server(claim_token, force=True)
+        self._preferences.flush()
         if not success:
             event.fail(message)
 
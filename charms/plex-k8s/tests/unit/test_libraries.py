@@ -0,0 +1,50 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for indexed Plex library reconciliation."""
+
+from unittest.mock import MagicMock, patch
+
+from _plex import PlexApi, PlexLibrarySpec, plan_missing_libraries
+
+SECTIONS = b"""<MediaContainer size="2">
+  <Directory key="1" title="Movies" type="movie">
+    <Location id="1" path="/data/media/movies"/>
+  </Directory>
+  <Directory key="2" title="TV Shows" type="show">
+    <Location id="2" path="/data/media/tv/"/>
+  </Directory>
+</MediaContainer>"""
+
+
+def _api() -> PlexApi:
+    api = PlexApi("http://localhost:32400", "token")
+    api._client = MagicMock()
+    return api
+
+
+def test_index_lists_sections_once():
+    """The index maps every location to its section from one request."""
+    api = _api()
+    with patch.object(api, "_request", return_value=MagicMock(content=SECTIONS)) as request:
+        index = api.get_library_index()
+
+    request.assert_called_once_with("GET", "/library/sections")
+    assert index["/data/media/movies"].title == "Movies"
+    assert index["/data/media/tv"].key == "2"
+
+
+def test_plan_returns_only_missing_paths():
+    """Existing paths are skipped; duplicate desired paths collapse to one."""
+    api = _api()
+    with patch.object(api, "_request", return_value=MagicMock(content=SECTIONS)):
+        index = api.get_library_index()
+
+    desired = [
+        PlexLibrarySpec("Movies", "movie", "/data/media/movies/"),
+        PlexLibrarySpec("TV Shows", "show", "/data/media/tv"),
+        PlexLibrarySpec("Movies (4K)", "movie", "/data/media/movies-4k"),
+        PlexLibrarySpec("Movies (4K)", "movie", "/data/media/movies-4k"),
+    ]
+
+    assert plan_missing_libraries(index, desired) == [desired[2]]
@@ -0,0 +1,74 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the per-dispatch Preferences.xml model."""
+
+from io import StringIO
+from unittest.mock import MagicMock
+
+import ops
+
+from _plex import PlexPreferences
+
+PREFERENCES = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<Preferences ProcessedMachineIdentifier="abc123" '
+    'customConnections="http://a:32400"/>\n'
+)
+
+
+def _container(content: str | None = PREFERENCES) -> MagicMock:
+    container = MagicMock()
+    if content is None:
+        container.pull.side_effect = ops.pebble.PathError("not-found", "missing")
+    else:
+        container.pull.side_effect = lambda *_: StringIO(content)
+    return container
+
+
+def test_reads_are_served_from_a_single_pull():
+    """Accessors parse the file once per dispatch."""
+    container = _container()
+    prefs = PlexPreferences(container)
+
+    assert prefs.machine_identifier == "abc123"
+    assert prefs.online_token is None
+    assert prefs.custom_connections == ["http://a:32400"]
+    container.pull.assert_called_once()
+
+
+def test_edits_are_batched_into_one_push():
+    """Token and custom connection edits land in a single push."""
+    container = _container()
+    prefs = PlexPreferences(container)
+
+    prefs.set_online_token("tok")
+    assert prefs.add_custom_connection("http://b:32400")
+    assert prefs.flush()
+
+    container.push.assert_called_once()
+    pushed = container.push.call_args.args[1]
+    assert 'PlexOnlineToken="tok"' in pushed
+    assert 'customConnections="http://a:32400,http://b:32400"' in pushed
+    assert prefs.online_token == "tok"
+
+
+def test_flush_without_changes_skips_push():
+    """No write when nothing was staged or the URL is already present."""
+    container = _container()
+    prefs = PlexPreferences(container)
+
+    assert not prefs.add_custom_connection("http://a:32400")
+    assert not prefs.flush()
+    container.push.assert_not_called()
+
+
+def test_missing_file_is_retried():
+    """A missing file is not cached, so a later access sees it once written."""
+    container = _container(None)
+    prefs = PlexPreferences(container)
+
+    assert not prefs.exists
+    container.pull.side_effect = lambda *_: StringIO(PREFERENCES)
+    assert prefs.exists
+    assert container.pull.call_count == 2
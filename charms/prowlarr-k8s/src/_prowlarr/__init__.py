@@ -31,6 +31,13 @@ from _prowlarr._o11y import (
     SCRAPARR_ENV_DETAILED,
     SCRAPARR_ENV_URL,
 )
+from _prowlarr._pebble import LayerDiff, is_check_up, reconcile_layer
+from _prowlarr._profiler import ReconcileProfiler
+from _prowlarr._publish import RelationPublisher
+from _prowlarr._ready import WORKLOAD_READY_NOTICE, arm_ready_notice
+from _prowlarr._secrets import SecretCache
+from _prowlarr._session import ApiSessionPool, build_session_counters
+from _prowlarr._statefulset import StatefulSetBatch
 
 __all__ = [
     "API_KEY_SECRET_LABEL",
@@ -48,11 +55,22 @@ __all__ = [
     "SCRAPARR_ENV_URL",
     "SERVICE_NAME",
     "WEBUI_PORT",
+    "WORKLOAD_READY_NOTICE",
+    "ApiSessionPool",
     "FlareSolverrProxyConfig",
     "IndexerProxyResponse",
     "IndexerProxyType",
     "IndexerResponse",
+    "LayerDiff",
     "ProwlarrApiClient",
     "ProwlarrHostConfigResponse",
+    "ReconcileProfiler",
+    "RelationPublisher",
+    "SecretCache",
+    "StatefulSetBatch",
     "TagResponse",
+    "arm_ready_notice",
+    "build_session_counters",
+    "is_check_up",
+    "reconcile_layer",
 ]
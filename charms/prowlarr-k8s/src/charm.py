@@ -47,16 +47,27 @@ from _prowlarr import (
     SCRAPARR_ENV_URL,
     SERVICE_NAME,
     WEBUI_PORT,
+    WORKLOAD_READY_NOTICE,
+    ApiSessionPool,
     FlareSolverrProxyConfig,
     IndexerProxyType,
     ProwlarrApiClient,
+    ReconcileProfiler,
+    RelationPublisher,
+    SecretCache,
+    StatefulSetBatch,
+    arm_ready_notice,
+    build_session_counters,
+    is_check_up,
+    reconcile_layer,
 )
 from charmarr_lib.core import (
     ArrApiResponseError,
-    CharmarrTopology,
+    CharmarrChargedTopology,
     CharmarrTopologyRelation,
     K8sResourceManager,
     MediaIndexer,
+    MetricFamily,
     ensure_pebble_user,
     generate_api_key,
     get_secret_rotation_policy,
@@ -82,19 +93,29 @@ logger = logging.getLogger(__name__)
 class ProwlarrCharm(ops.CharmBase):
     """Prowlarr indexer manager charm."""
 
+    _stored = ops.StoredState()
+
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._secrets = SecretCache(self)
+        self._publisher = RelationPublisher(self)
+        self._profiler = ReconcileProfiler(self)
+        self._stored.set_default(api_sessions_opened=0, api_sessions_reused=0)
+        self._api_sessions = ApiSessionPool(ProwlarrApiClient)
         self._container = self.unit.get_container(CONTAINER_NAME)
+        self._workload_ready: bool | None = None
         self._scraparr_container = self.unit.get_container(METRICS_CONTAINER_NAME)
         self._k8s: K8sResourceManager | None = None
+        self._statefulset: StatefulSetBatch | None = None
 
-        self._topology = CharmarrTopology(
+        self._topology = CharmarrChargedTopology(
             self,
             relations=[
                 CharmarrTopologyRelation("flaresolverr", role="requires", required=False),
                 CharmarrTopologyRelation("vpn-gateway", role="requires", required=False),
                 CharmarrTopologyRelation("media-indexer", role="provides", required=False),
             ],
+            extra_exposition=self._build_exposition,
         )
         self._metrics_endpoint = MetricsEndpointProvider(
             self,
@@ -157,6 +178,8 @@ class ProwlarrCharm(ops.CharmBase):
         framework.observe(self.on.sync_indexers_action, self._on_sync_indexers_action)
         framework.observe(self._ingress.on.ready, self._reconcile)
         framework.observe(self._ingress.on.revoked, self._reconcile)
+        framework.observe(self.on[CONTAINER_NAME].pebble_custom_notice, self._on_workload_ready)
+        framework.observe(framework.on.pre_commit, self._on_pre_commit)
 
     @property
     def k8s(self) -> K8sResourceManager:
@@ -165,6 +188,18 @@ class ProwlarrCharm(ops.CharmBase):
             self._k8s = K8sResourceManager()
         return self._k8s
 
+    @property
+    def statefulset(self) -> K8sResourceManager:
+        """K8s manager that folds this hook's app StatefulSet patches into one."""
+        if self._statefulset is None:
+            self._statefulset = StatefulSetBatch(self.k8s, self.app.name, self.model.name)
+        return self._statefulset
+
+    def _flush_statefulset(self) -> None:
+        """Send this hook's folded app StatefulSet patch, if there is one."""
+        if self._statefulset is not None:
+            self._statefulset.flush()
+
     def _get_secret_id(self, secret: ops.Secret) -> str:
         """Get secret ID reliably (handles ops 2.x quirk with labeled secrets)."""
         if secret.id:
@@ -184,8 +219,8 @@ class ProwlarrCharm(ops.CharmBase):
     def _get_api_key_secret(self) -> tuple[str, str] | None:
         """Retrieve API key and secret ID from Juju Secret, or None if not yet created."""
         try:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            content = secret.get_content(refresh=True)
+            secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+            content = self._secrets.get_content(secret)
             return content["api-key"], self._get_secret_id(secret)
         except ops.SecretNotFoundError:
             return None
@@ -268,11 +303,15 @@ class ProwlarrCharm(ops.CharmBase):
     def _reconcile_vpn(self) -> None:
         """Reconcile VPN client-side patching based on gateway state."""
         if self.model.get_relation("vpn-gateway"):
-            self._vpn_gateway.publish_data(VPNGatewayRequirerData(instance_name=self.app.name))
+            self._publisher.publish(
+                "vpn-gateway",
+                VPNGatewayRequirerData(instance_name=self.app.name),
+                self._vpn_gateway.publish_data,
+            )
 
         gateway_data = self._vpn_gateway.get_gateway()
         reconcile_gateway_client(
-            manager=self.k8s,
+            manager=self.statefulset,
             statefulset_name=self.app.name,
             namespace=self.model.name,
             data=gateway_data,
@@ -280,24 +319,59 @@ class ProwlarrCharm(ops.CharmBase):
         )
 
     def _get_api_client(self, api_key: str) -> ProwlarrApiClient:
-        """Create authenticated API client for Prowlarr."""
+        """Get the hook-scoped, keep-alive API client for Prowlarr.
+
+        The client is shared by every reconcile step in this dispatch and
+        closed in _on_pre_commit, so callers must not close it themselves.
+        """
         url_base = self._get_url_base() or ""
         base_url = f"http://localhost:{WEBUI_PORT}{url_base}"
-        return ProwlarrApiClient(base_url, api_key)
+        return self._api_sessions.get(base_url, api_key)
+
+    def _on_pre_commit(self, _: ops.EventBase) -> None:
+        """Close pooled API clients and persist the connection counters."""
+        self._stored.api_sessions_opened += self._api_sessions.opened
+        self._stored.api_sessions_reused += self._api_sessions.reused
+        self._api_sessions.close()
+
+    def _build_exposition(self) -> list[MetricFamily]:
+        """Extra topology exposition: API counters and reconcile step timings."""
+        return [
+            *build_session_counters(
+                self._stored.api_sessions_opened + self._api_sessions.opened,
+                self._stored.api_sessions_reused + self._api_sessions.reused,
+            ),
+            *self._profiler.build_metrics(),
+        ]
 
     def _is_workload_ready(self, api_key: str) -> bool:
         """Check if Prowlarr workload is ready to accept API calls."""
         try:
-            with self._get_api_client(api_key) as api:
-                api.get_host_config()
-                return True
+            api = self._get_api_client(api_key)
+            api.get_host_config()
+            return True
         except Exception:
             return False
 
+    def _probe_workload_ready(self, api_key: str) -> bool:
+        """Probe the workload and remember the result for collect-status."""
+        self._workload_ready = self._is_workload_ready(api_key)
+        return self._workload_ready
+
+    def _observed_workload_ready(self) -> bool:
+        """Workload readiness for collect-status without another request to it.
+
+        Reuses this dispatch's probe from the reconcile if there was one, else
+        reads the state Pebble keeps for the ready check.
+        """
+        if self._workload_ready is not None:
+            return self._workload_ready
+        return is_check_up(self._container, f"{CONTAINER_NAME}-ready")
+
     def _get_secret_content(self, secret_id: str) -> dict[str, str]:
         """Retrieve secret content by ID for reconcilers."""
-        secret = self.model.get_secret(id=secret_id)
-        return secret.get_content(refresh=True)
+        secret = self._secrets.get(id=secret_id)
+        return self._secrets.get_content(secret)
 
     def _reconcile_media_managers(self, api_key: str, secret_id: str) -> None:
         """Reconcile media manager connections in Prowlarr."""
@@ -305,13 +379,13 @@ class ProwlarrCharm(ops.CharmBase):
         if not requirers:
             return
 
-        with self._get_api_client(api_key) as api:
-            reconcile_media_manager_connections(
-                api_client=api,
-                desired_managers=requirers,
-                indexer_url=self._internal_url,
-                get_secret=self._get_secret_content,
-            )
+        api = self._get_api_client(api_key)
+        reconcile_media_manager_connections(
+            api_client=api,
+            desired_managers=requirers,
+            indexer_url=self._internal_url,
+            get_secret=self._get_secret_content,
+        )
 
     def _configure_flaresolverr_proxy(self, api: ProwlarrApiClient, url: str, tag_id: int) -> None:
         """Configure FlareSolverr proxy in Prowlarr."""
@@ -374,36 +448,36 @@ class ProwlarrCharm(ops.CharmBase):
             # fires first - without labels, Istio blocks traffic to FlareSolverr.
             self._service_mesh._update_labels(None)
 
-        with self._get_api_client(api_key) as api:
-            tag = api.get_or_create_tag("flaresolverr")
-            try:
-                self._configure_flaresolverr_proxy(api, flaresolverr_data.url, tag.id)
-            except Exception as e:
-                # FlareSolverr may be behind service mesh. If we're not on mesh yet,
-                # skip config - it will succeed once mesh relation is established.
-                if not self._service_mesh.mesh_type():
-                    logger.info("FlareSolverr unreachable, waiting for mesh: %s", e)
-                    return
-                raise
+        api = self._get_api_client(api_key)
+        tag = api.get_or_create_tag("flaresolverr")
+        try:
+            self._configure_flaresolverr_proxy(api, flaresolverr_data.url, tag.id)
+        except Exception as e:
+            # FlareSolverr may be behind service mesh. If we're not on mesh yet,
+            # skip config - it will succeed once mesh relation is established.
+            if not self._service_mesh.mesh_type():
+                logger.info("FlareSolverr unreachable, waiting for mesh: %s", e)
+                return
+            raise
 
     def _remove_flaresolverr_proxy(self, api_key: str) -> None:
         """Remove FlareSolverr proxy if it exists."""
-        with self._get_api_client(api_key) as api:
-            existing = api.get_indexer_proxies()
-            proxy = next(
-                (p for p in existing if p.implementation == IndexerProxyType.FLARESOLVERR),
-                None,
-            )
-            if proxy:
-                api.delete_indexer_proxy(proxy.id)
-                logger.info("Removed FlareSolverr proxy (relation removed)")
+        api = self._get_api_client(api_key)
+        existing = api.get_indexer_proxies()
+        proxy = next(
+            (p for p in existing if p.implementation == IndexerProxyType.FLARESOLVERR),
+            None,
+        )
+        if proxy:
+            api.delete_indexer_proxy(proxy.id)
+            logger.info("Removed FlareSolverr proxy (relation removed)")
 
     def _publish_media_indexer(self, api_key: str, secret_id: str) -> None:
         """Publish media indexer data to all connected media managers."""
-        secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
+        secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
         for relation in self.model.relations.get("media-indexer", []):
             if relation.app:
-                secret.grant(relation)
+                self._publisher.grant(secret, relation)
 
         data = MediaIndexerProviderData(
             api_url=self._internal_url,
@@ -411,7 +485,7 @@ class ProwlarrCharm(ops.CharmBase):
             indexer=MediaIndexer.PROWLARR,
             base_path=self._get_url_base(),
         )
-        self._media_indexer.publish_data(data)
+        self._publisher.publish("media-indexer", data, self._media_indexer.publish_data)
         logger.info("Published media indexer provider data")
 
     def _configure_ingress(self) -> None:
@@ -454,7 +528,7 @@ class ProwlarrCharm(ops.CharmBase):
             return
 
         new_api_key = generate_api_key()
-        event.secret.set_content({"api-key": new_api_key})
+        self._secrets.set_content(event.secret, {"api-key": new_api_key})
         logger.info("Rotated API key secret")
 
         if not self._container.can_connect():
@@ -499,8 +573,7 @@ class ProwlarrCharm(ops.CharmBase):
         if not self._scraparr_container.can_connect():
             return
         layer = self._build_scraparr_layer(api_key)
-        self._scraparr_container.add_layer(METRICS_SERVICE_NAME, layer, combine=True)
-        self._scraparr_container.replan()
+        reconcile_layer(self._scraparr_container, METRICS_SERVICE_NAME, layer)
 
     def _reconcile_non_leader(self) -> None:
         """Configure non-leader units with readiness check only.
@@ -509,10 +582,10 @@ class ProwlarrCharm(ops.CharmBase):
         the readiness check registered for Kubernetes health probes.
         """
         if self._container.can_connect():
-            self._container.add_layer(
+            reconcile_layer(
+                self._container,
                 f"{CONTAINER_NAME}-check",
                 {"checks": self._build_readiness_check()},
-                combine=True,
             )
 
     def _reconcile_pebble_workload(self) -> None:
@@ -528,11 +601,24 @@ class ProwlarrCharm(ops.CharmBase):
         self._container.exec(["chown", "-R", f"{DEFAULT_PUID}:{DEFAULT_PGID}", "/config"]).wait()
 
         layer = self._build_pebble_layer()
-        self._container.add_layer(SERVICE_NAME, layer, combine=True)
-        self._container.replan()
+        reconcile_layer(self._container, SERVICE_NAME, layer)
 
         self.unit.set_ports(WEBUI_PORT, self._topology.port)
 
+    def _on_workload_ready(self, event: ops.PebbleCustomNoticeEvent) -> None:
+        """Run the workload-dependent steps as soon as the workload answers.
+
+        The ready check recovering needs no handler here: pebble-check-recovered
+        is already one of the reconcilable events.
+        """
+        if event.notice.key == WORKLOAD_READY_NOTICE:
+            self._reconcile(event)
+
+    def _arm_ready_notice(self) -> None:
+        """Have Pebble notify the charm once the workload answers its readiness URL."""
+        check = self._build_readiness_check()[f"{CONTAINER_NAME}-ready"]
+        arm_ready_notice(self._container, check["http"]["url"])
+
     def _reconcile(self, _: ops.EventBase) -> None:
         """Reconcile charm state with desired configuration.
 
@@ -542,17 +628,20 @@ class ProwlarrCharm(ops.CharmBase):
         3. Submit ingress route config (if ingress relation exists)
         4. Leader unit: full reconciliation of workload and integrations
         """
-        self._topology.reconcile()
+        with self._profiler.step("topology"):
+            self._topology.reconcile()
         # The topology endpoint is a cluster-internal concern - crowsnest polls
         # it from inside the same K8s cluster. Hardcode the in-cluster Service
         # FQDN; never expose this URL externally.
-        self._crowsnest.publish_data(
+        self._publisher.publish(
+            "crowsnest",
             CrowsnestProviderData(
                 topology_url=(
                     f"http://{self.app.name}.{self.model.name}"
                     f".svc.cluster.local:{self._topology.port}/metrics"
                 )
-            )
+            ),
+            self._crowsnest.publish_data,
         )
 
         if not self.unit.is_leader():
@@ -566,31 +655,47 @@ class ProwlarrCharm(ops.CharmBase):
                 self.app.name,
             )
 
-        self._configure_ingress()
+        with self._profiler.step("ingress"):
+            self._configure_ingress()
 
         if not self._container.can_connect():
             return
 
-        secret_data = self._get_api_key_secret()
-        if secret_data:
-            api_key, secret_id = secret_data
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            sync_secret_rotation_policy(
-                secret, str(self.config.get("api-key-rotation", "disabled"))
-            )
+        with self._profiler.step("api-key"):
+            secret_data = self._get_api_key_secret()
+            if secret_data:
+                api_key, secret_id = secret_data
+                secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+                sync_secret_rotation_policy(
+                    secret, str(self.config.get("api-key-rotation", "disabled"))
+                )
+            else:
+                api_key = generate_api_key()
+                secret_id = self._create_api_key_secret(api_key)
+
+        with self._profiler.step("publish-media-indexer"):
+            self._publish_media_indexer(api_key, secret_id)
+        with self._profiler.step("config"):
+            self._reconcile_config(api_key)
+        with self._profiler.step("vpn"):
+            self._reconcile_vpn()
+
+        # Send the StatefulSet changes above as one patch, so the pod rolls at most once
+        with self._profiler.step("statefulset-patch"):
+            self._flush_statefulset()
+        with self._profiler.step("pebble-layer"):
+            self._reconcile_pebble_workload()
+        with self._profiler.step("scraparr"):
+            self._reconcile_scraparr(api_key)
+
+        if self._probe_workload_ready(api_key):
+            with self._profiler.step("flaresolverr"):
+                self._reconcile_flaresolverr(api_key)
+            with self._profiler.step("media-managers"):
+                self._reconcile_media_managers(api_key, secret_id)
         else:
-            api_key = generate_api_key()
-            secret_id = self._create_api_key_secret(api_key)
-
-        self._publish_media_indexer(api_key, secret_id)
-        self._reconcile_config(api_key)
-        self._reconcile_vpn()
-        self._reconcile_pebble_workload()
-        self._reconcile_scraparr(api_key)
-
-        if self._is_workload_ready(api_key):
-            self._reconcile_flaresolverr(api_key)
-            self._reconcile_media_managers(api_key, secret_id)
+            # Still booting: have Pebble notify the charm once it answers
+            self._arm_ready_notice()
 
     def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
         """Collect all unit statuses. Framework picks the worst."""
@@ -634,12 +739,10 @@ class ProwlarrCharm(ops.CharmBase):
         if not self._container.can_connect():
             return
 
-        secret_data = self._get_api_key_secret()
-        if not secret_data:
+        if not self._get_api_key_secret():
             return
 
-        api_key, _ = secret_data
-        if not self._is_workload_ready(api_key):
+        if not self._observed_workload_ready():
             event.add_status(ops.WaitingStatus("Waiting for workload"))
         else:
             event.add_status(ops.ActiveStatus())
@@ -658,8 +761,8 @@ class ProwlarrCharm(ops.CharmBase):
         self._reconcile_config(new_api_key)
 
         try:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            secret.set_content({"api-key": new_api_key})
+            secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+            self._secrets.set_content(secret, {"api-key": new_api_key})
             logger.info("Rotated API key via action")
         except ops.SecretNotFoundError:
             self._create_api_key_secret(new_api_key)
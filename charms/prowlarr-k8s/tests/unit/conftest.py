@@ -6,6 +6,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from ops.pebble import Layer
 from ops.testing import Container, Context, Exec
 
 from charm import ProwlarrCharm
@@ -16,6 +17,24 @@ PROWLARR_CONTAINER = Container(
     execs={Exec(["chown", "-R", "1000:1000", "/config"])},
 )
 
+# The ready check as the charm layers it; Scenario only accepts a CheckInfo
+# that matches a check in the container's plan
+PROWLARR_READY_LAYER = Layer(
+    {
+        "checks": {
+            "prowlarr-ready": {
+                "override": "replace",
+                "level": "ready",
+                "http": {"url": "http://localhost:9696/ping"},
+                "period": "10s",
+                "timeout": "3s",
+                "threshold": 3,
+                "startup": "enabled",
+            }
+        }
+    }
+)
+
 SCRAPARR_CONTAINER = Container(name="scraparr", can_connect=True)
 
 
@@ -258,8 +258,6 @@ def _mock_api_with_proxy():
         )
     ]
     mock_api.get_or_create_tag.return_value = TagResponse(id=1, label="flaresolverr")
-    mock_api.__enter__ = MagicMock(return_value=mock_api)
-    mock_api.__exit__ = MagicMock(return_value=False)
     return mock_api
 
 
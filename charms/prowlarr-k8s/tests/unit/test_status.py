@@ -3,12 +3,13 @@
 
 """Unit tests for ProwlarrCharm status collection."""
 
+import dataclasses
 from unittest.mock import patch
 
 import ops
-from ops.testing import Container, Secret, State
+from ops.testing import CheckInfo, Container, Secret, State
 
-from .conftest import PROWLARR_CONTAINER, SCRAPARR_CONTAINER
+from .conftest import PROWLARR_CONTAINER, PROWLARR_READY_LAYER, SCRAPARR_CONTAINER
 
 
 def test_status_waiting_for_pebble(ctx, mock_k8s):
@@ -60,7 +61,12 @@ def test_status_waiting_for_workload(ctx, mock_k8s):
 
 
 def test_status_active_when_ready(ctx, mock_k8s):
-    """Status is active when workload is ready."""
+    """Status is active when the Pebble ready check passes, without probing the workload."""
+    container = dataclasses.replace(
+        PROWLARR_CONTAINER,
+        layers={"prowlarr": PROWLARR_READY_LAYER},
+        check_infos={CheckInfo("prowlarr-ready", level=ops.pebble.CheckLevel.READY)},
+    )
     api_key_secret = Secret(
         label="api-key",
         tracked_content={"api-key": "testkey123456789012345678901234"},
@@ -68,19 +74,20 @@ def test_status_active_when_ready(ctx, mock_k8s):
     )
 
     with (
-        patch("charm.ProwlarrCharm._is_workload_ready", return_value=True),
+        patch("charm.ProwlarrCharm._is_workload_ready") as probe,
         patch("charm.reconcile_gateway_client"),
     ):
         state = ctx.run(
             ctx.on.collect_unit_status(),
             State(
                 leader=True,
-                containers=[PROWLARR_CONTAINER, SCRAPARR_CONTAINER],
+                containers=[container, SCRAPARR_CONTAINER],
                 secrets=[api_key_secret],
             ),
         )
 
     assert state.unit_status == ops.ActiveStatus()
+    probe.assert_not_called()
 
 
 def test_status_non_leader_standby(ctx, mock_k8s):
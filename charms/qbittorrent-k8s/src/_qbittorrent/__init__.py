@@ -11,12 +11,16 @@ from _qbittorrent._constants import (
     DEFAULT_USERNAME,
     HEALTH_CHECK_URL,
     SERVICE_NAME,
+    SESSION_CACHE_FILE,
     WEBUI_PORT,
 )
 from _qbittorrent._credentials import (
     compute_pbkdf2_hash,
     generate_password,
+    get_password_hash,
     reconcile_qbittorrent_config,
+    resolve_password_hash,
+    verify_pbkdf2_hash,
 )
 from _qbittorrent._o11y import (
     EXPORTER_COMMAND,
@@ -29,6 +33,13 @@ from _qbittorrent._o11y import (
     METRICS_PORT,
     METRICS_SERVICE_NAME,
 )
+from _qbittorrent._ownership import reconcile_ownership
+from _qbittorrent._pebble import LayerDiff, is_check_up, reconcile_layer
+from _qbittorrent._profiler import ReconcileProfiler
+from _qbittorrent._publish import RelationPublisher
+from _qbittorrent._ready import WORKLOAD_READY_NOTICE, arm_ready_notice
+from _qbittorrent._secrets import SecretCache
+from _qbittorrent._statefulset import StatefulSetBatch
 
 __all__ = [
     "CONFIG_FILE",
@@ -46,10 +57,24 @@ __all__ = [
     "METRICS_PORT",
     "METRICS_SERVICE_NAME",
     "SERVICE_NAME",
+    "SESSION_CACHE_FILE",
     "WEBUI_PORT",
+    "WORKLOAD_READY_NOTICE",
+    "LayerDiff",
     "QBittorrentApi",
     "QBittorrentApiError",
+    "ReconcileProfiler",
+    "RelationPublisher",
+    "SecretCache",
+    "StatefulSetBatch",
+    "arm_ready_notice",
     "compute_pbkdf2_hash",
     "generate_password",
+    "get_password_hash",
+    "is_check_up",
+    "reconcile_layer",
+    "reconcile_ownership",
     "reconcile_qbittorrent_config",
+    "resolve_password_hash",
+    "verify_pbkdf2_hash",
 ]
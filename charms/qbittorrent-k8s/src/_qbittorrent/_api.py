@@ -4,10 +4,15 @@
 """qBittorrent WebUI API client."""
 
 import json
+import logging
+import os
+from pathlib import Path
 
 import httpx
 
-from _qbittorrent._constants import API_BASE_PATH
+from _qbittorrent._constants import API_BASE_PATH, SESSION_COOKIE
+
+logger = logging.getLogger(__name__)
 
 
 class QBittorrentApiError(Exception):
@@ -19,43 +24,117 @@ class QBittorrentApi:
 
     Uses cookie-based session authentication. Call authenticate() before
     making other API calls.
+
+    With a session_file and a credentials revision, the SID cookie is
+    cached there keyed by the base URL and that revision, so later clients
+    (in the same or a later hook) skip /auth/login. Nothing derived from the
+    password is written. A rotated secret changes the key and forces a
+    fresh login; requests rejected with 403 re-authenticate once and retry.
     """
 
-    def __init__(self, base_url: str, timeout: float = 10.0) -> None:
+    def __init__(
+        self, base_url: str, timeout: float = 10.0, session_file: Path | None = None
+    ) -> None:
         self._base_url = base_url.rstrip("/")
         self._client = httpx.Client(timeout=timeout)
+        self._session_file = session_file
+        self._credentials: tuple[str, str] | None = None
+        self._revision = ""
 
     def _url(self, path: str) -> str:
         """Build full API URL for given path."""
         return f"{self._base_url}{API_BASE_PATH}{path}"
 
-    def authenticate(self, username: str, password: str) -> None:
-        """Authenticate and store session cookie."""
+    def authenticate(self, username: str, password: str, revision: str = "") -> None:
+        """Authenticate, reusing a cached session cookie when one matches.
+
+        Args:
+            username: WebUI username.
+            password: WebUI password.
+            revision: Identifies the credentials without deriving from them
+                (the credentials secret ID and revision); "" never caches.
+        """
+        self._credentials = (username, password)
+        self._revision = revision
+        sid = self._load_session()
+        if sid:
+            self._client.cookies.set(SESSION_COOKIE, sid)
+            return
+        self._login()
+
+    def _login(self) -> None:
+        """POST /auth/login and cache the resulting session cookie."""
+        if self._credentials is None:
+            raise QBittorrentApiError("No credentials to authenticate with")
+        username, password = self._credentials
         response = self._client.post(
             self._url("/auth/login"),
             data={"username": username, "password": password},
         )
         if response.status_code != 200 or response.text != "Ok.":
             raise QBittorrentApiError(f"Authentication failed: {response.text}")
+        self._save_session()
+
+    def _session_key(self) -> str:
+        """Key identifying the credentials a cached SID belongs to."""
+        return f"{self._base_url} {self._revision}"
+
+    def _load_session(self) -> str | None:
+        """Return the cached SID if it was issued for the current credentials."""
+        if self._session_file is None or not self._revision:
+            return None
+        try:
+            data = json.loads(self._session_file.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != self._session_key():
+            return None
+        sid = data.get("sid")
+        return sid if isinstance(sid, str) and sid else None
+
+    def _save_session(self) -> None:
+        """Cache the current SID, readable by the charm user only."""
+        if self._session_file is None or not self._revision:
+            return
+        sid = self._client.cookies.get(SESSION_COOKIE)
+        if not sid:
+            return
+        try:
+            fd = os.open(self._session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"key": self._session_key(), "sid": sid}, f)
+        except OSError as e:
+            logger.debug("Failed to cache qBittorrent session: %s", e)
+
+    def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a request, re-authenticating once if the session was rejected."""
+        response = self._client.request(method, self._url(path), **kwargs)
+        if response.status_code == 403 and self._credentials is not None:
+            logger.debug("qBittorrent session rejected, re-authenticating")
+            self._login()
+            response = self._client.request(method, self._url(path), **kwargs)
+        return response
 
     def get_version(self) -> str:
         """Get qBittorrent version (health check)."""
-        response = self._client.get(self._url("/app/version"))
+        response = self._request("GET", "/app/version")
         response.raise_for_status()
         return response.text
 
     def set_preferences(self, prefs: dict) -> None:
         """Set application preferences."""
-        response = self._client.post(
-            self._url("/app/setPreferences"),
+        response = self._request(
+            "POST",
+            "/app/setPreferences",
             data={"json": json.dumps(prefs)},
         )
         response.raise_for_status()
 
     def create_category(self, name: str, save_path: str) -> None:
         """Create a category with save path."""
-        response = self._client.post(
-            self._url("/torrents/createCategory"),
+        response = self._request(
+            "POST",
+            "/torrents/createCategory",
             data={"category": name, "savePath": save_path},
         )
         if response.status_code == 409:
@@ -16,5 +16,10 @@ CREDENTIALS_SECRET_LABEL = "credentials"
 WEBUI_PORT = 8080
 API_BASE_PATH = "/api/v2"
 
+# WebUI session cookie, cached on the charm container's tmpfs so it survives
+# across hooks but not pod restarts
+SESSION_COOKIE = "SID"
+SESSION_CACHE_FILE = "/dev/shm/qbittorrent-webui-session.json"
+
 SERVICE_NAME = "qbittorrent"
 HEALTH_CHECK_URL = f"http://localhost:{WEBUI_PORT}{API_BASE_PATH}/app/version"
@@ -9,15 +9,27 @@ qBittorrent stores WebUI credentials in qBittorrent.conf as PBKDF2-SHA512 hash:
 Where:
 - SALT: 16 random bytes, base64 encoded
 - HASH: PBKDF2-SHA512(password, salt, iterations=100000), base64 encoded
+
+Hashing is deliberately expensive and salted, so a fresh hash never equals
+the one on disk. The reconciler keeps the existing hash when it verifies
+against the password, and remembers which credentials secret revision it
+verified the hash for, so later hooks skip the PBKDF2 work entirely. The
+marker never derives from the password, so it is no cheaper to attack than
+the hash itself.
 """
 
 import base64
+import binascii
 import hashlib
+import hmac
 import re
 import secrets
 
 from _qbittorrent._constants import PASSWORD_BYTES, PBKDF2_ITERATIONS, SALT_BYTES
 
+_PASSWORD_HASH_KEY = "WebUI\\Password_PBKDF2"
+_BYTE_ARRAY = re.compile(r'"?@ByteArray\(([A-Za-z0-9+/=]+):([A-Za-z0-9+/=]+)\)"?')
+
 
 def generate_password(length: int = PASSWORD_BYTES) -> str:
     """Generate a cryptographically secure password."""
@@ -42,6 +54,55 @@ def compute_pbkdf2_hash(password: str) -> str:
     return f"@ByteArray({salt_b64}:{hash_b64})"
 
 
+def verify_pbkdf2_hash(password: str, password_hash: str) -> bool:
+    """Check a password against a "@ByteArray(SALT_B64:HASH_B64)" value."""
+    match = _BYTE_ARRAY.fullmatch(password_hash.strip())
+    if not match:
+        return False
+    try:
+        salt = base64.b64decode(match.group(1), validate=True)
+        expected = base64.b64decode(match.group(2), validate=True)
+    except binascii.Error:
+        return False
+    actual = hashlib.pbkdf2_hmac("sha512", password.encode("utf-8"), salt, PBKDF2_ITERATIONS)
+    return hmac.compare_digest(actual, expected)
+
+
+def get_password_hash(content: str | None) -> str | None:
+    """Read the raw WebUI\\Password_PBKDF2 value from qBittorrent.conf, if any."""
+    if not content:
+        return None
+    match = re.search(rf"^{re.escape(_PASSWORD_HASH_KEY)}=(.*)$", content, re.MULTILINE)
+    return match.group(1).strip() if match else None
+
+
+def resolve_password_hash(
+    content: str | None, password: str, revision: str = "", verified: str = ""
+) -> tuple[str, str]:
+    """Pick the password hash to write, reusing the existing one when valid.
+
+    Args:
+        content: Current qBittorrent.conf, or None if not written yet.
+        password: WebUI password from the credentials secret.
+        revision: Identifies the password without deriving from it (the
+            credentials secret ID and revision); "" always re-verifies.
+        verified: Marker returned by a previous call, if any.
+
+    Returns:
+        Tuple of (password_hash, marker). Persist the marker and pass it
+        back as verified to skip re-verification while neither the secret
+        revision nor the on-disk hash changes.
+    """
+    existing = get_password_hash(content)
+    if existing:
+        marker = f"{revision}\0{existing}" if revision else ""
+        if (marker and marker == verified) or verify_pbkdf2_hash(password, existing):
+            return existing, marker
+
+    password_hash = compute_pbkdf2_hash(password)
+    return password_hash, f"{revision}\0{password_hash}" if revision else ""
+
+
 def build_qbittorrent_config(username: str, password_hash: str) -> str:
     """Build minimal qBittorrent.conf with WebUI credentials.
 
@@ -5,6 +5,7 @@
 """qBittorrent Charm."""
 
 import logging
+from pathlib import Path
 from typing import NamedTuple
 
 import ops
@@ -53,11 +54,21 @@ from _qbittorrent import (
     METRICS_PORT,
     METRICS_SERVICE_NAME,
     SERVICE_NAME,
+    SESSION_CACHE_FILE,
     WEBUI_PORT,
+    WORKLOAD_READY_NOTICE,
     QBittorrentApi,
-    compute_pbkdf2_hash,
+    ReconcileProfiler,
+    RelationPublisher,
+    SecretCache,
+    StatefulSetBatch,
+    arm_ready_notice,
     generate_password,
+    is_check_up,
+    reconcile_layer,
+    reconcile_ownership,
     reconcile_qbittorrent_config,
+    resolve_password_hash,
 )
 from charmarr_lib.core import (
     CharmarrChargedTopology,
@@ -89,21 +100,34 @@ logger = logging.getLogger(__name__)
 
 
 class Credentials(NamedTuple):
-    """WebUI credentials."""
+    """WebUI credentials.
+
+    revision is "<secret id>/<revision>" of the secret they were read from,
+    or "" when unknown (just created or rotated in this hook).
+    """
 
     username: str
     password: str
     secret_id: str
+    revision: str = ""
 
 
 class QBittorrentCharm(ops.CharmBase):
     """qBittorrent download client charm."""
 
+    _stored = ops.StoredState()
+
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._secrets = SecretCache(self)
+        self._publisher = RelationPublisher(self)
+        self._profiler = ReconcileProfiler(self)
+        self._stored.set_default(password_hash_verified="")
         self._container = self.unit.get_container(CONTAINER_NAME)
+        self._workload_ready: bool | None = None
         self._exporter_container = self.unit.get_container(METRICS_CONTAINER_NAME)
         self._k8s: K8sResourceManager | None = None
+        self._statefulset: StatefulSetBatch | None = None
 
         self._topology = CharmarrChargedTopology(
             self,
@@ -173,6 +197,7 @@ class QBittorrentCharm(ops.CharmBase):
         framework.observe(self.on.secret_rotate, self._on_secret_rotate)
         framework.observe(self._ingress.on.ready, self._reconcile)
         framework.observe(self._ingress.on.revoked, self._reconcile)
+        framework.observe(self.on[CONTAINER_NAME].pebble_custom_notice, self._on_workload_ready)
 
     @property
     def k8s(self) -> K8sResourceManager:
@@ -181,6 +206,18 @@ class QBittorrentCharm(ops.CharmBase):
             self._k8s = K8sResourceManager()
         return self._k8s
 
+    @property
+    def statefulset(self) -> K8sResourceManager:
+        """K8s manager that folds this hook's app StatefulSet patches into one."""
+        if self._statefulset is None:
+            self._statefulset = StatefulSetBatch(self.k8s, self.app.name, self.model.name)
+        return self._statefulset
+
+    def _flush_statefulset(self) -> None:
+        """Send this hook's folded app StatefulSet patch, if there is one."""
+        if self._statefulset is not None:
+            self._statefulset.flush()
+
     @property
     def _internal_url(self) -> str:
         """Internal K8s service URL for cross-namespace communication."""
@@ -195,16 +232,25 @@ class QBittorrentCharm(ops.CharmBase):
     def _get_credentials(self) -> Credentials | None:
         """Retrieve credentials from Juju Secret, or None if not yet created."""
         try:
-            secret = self.model.get_secret(label=CREDENTIALS_SECRET_LABEL)
-            content = secret.get_content(refresh=True)
+            secret = self._secrets.get(label=CREDENTIALS_SECRET_LABEL)
+            content = self._secrets.get_content(secret)
             return Credentials(
                 username=content["username"],
                 password=content["password"],
                 secret_id=self._get_secret_id(secret),
+                revision=self._get_secret_revision(secret),
             )
         except ops.SecretNotFoundError:
             return None
 
+    def _get_secret_revision(self, secret: ops.Secret) -> str:
+        """The app secret's "<id>/<revision>", or "" if this unit cannot see it."""
+        try:
+            info = secret.get_info()
+        except (ops.SecretNotFoundError, ops.ModelError):
+            return ""
+        return f"{info.id}/{info.revision}"
+
     def _create_credentials(self) -> Credentials:
         """Generate and store new credentials in Juju Secret."""
         username = DEFAULT_USERNAME
@@ -230,7 +276,14 @@ class QBittorrentCharm(ops.CharmBase):
         if self._container.exists(CONFIG_FILE):
             content = self._container.pull(CONFIG_FILE).read()
 
-        password_hash = compute_pbkdf2_hash(credentials.password)
+        # Keep the on-disk hash when it still matches; a fresh salt would
+        # rewrite qBittorrent.conf on every hook
+        password_hash, self._stored.password_hash_verified = resolve_password_hash(
+            content,
+            credentials.password,
+            credentials.revision,
+            self._stored.password_hash_verified,
+        )
         updated = reconcile_qbittorrent_config(
             content,
             username=credentials.username,
@@ -242,7 +295,7 @@ class QBittorrentCharm(ops.CharmBase):
             logger.info("Reconciled qBittorrent config")
 
     def _prepare_config_directory(self, puid: int, pgid: int) -> None:
-        self._container.exec(["chown", "-R", f"{puid}:{pgid}", "/config/qBittorrent"]).wait()
+        reconcile_ownership(self._container, "/config/qBittorrent", puid, pgid)
 
     def _is_service_running(self) -> bool:
         services = self._container.get_services(SERVICE_NAME)
@@ -282,11 +335,15 @@ class QBittorrentCharm(ops.CharmBase):
     def _reconcile_vpn(self) -> None:
         """Reconcile VPN client-side patching based on gateway state."""
         if self.model.get_relation("vpn-gateway"):
-            self._vpn_gateway.publish_data(VPNGatewayRequirerData(instance_name=self.app.name))
+            self._publisher.publish(
+                "vpn-gateway",
+                VPNGatewayRequirerData(instance_name=self.app.name),
+                self._vpn_gateway.publish_data,
+            )
 
         gateway_data = self._vpn_gateway.get_gateway()
         reconcile_gateway_client(
-            manager=self.k8s,
+            manager=self.statefulset,
             statefulset_name=self.app.name,
             namespace=self.model.name,
             data=gateway_data,
@@ -294,9 +351,16 @@ class QBittorrentCharm(ops.CharmBase):
         )
 
     def _get_api_client(self, credentials: Credentials) -> QBittorrentApi:
-        """Create authenticated API client for qBittorrent WebUI."""
-        api = QBittorrentApi(f"http://localhost:{WEBUI_PORT}")
-        api.authenticate(credentials.username, credentials.password)
+        """Create authenticated API client for qBittorrent WebUI.
+
+        Reuses the SID cached by an earlier client when the credentials
+        secret revision is unchanged, so most calls skip the /auth/login
+        round-trip.
+        """
+        api = QBittorrentApi(
+            f"http://localhost:{WEBUI_PORT}", session_file=Path(SESSION_CACHE_FILE)
+        )
+        api.authenticate(credentials.username, credentials.password, credentials.revision)
         return api
 
     def _is_workload_ready(self, credentials: Credentials) -> bool:
@@ -308,6 +372,21 @@ class QBittorrentCharm(ops.CharmBase):
         except Exception:
             return False
 
+    def _probe_workload_ready(self, credentials: Credentials) -> bool:
+        """Probe the workload and remember the result for collect-status."""
+        self._workload_ready = self._is_workload_ready(credentials)
+        return self._workload_ready
+
+    def _observed_workload_ready(self) -> bool:
+        """Workload readiness for collect-status without another request to it.
+
+        Reuses this dispatch's probe from the reconcile if there was one, else
+        reads the state Pebble keeps for the ready check.
+        """
+        if self._workload_ready is not None:
+            return self._workload_ready
+        return is_check_up(self._container, f"{CONTAINER_NAME}-ready")
+
     def _configure_app(self, credentials: Credentials) -> None:
         """Apply Trash Guides recommended settings via API."""
         with self._get_api_client(credentials) as api:
@@ -348,10 +427,10 @@ class QBittorrentCharm(ops.CharmBase):
         Grants the credentials secret to each related app and publishes
         the DownloadClientProviderData with the secret ID.
         """
-        secret = self.model.get_secret(label=CREDENTIALS_SECRET_LABEL)
+        secret = self._secrets.get(label=CREDENTIALS_SECRET_LABEL)
         for relation in self.model.relations.get("download-client", []):
             if relation.app:
-                secret.grant(relation)
+                self._publisher.grant(secret, relation)
 
         data = DownloadClientProviderData(
             api_url=self._internal_url,
@@ -361,7 +440,7 @@ class QBittorrentCharm(ops.CharmBase):
             instance_name=self.app.name,
         )
         # NOTE: We intentionally don't publish the base path as qBittorrent serves endpoints at root.
-        self._download_client.publish_data(data)
+        self._publisher.publish("download-client", data, self._download_client.publish_data)
         logger.info("Published download client provider data")
 
     def _configure_ingress(self) -> None:
@@ -439,7 +518,9 @@ class QBittorrentCharm(ops.CharmBase):
             return
 
         new_password = generate_password()
-        event.secret.set_content({"username": DEFAULT_USERNAME, "password": new_password})
+        self._secrets.set_content(
+            event.secret, {"username": DEFAULT_USERNAME, "password": new_password}
+        )
         logger.info("Rotated credentials secret")
 
         if not self._container.can_connect():
@@ -490,8 +571,7 @@ class QBittorrentCharm(ops.CharmBase):
         if not self._exporter_container.can_connect():
             return
         layer = self._build_exporter_layer(credentials)
-        self._exporter_container.add_layer(METRICS_SERVICE_NAME, layer, combine=True)
-        self._exporter_container.replan()
+        reconcile_layer(self._exporter_container, METRICS_SERVICE_NAME, layer)
 
     def _build_charm_gauges(self) -> list[MetricFamily]:
         """Charm-state metrics published alongside topology.
@@ -500,7 +580,8 @@ class QBittorrentCharm(ops.CharmBase):
         is configured to allow torrent traffic without a VPN gateway
         relation. Crowsnest combines this with `charmarr_relation_bound{
         relation="vpn-gateway"}` to detect operators who turned the safety
-        off without wiring gluetun (or whose gluetun went away).
+        off without wiring gluetun (or whose gluetun went away). Reconcile
+        step timings from ReconcileProfiler are appended after it.
         """
         unsafe = 1.0 if bool(self.config.get("unsafe-mode", False)) else 0.0
         return [
@@ -514,8 +595,23 @@ class QBittorrentCharm(ops.CharmBase):
                 ),
                 samples=[MetricSample(value=unsafe)],
             ),
+            *self._profiler.build_metrics(),
         ]
 
+    def _on_workload_ready(self, event: ops.PebbleCustomNoticeEvent) -> None:
+        """Run the workload-dependent steps as soon as the workload answers.
+
+        The ready check recovering needs no handler here: pebble-check-recovered
+        is already one of the reconcilable events.
+        """
+        if event.notice.key == WORKLOAD_READY_NOTICE:
+            self._reconcile(event)
+
+    def _arm_ready_notice(self) -> None:
+        """Have Pebble notify the charm once the workload answers its readiness URL."""
+        check = self._build_readiness_check()[f"{CONTAINER_NAME}-ready"]
+        arm_ready_notice(self._container, check["http"]["url"])
+
     def _reconcile(self, event: ops.EventBase) -> None:
         """Reconcile charm state with desired configuration.
 
@@ -532,26 +628,29 @@ class QBittorrentCharm(ops.CharmBase):
         10. Reconcile VPN gateway client (if related)
         11. Configure Pebble layer and start service
         """
-        self._topology.reconcile()
+        with self._profiler.step("topology"):
+            self._topology.reconcile()
         # The topology endpoint is a cluster-internal concern - crowsnest polls
         # it from inside the same K8s cluster. Hardcode the in-cluster Service
         # FQDN; never expose this URL externally.
-        self._crowsnest.publish_data(
+        self._publisher.publish(
+            "crowsnest",
             CrowsnestProviderData(
                 topology_url=(
                     f"http://{self.app.name}.{self.model.name}"
                     f".svc.cluster.local:{self._topology.port}/metrics"
                 )
-            )
+            ),
+            self._crowsnest.publish_data,
         )
 
         # Non-leader: register readiness check so K8s removes from Service endpoints
         if not self.unit.is_leader():
             if self._container.can_connect():
-                self._container.add_layer(
+                reconcile_layer(
+                    self._container,
                     f"{CONTAINER_NAME}-check",
                     {"checks": self._build_readiness_check()},
-                    combine=True,
                 )
             return
 
@@ -563,7 +662,8 @@ class QBittorrentCharm(ops.CharmBase):
                 self.app.name,
             )
 
-        self._configure_ingress()
+        with self._profiler.step("ingress"):
+            self._configure_ingress()
 
         if not self._container.can_connect():
             return
@@ -576,56 +676,70 @@ class QBittorrentCharm(ops.CharmBase):
             return
 
         # Ensure credentials exist
-        credentials = self._get_credentials()
-        if credentials:
-            secret = self.model.get_secret(label=CREDENTIALS_SECRET_LABEL)
-            sync_secret_rotation_policy(
-                secret, str(self.config.get("credential-rotation", "disabled"))
-            )
-        else:
-            credentials = self._create_credentials()
+        with self._profiler.step("credentials"):
+            credentials = self._get_credentials()
+            if credentials:
+                secret = self._secrets.get(label=CREDENTIALS_SECRET_LABEL)
+                sync_secret_rotation_policy(
+                    secret, str(self.config.get("credential-rotation", "disabled"))
+                )
+            else:
+                credentials = self._create_credentials()
 
         # Publish download client data to related media managers
-        self._publish_download_client(credentials)
+        with self._profiler.step("publish-download-client"):
+            self._publish_download_client(credentials)
 
         # Reconcile config (preserves user settings like download paths)
-        self._reconcile_config(credentials)
+        with self._profiler.step("config"):
+            self._reconcile_config(credentials)
 
         # Fix config directory ownership for PUID/PGID
-        self._prepare_config_directory(storage.puid, storage.pgid)
+        with self._profiler.step("ownership"):
+            self._prepare_config_directory(storage.puid, storage.pgid)
 
         # Mount shared storage PVC
-        reconcile_storage_volume(
-            manager=self.k8s,
-            statefulset_name=self.app.name,
-            namespace=self.model.name,
-            container_name=CONTAINER_NAME,
-            pvc_name=storage.pvc_name,
-            mount_path=storage.mount_path,
-            pgid=storage.pgid,
-        )
+        with self._profiler.step("storage-volume"):
+            reconcile_storage_volume(
+                manager=self.statefulset,
+                statefulset_name=self.app.name,
+                namespace=self.model.name,
+                container_name=CONTAINER_NAME,
+                pvc_name=storage.pvc_name,
+                mount_path=storage.mount_path,
+                pgid=storage.pgid,
+            )
 
         # Reconcile VPN gateway client
-        self._reconcile_vpn()
+        with self._profiler.step("vpn"):
+            self._reconcile_vpn()
 
-        # Ensure user/group exist for Pebble's user-id/group-id
-        ensure_pebble_user(self._container, storage.puid, storage.pgid, username="qbt")
+        # Send the StatefulSet changes above as one patch, so the pod rolls at most once
+        with self._profiler.step("statefulset-patch"):
+            self._flush_statefulset()
 
-        # Configure Pebble layer and start service
-        layer = self._build_pebble_layer(storage.puid, storage.pgid)
-        self._container.add_layer(SERVICE_NAME, layer, combine=True)
-        self._container.replan()
+        # Configure Pebble user and layer, (re)starting the service only if the plan changed
+        with self._profiler.step("pebble-layer"):
+            ensure_pebble_user(self._container, storage.puid, storage.pgid, username="qbt")
+            layer = self._build_pebble_layer(storage.puid, storage.pgid)
+            reconcile_layer(self._container, SERVICE_NAME, layer)
 
         # Reconcile qbittorrent-exporter sidecar (Prometheus exporter)
-        self._reconcile_exporter(credentials)
+        with self._profiler.step("exporter"):
+            self._reconcile_exporter(credentials)
 
         # Expose WebUI port on the Kubernetes Service
         self.unit.set_ports(WEBUI_PORT, self._topology.port)
 
         # Configure app via API once workload is ready
-        if self._is_workload_ready(credentials):
-            self._configure_app(credentials)
-            self._sync_categories(credentials)
+        if self._probe_workload_ready(credentials):
+            with self._profiler.step("app-preferences"):
+                self._configure_app(credentials)
+            with self._profiler.step("categories"):
+                self._sync_categories(credentials)
+        else:
+            # Still booting: have Pebble notify the charm once it answers
+            self._arm_ready_notice()
 
     def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
         """Collect all unit statuses. Framework picks the worst."""
@@ -699,7 +813,7 @@ class QBittorrentCharm(ops.CharmBase):
         if not credentials:
             return
 
-        if not self._is_workload_ready(credentials):
+        if not self._observed_workload_ready():
             event.add_status(ops.WaitingStatus("Waiting for workload"))
         else:
             event.add_status(ops.ActiveStatus())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Microbenchmark for qBittorrent password hash reconciliation.
+
+Times resolve_password_hash for the three cases a hook can hit: a verified
+secret revision (steady state, no PBKDF2), an unknown revision (one PBKDF2
+verify) and a rotated password (a failed verify plus a fresh hash), and
+reports the median and worst time per call.
+
+Usage:
+    python tests/benchmark/bench_credentials.py [--rounds N]
+
+Run from the charm's virtualenv; not part of the unit suite, which only
+asserts that the steady state skips PBKDF2 (timings there would be flaky).
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from _qbittorrent import (
+    compute_pbkdf2_hash,
+    reconcile_qbittorrent_config,
+    resolve_password_hash,
+)
+
+REVISION = "secret:1/1"
+
+
+def _time(call: Callable[[], object], rounds: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000, max(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    content = reconcile_qbittorrent_config(
+        None, username="charmarr", password_hash=compute_pbkdf2_hash("secret")
+    )
+    _, verified = resolve_password_hash(content, "secret", REVISION)
+
+    print(f"{'case':<18} {'p50 ms':>8} {'max ms':>8}")
+    for case, call in (
+        ("verified revision", lambda: resolve_password_hash(content, "secret", REVISION, verified)),
+        ("unknown revision", lambda: resolve_password_hash(content, "secret", "", "")),
+        ("rotated password", lambda: resolve_password_hash(content, "new", "secret:1/2", verified)),
+    ):
+        p50, worst = _time(call, args.rounds)
+        print(f"{case:<18} {p50:>8.3f} {worst:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
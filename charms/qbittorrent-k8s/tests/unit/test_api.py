@@ -3,12 +3,15 @@
 
 """Unit tests for qBittorrent API client."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from _qbittorrent import QBittorrentApi, QBittorrentApiError
 
+LOGIN_OK = MagicMock(status_code=200, text="Ok.")
+
 
 @pytest.fixture
 def api():
@@ -37,7 +40,7 @@ def test_authenticate_failure(api):
 
 def test_create_category_ignores_conflict(api):
     """Category creation ignores 409 (already exists)."""
-    api._mock.post.return_value = MagicMock(status_code=409)
+    api._mock.request.return_value = MagicMock(status_code=409)
     api.create_category("movies", "/downloads/movies")
 
 
@@ -46,3 +49,82 @@ def test_context_manager_closes(api):
     with api:
         pass
     api._mock.close.assert_called_once()
+
+
+def _cached_client(session_file):
+    """Build a client whose mocked cookie jar hands out a fixed SID."""
+    mock_client = MagicMock()
+    mock_client.cookies.get.return_value = "sid-1"
+    mock_client.post.return_value = LOGIN_OK
+    with patch("_qbittorrent._api.httpx.Client", return_value=mock_client):
+        client = QBittorrentApi("http://localhost:8080", session_file=session_file)
+    return client, mock_client
+
+
+def test_cached_session_skips_login(tmp_path):
+    """A second client for the same credentials revision reuses the cached SID."""
+    session_file = tmp_path / "session.json"
+    first, first_mock = _cached_client(session_file)
+    first.authenticate("admin", "pass", "secret:1/1")
+    first_mock.post.assert_called_once()
+
+    second, second_mock = _cached_client(session_file)
+    second.authenticate("admin", "pass", "secret:1/1")
+
+    second_mock.post.assert_not_called()
+    second_mock.cookies.set.assert_called_once_with("SID", "sid-1")
+
+
+def test_rotated_secret_invalidates_cached_session(tmp_path):
+    """A new credentials revision never reuses a SID issued for the old one."""
+    session_file = tmp_path / "session.json"
+    first, _ = _cached_client(session_file)
+    first.authenticate("admin", "old", "secret:1/1")
+
+    second, second_mock = _cached_client(session_file)
+    second.authenticate("admin", "new", "secret:1/2")
+
+    second_mock.post.assert_called_once()
+
+
+def test_cache_holds_nothing_derived_from_the_password(tmp_path):
+    """The cache file must not let the password be checked offline."""
+    session_file = tmp_path / "session.json"
+    client, _ = _cached_client(session_file)
+    client.authenticate("admin", "hunter2", "secret:1/1")
+
+    assert json.loads(session_file.read_text()) == {
+        "key": "http://localhost:8080 secret:1/1",
+        "sid": "sid-1",
+    }
+
+
+def test_unknown_revision_is_not_cached(tmp_path):
+    """Without a revision the credentials cannot be told apart, so always log in."""
+    session_file = tmp_path / "session.json"
+    first, _ = _cached_client(session_file)
+    first.authenticate("admin", "pass")
+    assert not session_file.exists()
+
+    second, second_mock = _cached_client(session_file)
+    second.authenticate("admin", "pass")
+
+    second_mock.post.assert_called_once()
+
+
+def test_forbidden_reauthenticates_once(tmp_path):
+    """An expired SID is refreshed on 403 and the request retried."""
+    session_file = tmp_path / "session.json"
+    first, _ = _cached_client(session_file)
+    first.authenticate("admin", "pass", "secret:1/1")
+
+    api, mock_client = _cached_client(session_file)
+    api.authenticate("admin", "pass", "secret:1/1")
+    mock_client.request.side_effect = [
+        MagicMock(status_code=403),
+        MagicMock(status_code=200, text="v5.0.0"),
+    ]
+
+    assert api.get_version() == "v5.0.0"
+    mock_client.post.assert_called_once()
+    assert mock_client.request.call_count == 2
@@ -0,0 +1,89 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for qBittorrent password hash reconciliation."""
+
+import hashlib
+from unittest.mock import patch
+
+from _qbittorrent import (
+    compute_pbkdf2_hash,
+    get_password_hash,
+    reconcile_qbittorrent_config,
+    resolve_password_hash,
+    verify_pbkdf2_hash,
+)
+
+
+def _config(password: str) -> str:
+    return reconcile_qbittorrent_config(
+        None, username="charmarr", password_hash=compute_pbkdf2_hash(password)
+    )
+
+
+def test_verify_accepts_matching_password():
+    """A hash verifies against the password it was computed from."""
+    password_hash = compute_pbkdf2_hash("secret")
+
+    assert verify_pbkdf2_hash("secret", password_hash)
+    assert verify_pbkdf2_hash("secret", f'"{password_hash}"')
+    assert not verify_pbkdf2_hash("other", password_hash)
+    assert not verify_pbkdf2_hash("secret", "@ByteArray(garbage)")
+
+
+def test_resolve_keeps_existing_hash():
+    """A matching on-disk hash is kept, so the config renders unchanged."""
+    content = _config("secret")
+
+    password_hash, _ = resolve_password_hash(content, "secret")
+    updated = reconcile_qbittorrent_config(
+        content, username="charmarr", password_hash=password_hash
+    )
+
+    assert password_hash == get_password_hash(content)
+    assert updated == content
+
+
+def test_resolve_rehashes_rotated_password():
+    """A rotated password gets a fresh hash that verifies."""
+    content = _config("old")
+
+    password_hash, _ = resolve_password_hash(content, "new")
+
+    assert password_hash != get_password_hash(content)
+    assert verify_pbkdf2_hash("new", password_hash)
+
+
+def test_new_revision_does_not_skip_verification():
+    """A marker for an older secret revision never vouches for the on-disk hash."""
+    content = _config("old")
+    _, verified = resolve_password_hash(content, "old", "secret:1/1")
+
+    password_hash, _ = resolve_password_hash(content, "new", "secret:1/2", verified)
+
+    assert verify_pbkdf2_hash("new", password_hash)
+
+
+def test_verified_revision_skips_pbkdf2():
+    """Steady-state hooks reuse the hash without running PBKDF2 at all."""
+    content = _config("secret")
+    _, verified = resolve_password_hash(content, "secret", "secret:1/1")
+    # The marker is the revision and the stored hash, nothing derived from the password
+    assert verified == f"secret:1/1\0{get_password_hash(content)}"
+
+    with patch("_qbittorrent._credentials.hashlib.pbkdf2_hmac", wraps=hashlib.pbkdf2_hmac) as kdf:
+        password_hash, marker = resolve_password_hash(content, "secret", "secret:1/1", verified)
+
+    kdf.assert_not_called()
+    assert (password_hash, marker) == (get_password_hash(content), verified)
+
+
+def test_unknown_revision_always_verifies():
+    """Without a secret revision the hash is verified every time and nothing is remembered."""
+    content = _config("secret")
+
+    with patch("_qbittorrent._credentials.hashlib.pbkdf2_hmac", wraps=hashlib.pbkdf2_hmac) as kdf:
+        _, marker = resolve_password_hash(content, "secret", "", "")
+
+    kdf.assert_called_once()
+    assert marker == ""
@@ -3,13 +3,22 @@
 
 """Radarr-specific utilities."""
 
+from _radarr._collector import (
+    COLLECTOR_PORT,
+    collector_spec,
+    queue_budget,
+    reconcile_collectors,
+)
 from _radarr._constants import (
     API_KEY_SECRET_LABEL,
     CONFIG_FILE,
     CONTAINER_NAME,
+    PACKAGE_INFO_FILE,
     SERVICE_NAME,
     WEBUI_PORT,
 )
+from _radarr._debounce import ReconcileDebouncer
+from _radarr._guides import TRASH_GUIDES, GuidesCache
 from _radarr._o11y import (
     METRICS_CONTAINER_NAME,
     METRICS_PATH,
@@ -20,19 +29,71 @@ from _radarr._o11y import (
     SCRAPARR_ENV_DETAILED,
     SCRAPARR_ENV_URL,
 )
+from _radarr._ownership import reconcile_ownership
+from _radarr._pebble import LayerDiff, is_check_up, reconcile_layer
+from _radarr._profiler import ReconcileProfiler
+from _radarr._publish import RelationPublisher
+from _radarr._ready import WORKLOAD_READY_NOTICE, arm_ready_notice
+from _radarr._recyclarr import (
+    RECYCLARR_JOB_POLL,
+    ImageResource,
+    RecyclarrJobStatus,
+    build_recyclarr_config,
+    build_recyclarr_settings,
+    parse_image_resource,
+    reconcile_recyclarr_job,
+    recyclarr_service_account,
+    run_recyclarr,
+)
+from _radarr._secrets import SecretCache
+from _radarr._session import ApiSessionPool, build_session_counters
+from _radarr._statefulset import StatefulSetBatch
+from _radarr._trash_sync import build_trash_sync_metrics, is_trash_sync_due, trash_sync_digest
 
 __all__ = [
     "API_KEY_SECRET_LABEL",
+    "COLLECTOR_PORT",
     "CONFIG_FILE",
     "CONTAINER_NAME",
     "METRICS_CONTAINER_NAME",
     "METRICS_PATH",
     "METRICS_PORT",
     "METRICS_SERVICE_NAME",
+    "PACKAGE_INFO_FILE",
+    "RECYCLARR_JOB_POLL",
     "SCRAPARR_COMMAND",
     "SCRAPARR_ENV_API_KEY",
     "SCRAPARR_ENV_DETAILED",
     "SCRAPARR_ENV_URL",
     "SERVICE_NAME",
+    "TRASH_GUIDES",
     "WEBUI_PORT",
+    "WORKLOAD_READY_NOTICE",
+    "ApiSessionPool",
+    "GuidesCache",
+    "ImageResource",
+    "LayerDiff",
+    "ReconcileDebouncer",
+    "ReconcileProfiler",
+    "RecyclarrJobStatus",
+    "RelationPublisher",
+    "SecretCache",
+    "StatefulSetBatch",
+    "arm_ready_notice",
+    "build_recyclarr_config",
+    "build_recyclarr_settings",
+    "build_session_counters",
+    "build_trash_sync_metrics",
+    "collector_spec",
+    "is_check_up",
+    "is_trash_sync_due",
+    "parse_image_resource",
+    "queue_budget",
+    "reconcile_collectors",
+    "reconcile_layer",
+    "reconcile_ownership",
+    "reconcile_recyclarr_job",
+    "recyclarr_service_account",
+    "run_recyclarr",
+    "trash_sync_digest",
 ]
@@ -8,3 +8,4 @@ SERVICE_NAME = "radarr"
 WEBUI_PORT = 7878
 CONFIG_FILE = "/config/config.xml"
 API_KEY_SECRET_LABEL = "api-key"
+PACKAGE_INFO_FILE = "/app/radarr/package_info"
@@ -0,0 +1,142 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Local, pinned TRaSH guides cache for the recyclarr sidecar.
+
+Recyclarr clones the TRaSH guides and config-templates repositories from
+GitHub whenever its app data is fresh, which is slow everywhere and fails
+in air-gapped clusters. GuidesCache keeps a bare mirror of each repository
+inside the recyclarr container, seeded from a snapshot bundled with the
+charm, refreshed with shallow fetches when a sync is due, and pinned to a
+configurable ref. The Recyclarr settings.yml it returns points at the
+mirrors, so Recyclarr's own clone and fetch are local-disk operations. The
+cache and those settings live under the charm-owned /charmarr tree and are
+passed to Recyclarr explicitly, never written over a user's settings file.
+
+The recyclarr-mode=job pod cannot read the bundled snapshot, so a Job
+clones from trash-guides-url (and GitHub, for the config templates).
+"""
+
+import logging
+import shlex
+from dataclasses import dataclass
+from pathlib import Path
+
+import ops
+
+logger = logging.getLogger(__name__)
+
+GUIDES_CACHE_DIR = "/charmarr/guides"
+GUIDES_BRANCH = "charmarr"
+GUIDES_FETCH_TIMEOUT = 60.0
+
+
+@dataclass(frozen=True)
+class GuidesRepository:
+    """A repository Recyclarr reads, as named in its settings.yml."""
+
+    name: str
+    settings_key: str
+    url: str
+
+
+TRASH_GUIDES = GuidesRepository(
+    "trash-guides", "trash_guides", "https://github.com/TRaSH-Guides/Guides.git"
+)
+CONFIG_TEMPLATES = GuidesRepository(
+    "config-templates", "config_templates", "https://github.com/recyclarr/config-templates.git"
+)
+
+
+def build_mirror_settings(cache_dir: str = GUIDES_CACHE_DIR) -> str:
+    """Recyclarr settings.yml pointing both repositories at the local mirrors."""
+    lines = ["repositories:"]
+    for repo in (TRASH_GUIDES, CONFIG_TEMPLATES):
+        lines += [
+            f"  {repo.settings_key}:",
+            f"    clone_url: file://{cache_dir}/{repo.name}.git",
+            f"    branch: {GUIDES_BRANCH}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+class GuidesCache:
+    """Bare guide mirrors in the recyclarr container, pinned to a local branch.
+
+    The mirrors live on the container filesystem, so they survive across
+    hooks but not pod restarts; a restarted pod is re-seeded from the
+    bundled snapshot instead of the network.
+    """
+
+    def __init__(
+        self,
+        container: ops.Container,
+        snapshot_dir: Path,
+        cache_dir: str = GUIDES_CACHE_DIR,
+    ) -> None:
+        self._container = container
+        self._snapshot_dir = snapshot_dir
+        self._cache_dir = cache_dir
+
+    def _git(self, repo: GuidesRepository, *args: str, timeout: float | None = None) -> str:
+        mirror = f"{self._cache_dir}/{repo.name}.git"
+        process = self._container.exec(["git", "-C", mirror, *args], timeout=timeout)
+        stdout, _ = process.wait_output()
+        return stdout.strip()
+
+    def _seed(self, repo: GuidesRepository) -> bool:
+        """Extract the bundled snapshot if the mirror is missing; True if present."""
+        if self._container.exists(f"{self._cache_dir}/{repo.name}.git/HEAD"):
+            return True
+        snapshot = self._snapshot_dir / f"{repo.name}.tar.gz"
+        if not snapshot.exists():
+            return False
+
+        archive = f"{self._cache_dir}/{repo.name}.tar.gz"
+        with snapshot.open("rb") as f:
+            self._container.push(archive, f, make_dirs=True)
+        command = f"tar -xzf {shlex.quote(archive)} -C {shlex.quote(self._cache_dir)}"
+        self._container.exec(["sh", "-c", f"{command} && rm -f {shlex.quote(archive)}"]).wait()
+        self._git(repo, "update-ref", f"refs/heads/{GUIDES_BRANCH}", "HEAD")
+        logger.info("Seeded %s mirror from bundled snapshot", repo.name)
+        return True
+
+    def _pin(self, repo: GuidesRepository, url: str, ref: str) -> str:
+        """Fetch ref (shallow, best effort) and point the local branch at it."""
+        try:
+            self._git(
+                repo, "fetch", "--quiet", "--depth", "1", url, ref, timeout=GUIDES_FETCH_TIMEOUT
+            )
+            target = "FETCH_HEAD"
+        except (ops.pebble.ExecError, ops.pebble.ChangeError) as e:
+            logger.warning("Could not refresh %s from %s, using cache: %s", repo.name, url, e)
+            target = f"{ref}^{{commit}}"
+        try:
+            self._git(repo, "update-ref", f"refs/heads/{GUIDES_BRANCH}", target)
+        except ops.pebble.ExecError:
+            logger.warning("%s ref %r not in cache, keeping current pin", repo.name, ref)
+        return self._git(repo, "rev-parse", f"refs/heads/{GUIDES_BRANCH}")
+
+    def reconcile(self, *, ref: str, trash_guides_url: str) -> str | None:
+        """Seed, refresh and pin the mirrors.
+
+        Returns:
+            Recyclarr settings.yml reading from the local mirrors, or None if
+            there is no snapshot and nothing cached yet, in which case
+            Recyclarr has to clone from upstream.
+        """
+        commit = ""
+        try:
+            if all(self._seed(repo) for repo in (TRASH_GUIDES, CONFIG_TEMPLATES)):
+                commit = self._pin(TRASH_GUIDES, trash_guides_url, ref)
+                self._pin(CONFIG_TEMPLATES, CONFIG_TEMPLATES.url, "master")
+        except (ops.pebble.ExecError, ops.pebble.PathError) as e:
+            logger.warning("Failed to prepare TRaSH guides cache: %s", e)
+            commit = ""
+
+        if not commit:
+            logger.warning("TRaSH guides cache unavailable, Recyclarr will clone upstream")
+            return None
+
+        logger.info("Recyclarr pinned to TRaSH guides %s (%s)", commit[:12], ref)
+        return build_mirror_settings(self._cache_dir)
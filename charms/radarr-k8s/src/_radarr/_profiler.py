@@ -0,0 +1,99 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Reconcile-step profiler exported through the topology exposition.
+
+A slow hook is usually one step (a recursive chown, a StatefulSet patch, a
+Recyclarr run) but nothing says which. ReconcileProfiler times named steps,
+folds them into StoredState when the hook commits, and renders them as
+charmarr_reconcile_step_* families for CharmarrChargedTopology. The
+exposition is rendered during the hook, so it shows the timings of the
+previous completed dispatch.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Literal
+
+import ops
+
+from charmarr_lib.core import MetricFamily, MetricSample
+
+
+class ReconcileProfiler(ops.Object):
+    """Times named reconcile steps and keeps cumulative per-step stats."""
+
+    _stored = ops.StoredState()
+
+    def __init__(self, charm: ops.CharmBase) -> None:
+        super().__init__(charm, "reconcile-profiler")
+        self._stored.set_default(steps={})
+        self._timings: dict[str, float] = {}
+        charm.framework.observe(charm.framework.on.pre_commit, self._on_pre_commit)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as step name (repeated steps accumulate)."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._timings[name] = self._timings.get(name, 0.0) + time.monotonic() - start
+
+    def _on_pre_commit(self, _: ops.EventBase) -> None:
+        """Persist this dispatch's timings; failed hooks never reach commit."""
+        now = time.time()
+        for name, seconds in self._timings.items():
+            previous = self._stored.steps.get(name) or {}
+            self._stored.steps[name] = {
+                "last": seconds,
+                "sum": float(previous.get("sum", 0.0)) + seconds,
+                "count": int(previous.get("count", 0)) + 1,
+                "timestamp": now,
+            }
+        self._timings.clear()
+
+    def build_metrics(self) -> list[MetricFamily]:
+        """Render per-step duration and last-run families for the exposition."""
+        steps = sorted(self._stored.steps.items())
+        if not steps:
+            return []
+
+        def family(
+            name: str, help: str, field: str, type: Literal["gauge", "counter"] = "gauge"
+        ) -> MetricFamily:
+            return MetricFamily(
+                name=name,
+                help=help,
+                type=type,
+                samples=[
+                    MetricSample(labels={"step": step}, value=float(stats[field]))
+                    for step, stats in steps
+                ],
+            )
+
+        return [
+            family(
+                "charmarr_reconcile_step_last_duration_seconds",
+                "Duration of the reconcile step in the last dispatch that ran it.",
+                "last",
+            ),
+            family(
+                "charmarr_reconcile_step_duration_seconds_total",
+                "Total seconds spent in the reconcile step across dispatches.",
+                "sum",
+                "counter",
+            ),
+            family(
+                "charmarr_reconcile_step_runs_total",
+                "Number of dispatches that ran the reconcile step.",
+                "count",
+                "counter",
+            ),
+            family(
+                "charmarr_reconcile_step_last_run_timestamp_seconds",
+                "Unix time at which the reconcile step last completed.",
+                "timestamp",
+            ),
+        ]
@@ -5,12 +5,15 @@
 """Radarr Charm."""
 
 import logging
+import time
 
 import ops
 from charms.grafana_k8s.v0.grafana_dashboard import GrafanaDashboardProvider
 from charms.istio_beacon_k8s.v0.service_mesh import (
     AppPolicy,
     Endpoint,
+    MeshPolicy,
+    PolicyResourceManager,
     ServiceMeshConsumer,
     UnitPolicy,
 )
@@ -32,18 +35,49 @@ from charms.velero_libs.v0.velero_backup_config import VeleroBackupProvider, Vel
 
 from _radarr import (
     API_KEY_SECRET_LABEL,
+    COLLECTOR_PORT,
     CONFIG_FILE,
     CONTAINER_NAME,
     METRICS_CONTAINER_NAME,
     METRICS_PATH,
     METRICS_PORT,
     METRICS_SERVICE_NAME,
+    PACKAGE_INFO_FILE,
+    RECYCLARR_JOB_POLL,
     SCRAPARR_COMMAND,
     SCRAPARR_ENV_API_KEY,
     SCRAPARR_ENV_DETAILED,
     SCRAPARR_ENV_URL,
     SERVICE_NAME,
+    TRASH_GUIDES,
     WEBUI_PORT,
+    WORKLOAD_READY_NOTICE,
+    ApiSessionPool,
+    GuidesCache,
+    ImageResource,
+    ReconcileDebouncer,
+    ReconcileProfiler,
+    RecyclarrJobStatus,
+    RelationPublisher,
+    SecretCache,
+    StatefulSetBatch,
+    arm_ready_notice,
+    build_recyclarr_config,
+    build_recyclarr_settings,
+    build_session_counters,
+    build_trash_sync_metrics,
+    collector_spec,
+    is_check_up,
+    is_trash_sync_due,
+    parse_image_resource,
+    queue_budget,
+    reconcile_collectors,
+    reconcile_layer,
+    reconcile_ownership,
+    reconcile_recyclarr_job,
+    recyclarr_service_account,
+    run_recyclarr,
+    trash_sync_digest,
 )
 from charmarr_lib.core import (
     ArrApiClient,
@@ -54,7 +88,6 @@ from charmarr_lib.core import (
     K8sResourceManager,
     MediaManager,
     MetricFamily,
-    MetricSample,
     RecyclarrError,
     ensure_pebble_user,
     generate_api_key,
@@ -68,7 +101,6 @@ from charmarr_lib.core import (
     reconcile_root_folder,
     reconcile_storage_volume,
     sync_secret_rotation_policy,
-    sync_trash_profiles,
 )
 from charmarr_lib.core.interfaces import (
     CrowsnestProvider,
@@ -91,11 +123,28 @@ logger = logging.getLogger(__name__)
 class RadarrCharm(ops.CharmBase):
     """Radarr movie collection manager charm."""
 
+    _stored = ops.StoredState()
+
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._secrets = SecretCache(self)
+        self._publisher = RelationPublisher(self)
+        self._profiler = ReconcileProfiler(self)
+        self._debouncer = ReconcileDebouncer(self, CONTAINER_NAME, self._reconcile)
+        self._stored.set_default(
+            api_sessions_opened=0,
+            api_sessions_reused=0,
+            trash_sync_digest="",
+            trash_sync_at=0.0,
+            trash_sync_seconds=0.0,
+            trash_sync_success=False,
+        )
+        self._api_sessions = ApiSessionPool(ArrApiClient)
         self._container = self.unit.get_container(CONTAINER_NAME)
+        self._workload_ready: bool | None = None
         self._scraparr_container = self.unit.get_container(METRICS_CONTAINER_NAME)
         self._k8s: K8sResourceManager | None = None
+        self._statefulset: StatefulSetBatch | None = None
 
         self._topology = CharmarrChargedTopology(
             self,
@@ -106,12 +155,13 @@ class RadarrCharm(ops.CharmBase):
                 CharmarrTopologyRelation("vpn-gateway", role="requires", required=False),
                 CharmarrTopologyRelation("media-manager", role="provides", required=False),
             ],
-            extra_exposition=self._build_queue_gauges,
+            extra_exposition=self._build_exposition,
         )
         self._metrics_endpoint = MetricsEndpointProvider(
             self,
             jobs=[
                 {"static_configs": [{"targets": [f"*:{METRICS_PORT}"]}]},
+                {"static_configs": [{"targets": [f"*:{COLLECTOR_PORT}"]}]},
                 self._topology.scrape_job,
             ],
             alert_rules_path=(
@@ -148,7 +198,7 @@ class RadarrCharm(ops.CharmBase):
                 ),
                 UnitPolicy(
                     relation="metrics-endpoint",
-                    ports=[METRICS_PORT, self._topology.port],
+                    ports=[METRICS_PORT, self._topology.port, COLLECTOR_PORT],
                 ),
             ],
         )
@@ -165,17 +215,20 @@ class RadarrCharm(ops.CharmBase):
         self._ingress = IngressPerAppRequirer(self, port=WEBUI_PORT)
         self._istio_ingress = IstioIngressRouteRequirer(self, relation_name="istio-ingress-route")
 
-        observe_events(self, reconcilable_events_k8s, self._reconcile)
-        framework.observe(self._vpn_gateway.on.changed, self._reconcile)
-        framework.observe(self._media_indexer.on.changed, self._reconcile)
-        framework.observe(self._download_client.on.changed, self._reconcile)
-        framework.observe(self._media_storage.on.changed, self._reconcile)
+        observe_events(self, reconcilable_events_k8s, self._debouncer.request)
+        framework.observe(self._vpn_gateway.on.changed, self._debouncer.request)
+        framework.observe(self._media_indexer.on.changed, self._debouncer.request)
+        framework.observe(self._download_client.on.changed, self._debouncer.request)
+        framework.observe(self._media_storage.on.changed, self._debouncer.request)
         framework.observe(self.on.collect_unit_status, self._on_collect_unit_status)
         framework.observe(self.on.secret_rotate, self._on_secret_rotate)
+        framework.observe(self.on.remove, self._on_remove)
         framework.observe(self.on.rotate_api_key_action, self._on_rotate_api_key_action)
         framework.observe(self.on.sync_trash_profiles_action, self._on_sync_trash_profiles_action)
-        framework.observe(self._ingress.on.ready, self._reconcile)
-        framework.observe(self._ingress.on.revoked, self._reconcile)
+        framework.observe(self._ingress.on.ready, self._debouncer.request)
+        framework.observe(self._ingress.on.revoked, self._debouncer.request)
+        framework.observe(self.on[CONTAINER_NAME].pebble_custom_notice, self._on_workload_ready)
+        framework.observe(framework.on.pre_commit, self._on_pre_commit)
 
     @property
     def k8s(self) -> K8sResourceManager:
@@ -184,6 +237,18 @@ class RadarrCharm(ops.CharmBase):
             self._k8s = K8sResourceManager()
         return self._k8s
 
+    @property
+    def statefulset(self) -> K8sResourceManager:
+        """K8s manager that folds this hook's app StatefulSet patches into one."""
+        if self._statefulset is None:
+            self._statefulset = StatefulSetBatch(self.k8s, self.app.name, self.model.name)
+        return self._statefulset
+
+    def _flush_statefulset(self) -> None:
+        """Send this hook's folded app StatefulSet patch, if there is one."""
+        if self._statefulset is not None:
+            self._statefulset.flush()
+
     def _get_secret_id(self, secret: ops.Secret) -> str:
         """Get secret ID reliably (handles ops 2.x quirk with labeled secrets)."""
         if secret.id:
@@ -203,8 +268,8 @@ class RadarrCharm(ops.CharmBase):
     def _get_api_key_secret(self) -> tuple[str, str] | None:
         """Retrieve API key and secret ID from Juju Secret, or None if not yet created."""
         try:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            content = secret.get_content(refresh=True)
+            secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+            content = self._secrets.get_content(secret)
             return content["api-key"], self._get_secret_id(secret)
         except ops.SecretNotFoundError:
             return None
@@ -316,17 +381,20 @@ class RadarrCharm(ops.CharmBase):
         if not self._scraparr_container.can_connect():
             return
         layer = self._build_scraparr_layer(api_key)
-        self._scraparr_container.add_layer(METRICS_SERVICE_NAME, layer, combine=True)
-        self._scraparr_container.replan()
+        reconcile_layer(self._scraparr_container, METRICS_SERVICE_NAME, layer)
 
     def _reconcile_vpn(self) -> None:
         """Reconcile VPN client-side patching based on gateway state."""
         if self.model.get_relation("vpn-gateway"):
-            self._vpn_gateway.publish_data(VPNGatewayRequirerData(instance_name=self.app.name))
+            self._publisher.publish(
+                "vpn-gateway",
+                VPNGatewayRequirerData(instance_name=self.app.name),
+                self._vpn_gateway.publish_data,
+            )
 
         gateway_data = self._vpn_gateway.get_gateway()
         reconcile_gateway_client(
-            manager=self.k8s,
+            manager=self.statefulset,
             statefulset_name=self.app.name,
             namespace=self.model.name,
             data=gateway_data,
@@ -334,71 +402,88 @@ class RadarrCharm(ops.CharmBase):
         )
 
     def _get_api_client(self, api_key: str) -> ArrApiClient:
-        """Create authenticated API client for Radarr."""
+        """Get the hook-scoped, keep-alive API client for Radarr.
+
+        The client is shared by every reconcile step in this dispatch and
+        closed in _on_pre_commit, so callers must not close it themselves.
+        """
         url_base = self._get_url_base() or ""
         base_url = f"http://localhost:{WEBUI_PORT}{url_base}"
-        return ArrApiClient(base_url, api_key)
+        return self._api_sessions.get(base_url, api_key)
+
+    def _on_pre_commit(self, _: ops.EventBase) -> None:
+        """Close pooled API clients and persist the connection counters."""
+        self._stored.api_sessions_opened += self._api_sessions.opened
+        self._stored.api_sessions_reused += self._api_sessions.reused
+        self._api_sessions.close()
 
     def _is_workload_ready(self, api_key: str) -> bool:
         """Check if Radarr workload is ready to accept API calls."""
         try:
-            with self._get_api_client(api_key) as api:
-                api.get_host_config()
-                return True
+            api = self._get_api_client(api_key)
+            api.get_host_config()
+            return True
         except ArrApiError as e:
             logger.debug("Workload not ready: %s", e)
             return False
 
-    def _build_queue_gauges(self) -> list[MetricFamily]:
-        """Poll Radarr's /api/v3/queue and emit one series per queued item.
-
-        Surfaces what's currently in-flight (title, status, protocol) so
-        per-charm + crowsnest dashboards can render a live "active downloads"
-        table without recreating Radarr's UI. Silent on workload-not-ready
-        or empty queue - topology metrics still ship.
-        """
-        secret_data = self._get_api_key_secret()
-        if not secret_data:
-            return []
-        api_key, _ = secret_data
-        try:
-            with self._get_api_client(api_key) as api:
-                items = api.get_queue()
-        except ArrApiError as e:
-            logger.debug("Queue poll failed: %s", e)
-            return []
+    def _probe_workload_ready(self, api_key: str) -> bool:
+        """Probe the workload and remember the result for collect-status."""
+        self._workload_ready = self._is_workload_ready(api_key)
+        return self._workload_ready
 
-        if not items:
-            return []
+    def _observed_workload_ready(self) -> bool:
+        """Workload readiness for collect-status without another request to it.
 
-        size_samples: list[MetricSample] = []
-        remaining_samples: list[MetricSample] = []
-        for item in items:
-            labels = {
-                "title": item.title,
-                "status": item.status,
-                "protocol": item.protocol,
-            }
-            size_samples.append(MetricSample(labels=labels, value=float(item.size)))
-            remaining_samples.append(MetricSample(labels=labels, value=float(item.sizeleft)))
+        Reuses this dispatch's probe from the reconcile if there was one, else
+        reads the state Pebble keeps for the ready check.
+        """
+        if self._workload_ready is not None:
+            return self._workload_ready
+        return is_check_up(self._container, f"{CONTAINER_NAME}-ready")
 
+    def _build_exposition(self) -> list[MetricFamily]:
+        """Extra topology exposition: API and reconcile counters, timings."""
         return [
-            MetricFamily(
-                name="charmarr_queue_item_size_bytes",
-                help="Total size in bytes of a currently queued media item.",
-                samples=size_samples,
-            ),
-            MetricFamily(
-                name="charmarr_queue_item_remaining_bytes",
-                help="Bytes remaining to download for a currently queued media item.",
-                samples=remaining_samples,
+            *build_session_counters(
+                self._stored.api_sessions_opened + self._api_sessions.opened,
+                self._stored.api_sessions_reused + self._api_sessions.reused,
             ),
+            *self._build_trash_sync_metrics(),
+            *self._profiler.build_metrics(),
+            *self._debouncer.build_metrics(),
         ]
 
+    def _build_trash_sync_metrics(self) -> list[MetricFamily]:
+        """Last Recyclarr sync duration and outcome; empty until the first run."""
+        if not self._stored.trash_sync_at:
+            return []
+        return build_trash_sync_metrics(
+            self._stored.trash_sync_seconds,
+            self._stored.trash_sync_success,
+            self._stored.trash_sync_at,
+        )
+
+    def _reconcile_collectors(self, api_key: str) -> None:
+        """Point the background collector daemon at Radarr's queue.
+
+        The daemon polls /api/v3/queue on its own interval and serves one
+        series per queued item, so per-charm + crowsnest dashboards get a
+        live "active downloads" table without a queue fetch in every hook.
+        """
+        url_base = self._get_url_base() or ""
+        spec = collector_spec(
+            "arr-queue",
+            f"http://localhost:{WEBUI_PORT}{url_base}",
+            api_key,
+            **queue_budget(self.config),
+        )
+        reconcile_collectors([spec])
+
     def _get_secret_content(self, secret_id: str) -> dict[str, str]:
         """Retrieve secret content by ID for reconcilers."""
-        secret = self.model.get_secret(id=secret_id)
-        return secret.get_content(refresh=True)
+        secret = self._secrets.get(id=secret_id)
+        return self._secrets.get_content(secret)
 
     def _reconcile_download_clients(self, api_key: str) -> None:
         """Reconcile download clients in Radarr."""
@@ -406,14 +491,14 @@ class RadarrCharm(ops.CharmBase):
         if not providers:
             return
 
-        with self._get_api_client(api_key) as api:
-            reconcile_download_clients(
-                api_client=api,
-                desired_clients=providers,
-                category=self.app.name,
-                media_manager=MediaManager.RADARR,
-                get_secret=self._get_secret_content,
-            )
+        api = self._get_api_client(api_key)
+        reconcile_download_clients(
+            api_client=api,
+            desired_clients=providers,
+            category=self.app.name,
+            media_manager=MediaManager.RADARR,
+            get_secret=self._get_secret_content,
+        )
 
     def _get_variant(self) -> ContentVariant:
         """Get content variant from config."""
@@ -435,37 +520,184 @@ class RadarrCharm(ops.CharmBase):
             user_id=puid,
             group_id=pgid,
         ).wait()
-        with self._get_api_client(api_key) as api:
-            reconcile_root_folder(api, path)
+        api = self._get_api_client(api_key)
+        reconcile_root_folder(api, path)
+
+    def _sync_trash_profiles(self, api_key: str, *, force: bool = False) -> bool:
+        """Sync Trash Guides quality profiles via Recyclarr.
 
-    def _sync_trash_profiles(self, api_key: str) -> None:
-        """Sync Trash Guides quality profiles via Recyclarr."""
+        Unless forced, the run is skipped while the sync digest matches the
+        last successful run and that run is younger than trash-sync-interval.
+
+        Returns:
+            False if the sync was handed to a Recyclarr Job that has not
+            finished yet (recyclarr-mode=job), True otherwise.
+        """
         profiles_config = str(self.config.get("trash-profiles", "")).strip()
         if not profiles_config:
             profiles_config = get_default_trash_profiles(self._get_variant())
         if not profiles_config:
-            return
+            return True
 
+        job_mode = self.config.get("recyclarr-mode") == "job"
         container = self.unit.get_container("recyclarr")
-        if not container.can_connect():
+        if not job_mode and not container.can_connect():
             logger.warning("Recyclarr container not ready, skipping profile sync")
+            return True
+
+        image = self._get_recyclarr_image()
+        guides_ref = str(self.config.get("trash-guides-ref", "")) or "master"
+        guides_url = str(self.config.get("trash-guides-url", "")) or TRASH_GUIDES.url
+        digest = trash_sync_digest(
+            profiles_config,
+            self._get_variant().value,
+            self._get_app_version(),
+            image.registrypath if image else "",
+            guides=f"{guides_url}@{guides_ref}",
+        )
+        max_age = float(self.config.get("trash-sync-interval", 24))
+        if not force and not is_trash_sync_due(
+            digest, self._stored.trash_sync_digest, self._stored.trash_sync_at, max_age
+        ):
+            logger.debug("Trash profiles in sync (digest %s), skipping Recyclarr", digest[:12])
+            return True
+
+        self._reconcile_recyclarr_policy(job_mode=job_mode)
+        settings = build_recyclarr_settings(guides_url, guides_ref)
+        if job_mode:
+            return self._run_recyclarr_job(api_key, profiles_config, settings, digest, image)
+
+        start = time.monotonic()
+        base_url = f"http://localhost:{WEBUI_PORT}{self._get_url_base() or ''}"
+        # Read the guides from the local, pinned mirrors when they are available
+        cache = GuidesCache(container, self.charm_dir / "guides")
+        settings = cache.reconcile(ref=guides_ref, trash_guides_url=guides_url) or settings
+        try:
+            run_recyclarr(
+                container,
+                build_recyclarr_config(MediaManager.RADARR, api_key, base_url, profiles_config),
+                settings,
+            )
+        except RecyclarrError:
+            self._record_trash_sync("", time.monotonic() - start, success=False)
+            raise
+        self._record_trash_sync(digest, time.monotonic() - start, success=True)
+        return True
+
+    def _run_recyclarr_job(
+        self,
+        api_key: str,
+        profiles_config: str,
+        settings: str,
+        digest: str,
+        image: ImageResource | None,
+    ) -> bool:
+        """Start or collect the Recyclarr Job for digest; False while it runs.
+
+        While the Job runs, a reconcile is scheduled every RECYCLARR_JOB_POLL
+        seconds, so its result is collected (and the profiles republished)
+        shortly after it finishes.
+        """
+        if not image:
+            raise RecyclarrError("recyclarr-image resource is not available for the job")
+
+        base_url = f"{self._internal_url}{self._get_url_base() or ''}"
+        result = reconcile_recyclarr_job(
+            self.k8s,
+            namespace=self.model.name,
+            app_name=self.app.name,
+            image=image,
+            digest=digest,
+            config=build_recyclarr_config(MediaManager.RADARR, api_key, base_url, profiles_config),
+            settings=settings,
+            pod_labels=self._service_mesh.labels(),
+        )
+        if result.status == RecyclarrJobStatus.PENDING:
+            logger.info("Recyclarr job running, checking again in %ds", RECYCLARR_JOB_POLL)
+            self._debouncer.schedule(RECYCLARR_JOB_POLL)
+            return False
+        if result.status == RecyclarrJobStatus.FAILED:
+            self._record_trash_sync("", result.duration, success=False)
+            raise RecyclarrError("Recyclarr job failed, see its pod logs")
+        self._record_trash_sync(digest, result.duration, success=True)
+        return True
+
+    def _record_trash_sync(self, digest: str, duration: float, *, success: bool) -> None:
+        """Persist the outcome of a Recyclarr run; a failed run clears the digest."""
+        self._stored.trash_sync_digest = digest
+        self._stored.trash_sync_at = time.time()
+        self._stored.trash_sync_seconds = duration
+        self._stored.trash_sync_success = success
+
+    def _get_app_version(self) -> str:
+        """Read the image's package_info (LinuxServer build metadata, incl. version)."""
+        try:
+            return self._container.pull(PACKAGE_INFO_FILE).read()
+        except ops.pebble.PathError as e:
+            logger.debug("Could not read %s: %s", PACKAGE_INFO_FILE, e)
+            return ""
+
+    def _reconcile_recyclarr_policy(self, *, job_mode: bool) -> None:
+        """Let the Recyclarr Job's service account reach the WebUI on a meshed model.
+
+        The related-app AppPolicy entries don't cover the Job pod, so job mode
+        adds its own policy; sidecar mode deletes it.
+        """
+        mesh_type = self._service_mesh.mesh_type()
+        if mesh_type is None:
+            return
+        manager = self._recyclarr_policy_manager()
+        if not job_mode:
+            manager.delete()
             return
+        policy = MeshPolicy(
+            source_namespace=self.model.name,
+            source_app_name=recyclarr_service_account(self.app.name),
+            target_namespace=self.model.name,
+            target_app_name=self.app.name,
+            endpoints=[Endpoint(ports=[WEBUI_PORT])],
+        )
+        manager.reconcile([policy], mesh_type)
 
-        sync_trash_profiles(
-            container=container,
-            manager=MediaManager.RADARR,
-            api_key=api_key,
-            profiles_config=profiles_config,
-            port=WEBUI_PORT,
-            base_url=self._get_url_base(),
+    def _recyclarr_policy_manager(self) -> PolicyResourceManager:
+        return PolicyResourceManager(
+            self,
+            self._service_mesh.lightkube_client,
+            labels={
+                "app.kubernetes.io/name": f"{self.app.name}-{self.model.name}",
+                "kubernetes-resource-handler-scope": "recyclarr-job",
+            },
+            logger=logger,
         )
 
+    def _on_remove(self, _: ops.RemoveEvent) -> None:
+        """Delete the Recyclarr Job's mesh policy.
+
+        Jobs, Secrets and the service account are owned by the app
+        StatefulSet and are garbage-collected with it.
+        """
+        if self.unit.is_leader() and self.config.get("recyclarr-mode") == "job":
+            self._recyclarr_policy_manager().delete()
+
+    def _get_recyclarr_image(self) -> ImageResource | None:
+        """Return the recyclarr-image resource, or None if it is unavailable.
+
+        Only its registrypath may feed the stored sync digest; the registry
+        credentials are for the Job's image pull secret.
+        """
+        try:
+            content = self.model.resources.fetch("recyclarr-image").read_text()
+        except (NameError, ops.ModelError, OSError) as e:
+            logger.debug("Could not fetch recyclarr-image resource: %s", e)
+            return None
+        return parse_image_resource(content)
+
     def _get_quality_profiles(self, api_key: str) -> list[QualityProfile]:
         """Fetch quality profiles from Radarr API."""
         try:
-            with self._get_api_client(api_key) as api:
-                profiles = api.get_quality_profiles()
-                return [QualityProfile(id=p.id, name=p.name) for p in profiles]
+            api = self._get_api_client(api_key)
+            profiles = api.get_quality_profiles()
+            return [QualityProfile(id=p.id, name=p.name) for p in profiles]
         except ArrApiError as e:
             logger.debug("Failed to fetch quality profiles: %s", e)
             return []
@@ -473,19 +705,19 @@ class RadarrCharm(ops.CharmBase):
     def _get_root_folders(self, api_key: str) -> list[str]:
         """Fetch root folders from Radarr API."""
         try:
-            with self._get_api_client(api_key) as api:
-                folders = api.get_root_folders()
-                return [f.path for f in folders]
+            api = self._get_api_client(api_key)
+            folders = api.get_root_folders()
+            return [f.path for f in folders]
         except ArrApiError as e:
             logger.debug("Failed to fetch root folders: %s", e)
             return []
 
     def _publish_media_manager(self, api_key: str, secret_id: str) -> None:
         """Publish media manager data to all connected applications."""
-        secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
+        secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
         for relation in self.model.relations.get("media-manager", []):
             if relation.app:
-                secret.grant(relation)
+                self._publisher.grant(secret, relation)
 
         quality_profiles = self._get_quality_profiles(api_key)
         variant_root_folder = self._get_root_folder_path()
@@ -500,7 +732,7 @@ class RadarrCharm(ops.CharmBase):
             root_folders=[variant_root_folder],
             variant=self._get_variant(),
         )
-        self._media_manager.publish_data(data)
+        self._publisher.publish("media-manager", data, self._media_manager.publish_data)
         logger.info("Published media manager provider data")
 
     def _publish_media_indexer_requirer(self, secret_id: str) -> None:
@@ -509,9 +741,9 @@ class RadarrCharm(ops.CharmBase):
         if not relation:
             return
 
-        secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
+        secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
         if relation.app:
-            secret.grant(relation)
+            self._publisher.grant(secret, relation)
 
         data = MediaIndexerRequirerData(
             api_url=self._internal_url,
@@ -520,7 +752,7 @@ class RadarrCharm(ops.CharmBase):
             instance_name=self.app.name,
             base_path=self._get_url_base(),
         )
-        self._media_indexer.publish_data(data)
+        self._publisher.publish("media-indexer", data, self._media_indexer.publish_data)
         logger.info("Published media indexer requirer data")
 
     def _publish_download_client_requirer(self) -> None:
@@ -531,7 +763,7 @@ class RadarrCharm(ops.CharmBase):
             manager=MediaManager.RADARR,
             instance_name=self.app.name,
         )
-        self._download_client.publish_data(data)
+        self._publisher.publish("download-client", data, self._download_client.publish_data)
         logger.info("Published download client requirer data")
 
     def _configure_ingress(self) -> None:
@@ -574,7 +806,7 @@ class RadarrCharm(ops.CharmBase):
             return
 
         new_api_key = generate_api_key()
-        event.secret.set_content({"api-key": new_api_key})
+        self._secrets.set_content(event.secret, {"api-key": new_api_key})
         logger.info("Rotated API key secret")
 
         if not self._container.can_connect():
@@ -586,6 +818,21 @@ class RadarrCharm(ops.CharmBase):
         self._reconcile_config(new_api_key)
         self._container.replan()
         self._reconcile_scraparr(new_api_key)
+        self._reconcile_collectors(new_api_key)
+
+    def _on_workload_ready(self, event: ops.PebbleCustomNoticeEvent) -> None:
+        """Run the workload-dependent steps as soon as the workload answers.
+
+        The ready check recovering needs no handler here: pebble-check-recovered
+        is already one of the reconcilable events.
+        """
+        if event.notice.key == WORKLOAD_READY_NOTICE:
+            self._debouncer.request(event)
+
+    def _arm_ready_notice(self) -> None:
+        """Have Pebble notify the charm once the workload answers its readiness URL."""
+        check = self._build_readiness_check()[f"{CONTAINER_NAME}-ready"]
+        arm_ready_notice(self._container, check["http"]["url"])
 
     def _reconcile(self, _: ops.EventBase) -> None:
         """Reconcile charm state with desired configuration.
@@ -605,25 +852,28 @@ class RadarrCharm(ops.CharmBase):
            - Reconcile root folder from config
            - Publish media-manager data to related apps
         """
-        self._topology.reconcile()
+        with self._profiler.step("topology"):
+            self._topology.reconcile()
         # The topology endpoint is a cluster-internal concern - crowsnest polls
         # it from inside the same K8s cluster. Hardcode the in-cluster Service
         # FQDN; never expose this URL externally.
-        self._crowsnest.publish_data(
+        self._publisher.publish(
+            "crowsnest",
             CrowsnestProviderData(
                 topology_url=(
                     f"http://{self.app.name}.{self.model.name}"
                     f".svc.cluster.local:{self._topology.port}/metrics"
                 )
-            )
+            ),
+            self._crowsnest.publish_data,
         )
 
         if not self.unit.is_leader():
             if self._container.can_connect():
-                self._container.add_layer(
+                reconcile_layer(
+                    self._container,
                     f"{CONTAINER_NAME}-check",
                     {"checks": self._build_readiness_check()},
-                    combine=True,
                 )
             return
 
@@ -634,7 +884,8 @@ class RadarrCharm(ops.CharmBase):
                 self.app.name,
             )
 
-        self._configure_ingress()
+        with self._profiler.step("ingress"):
+            self._configure_ingress()
 
         if not self._container.can_connect():
             return
@@ -644,57 +895,68 @@ class RadarrCharm(ops.CharmBase):
             return
 
         # Ensure API key exists (charm creates it, not the app)
-        secret_data = self._get_api_key_secret()
-        if secret_data:
-            api_key, secret_id = secret_data
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            sync_secret_rotation_policy(
-                secret, str(self.config.get("api-key-rotation", "disabled"))
-            )
-        else:
-            api_key = generate_api_key()
-            secret_id = self._create_api_key_secret(api_key)
-
-        # Publish requirer data to media-indexer (Prowlarr) relation
-        self._publish_media_indexer_requirer(secret_id)
+        with self._profiler.step("api-key"):
+            secret_data = self._get_api_key_secret()
+            if secret_data:
+                api_key, secret_id = secret_data
+                secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+                sync_secret_rotation_policy(
+                    secret, str(self.config.get("api-key-rotation", "disabled"))
+                )
+            else:
+                api_key = generate_api_key()
+                secret_id = self._create_api_key_secret(api_key)
 
-        # Publish requirer data to download-client relations
-        self._publish_download_client_requirer()
+        # Publish requirer data to media-indexer (Prowlarr) and download-client relations
+        with self._profiler.step("publish-requirers"):
+            self._publish_media_indexer_requirer(secret_id)
+            self._publish_download_client_requirer()
 
         # Reconcile config.xml (preserves user settings like authentication)
-        self._reconcile_config(api_key)
+        with self._profiler.step("config"):
+            self._reconcile_config(api_key)
 
-        # Fix /config ownership (Juju storage mounts as root)
-        self._container.exec(["chown", "-R", f"{storage.puid}:{storage.pgid}", "/config"]).wait()
+        # Fix /config ownership (Juju storage mounts as root), only walking the tree on drift
+        with self._profiler.step("ownership"):
+            reconcile_ownership(self._container, "/config", storage.puid, storage.pgid)
 
         # Mount shared storage PVC
-        reconcile_storage_volume(
-            manager=self.k8s,
-            statefulset_name=self.app.name,
-            namespace=self.model.name,
-            container_name=CONTAINER_NAME,
-            pvc_name=storage.pvc_name,
-            mount_path=storage.mount_path,
-            pgid=storage.pgid,
-        )
+        with self._profiler.step("storage-volume"):
+            reconcile_storage_volume(
+                manager=self.statefulset,
+                statefulset_name=self.app.name,
+                namespace=self.model.name,
+                container_name=CONTAINER_NAME,
+                pvc_name=storage.pvc_name,
+                mount_path=storage.mount_path,
+                pgid=storage.pgid,
+            )
 
         # Reconcile VPN gateway client
-        self._reconcile_vpn()
+        with self._profiler.step("vpn"):
+            self._reconcile_vpn()
 
-        # Ensure user/group exist for Pebble's user-id/group-id
-        ensure_pebble_user(self._container, storage.puid, storage.pgid, username="radarr")
+        # Send the StatefulSet changes above as one patch, so the pod rolls at most once
+        with self._profiler.step("statefulset-patch"):
+            self._flush_statefulset()
 
-        # Configure Pebble layer and start service
-        layer = self._build_pebble_layer(storage.puid, storage.pgid)
-        self._container.add_layer(SERVICE_NAME, layer, combine=True)
-        self._container.replan()
+        # Configure Pebble user and layer, (re)starting the service only if the plan changed
+        with self._profiler.step("pebble-layer"):
+            ensure_pebble_user(self._container, storage.puid, storage.pgid, username="radarr")
+            layer = self._build_pebble_layer(storage.puid, storage.pgid)
+            reconcile_layer(self._container, SERVICE_NAME, layer)
 
         # Reconcile scraparr sidecar (Prometheus exporter)
-        self._reconcile_scraparr(api_key)
+        with self._profiler.step("scraparr"):
+            self._reconcile_scraparr(api_key)
+
+        # Hand the background collector daemon the queue endpoint it polls
+        with self._profiler.step("collectors"):
+            self._reconcile_collectors(api_key)
 
-        self.unit.set_ports(WEBUI_PORT, self._topology.port)
+        self.unit.set_ports(WEBUI_PORT, self._topology.port, COLLECTOR_PORT)
 
-        if self._is_workload_ready(api_key):
+        if self._probe_workload_ready(api_key):
             # Sync Trash Guides profiles (runs recyclarr if trash-profiles configured)
             # TODO(parrot): config-changed hook fails in recyclarr integration test since
             # Radarr was bumped from 6.0.4 → 6.1.1 (via renovate, image tag
@@ -703,18 +965,25 @@ class RadarrCharm(ops.CharmBase):
             # changed the API contract for quality profiles or host config endpoints
             # that Recyclarr relies on during config-changed.
             try:
-                self._sync_trash_profiles(api_key)
+                with self._profiler.step("trash-profiles"):
+                    self._sync_trash_profiles(api_key)
             except RecyclarrError as e:
                 logger.error("Failed to sync Trash Guides profiles: %s", e)
 
             # Reconcile download clients from relations
-            self._reconcile_download_clients(api_key)
+            with self._profiler.step("download-clients"):
+                self._reconcile_download_clients(api_key)
 
             # Reconcile root folder based on variant
-            self._reconcile_root_folder(api_key, storage.puid, storage.pgid)
+            with self._profiler.step("root-folder"):
+                self._reconcile_root_folder(api_key, storage.puid, storage.pgid)
 
             # Publish media manager data to related apps
-            self._publish_media_manager(api_key, secret_id)
+            with self._profiler.step("publish-media-manager"):
+                self._publish_media_manager(api_key, secret_id)
+        else:
+            # Still booting: have Pebble notify the charm once it answers
+            self._arm_ready_notice()
 
     def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
         """Collect all unit statuses. Framework picks the worst."""
@@ -763,12 +1032,10 @@ class RadarrCharm(ops.CharmBase):
         if not self._container.can_connect():
             return
 
-        secret_data = self._get_api_key_secret()
-        if not secret_data:
+        if not self._get_api_key_secret():
             return
 
-        api_key, _ = secret_data
-        if not self._is_workload_ready(api_key):
+        if not self._observed_workload_ready():
             event.add_status(ops.WaitingStatus("Waiting for workload"))
         else:
             event.add_status(ops.ActiveStatus())
@@ -787,8 +1054,8 @@ class RadarrCharm(ops.CharmBase):
         self._reconcile_config(new_api_key)
 
         try:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            secret.set_content({"api-key": new_api_key})
+            secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+            self._secrets.set_content(secret, {"api-key": new_api_key})
             logger.info("Rotated API key via action")
         except ops.SecretNotFoundError:
             self._create_api_key_secret(new_api_key)
@@ -799,6 +1066,7 @@ class RadarrCharm(ops.CharmBase):
             logger.info("Restarted Radarr after API key rotation")
 
         self._reconcile_scraparr(new_api_key)
+        self._reconcile_collectors(new_api_key)
 
         event.set_results({"result": "API key rotated successfully"})
 
@@ -822,8 +1090,10 @@ class RadarrCharm(ops.CharmBase):
             return
 
         try:
-            self._sync_trash_profiles(api_key)
-            event.set_results({"result": "Trash profiles synced successfully"})
+            if self._sync_trash_profiles(api_key, force=True):
+                event.set_results({"result": "Trash profiles synced successfully"})
+            else:
+                event.set_results({"result": "Recyclarr job started"})
         except RecyclarrError as e:
             event.fail(f"Recyclarr sync failed: {e}")
 
@@ -6,7 +6,8 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
-from ops.testing import Container, Context, Exec
+from ops.pebble import Layer
+from ops.testing import Container, Context, Exec, Resource
 
 from charm import RadarrCharm
 
@@ -16,6 +17,24 @@ RADARR_CONTAINER = Container(
     execs={Exec(["chown", "-R", "1000:1000", "/config"])},
 )
 
+# The ready check as the charm layers it; Scenario only accepts a CheckInfo
+# that matches a check in the container's plan
+RADARR_READY_LAYER = Layer(
+    {
+        "checks": {
+            "radarr-ready": {
+                "override": "replace",
+                "level": "ready",
+                "http": {"url": "http://localhost:7878/ping"},
+                "period": "10s",
+                "timeout": "3s",
+                "threshold": 3,
+                "startup": "enabled",
+            }
+        }
+    }
+)
+
 SCRAPARR_CONTAINER = Container(name="scraparr", can_connect=True)
 
 
@@ -25,6 +44,16 @@ def ctx() -> Context[RadarrCharm]:
     return Context(RadarrCharm)
 
 
+@pytest.fixture
+def recyclarr_image(tmp_path) -> Resource:
+    """The recyclarr-image oci-image resource as Juju attaches it."""
+    path = tmp_path / "recyclarr-image.yaml"
+    path.write_text(
+        "registrypath: ghcr.io/recyclarr/recyclarr:7\nusername: user\npassword: hunter2\n"
+    )
+    return Resource(name="recyclarr-image", path=path)
+
+
 @pytest.fixture
 def mock_k8s():
     """Create a mock K8sResourceManager."""
@@ -32,3 +61,10 @@ def mock_k8s():
         mock_instance = MagicMock()
         mock_class.return_value = mock_instance
         yield mock_instance
+
+
+@pytest.fixture(autouse=True)
+def mock_collectors():
+    """Keep reconciles from spawning the background collector daemon."""
+    with patch("charm.reconcile_collectors") as mock_reconcile:
+        yield mock_reconcile
@@ -0,0 +1,113 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the background queue collector."""
+
+import json
+import stat
+from unittest.mock import patch
+
+import _collector_daemon
+from _collector_daemon import Collector, render
+from _radarr import _collector
+
+QUEUE = {
+    "records": [
+        {
+            "title": 'Movie "2024"',
+            "status": "downloading",
+            "protocol": "torrent",
+            "size": 100,
+            "sizeleft": 40,
+        }
+    ]
+}
+
+
+def _arr_collector() -> Collector:
+    return Collector(_collector.collector_spec("arr-queue", "http://localhost:7878/", "key"))
+
+
+def test_arr_queue_snapshot_renders_one_series_per_item():
+    collector = _arr_collector()
+    with patch.object(_collector_daemon, "_fetch_json", return_value=QUEUE) as fetch:
+        collector.poll(now=1000.0)
+
+    fetch.assert_called_once_with(
+        "http://localhost:7878/api/v3/queue?pageSize=1000", 5.0, headers={"X-Api-Key": "key"}
+    )
+    text = render(collector.snapshot)
+    labels = 'title="Movie \\"2024\\"",status="downloading",protocol="torrent"'
+    assert f"charmarr_queue_item_size_bytes{{{labels}}} 100.0" in text
+    assert f"charmarr_queue_item_remaining_bytes{{{labels}}} 40.0" in text
+    assert "# TYPE charmarr_queue_item_size_bytes gauge" in text
+    assert "# TYPE charmarr_queue_status_items counter" in text
+    assert collector.up
+    assert collector.next_due == 1000.0 + collector.interval
+
+
+def test_failed_poll_keeps_last_snapshot_and_backs_off():
+    collector = _arr_collector()
+    with patch.object(_collector_daemon, "_fetch_json", return_value=QUEUE):
+        collector.poll(now=1000.0)
+    snapshot = collector.snapshot
+
+    with patch.object(_collector_daemon, "_fetch_json", side_effect=OSError("refused")):
+        collector.poll(now=1030.0)
+        first_wait = collector.next_due - 1030.0
+        collector.poll(now=1100.0)
+        second_wait = collector.next_due - 1100.0
+
+    assert collector.snapshot is snapshot
+    assert not collector.up
+    assert collector.last_success == 1000.0
+    assert collector.interval < first_wait < second_wait
+
+
+def test_config_written_owner_only_and_only_on_change(tmp_path, monkeypatch):
+    config = tmp_path / "collector.json"
+    monkeypatch.setattr(_collector, "COLLECTOR_CONFIG_FILE", config)
+    specs = [_collector.collector_spec("arr-queue", "http://localhost:7878", "key")]
+
+    assert _collector._write_config(specs) is True
+    assert stat.S_IMODE(config.stat().st_mode) == 0o600
+    assert json.loads(config.read_text())["collectors"] == specs
+    assert _collector._write_config(specs) is False
+
+
+def test_queue_series_budget():
+    items = [
+        ({"title": f"Release.{n}.{'x' * 60}", "status": status, "protocol": "torrent"}, 10.0, n)
+        for n, status in enumerate(["queued", "downloading", "downloading", "queued", "paused"])
+    ]
+
+    families = {
+        name: samples
+        for name, _, samples in _collector_daemon._queue_families(
+            "media item", items, max_series=2, title="truncate"
+        )
+    }
+
+    remaining = families["charmarr_queue_item_remaining_bytes"]
+    assert [labels["title"][:9] for labels, _ in remaining] == ["Release.4", "Release.3", "other"]
+    assert max(len(labels["title"]) for labels, _ in remaining) == 48
+    assert remaining[-1] == (dict.fromkeys(("title", "status", "protocol"), "other"), 3.0)
+    # Sums over the budgeted family and the per-status rollups match the queue
+    assert sum(value for _, value in remaining) == 10.0
+    counts = families["charmarr_queue_status_items"]
+    by_status = {labels["status"]: value for labels, value in counts}
+    assert by_status == {"downloading": 2.0, "paused": 1.0, "queued": 2.0}
+
+
+def test_hashed_titles_are_stable_and_opaque():
+    hashed = _collector_daemon.shape_title("Some.Release.2160p", "hash")
+    assert hashed == _collector_daemon.shape_title("Some.Release.2160p", "hash")
+    assert "Release" not in hashed
+
+
+def test_legacy_requests_total_stays_a_gauge():
+    counts = {"pending": 2, "approved": 5}
+    with patch.object(_collector_daemon, "_fetch_json", return_value=counts):
+        families = _collector_daemon.collect_seerr_requests("http://localhost:5055", "key", 5.0)
+
+    assert "# TYPE charmarr_requests_total gauge" in render(families)
@@ -0,0 +1,58 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the notice-driven debounced reconcile."""
+
+import dataclasses
+from unittest.mock import patch
+
+from ops.testing import Notice, State
+
+from _radarr._debounce import DEBOUNCE_SERVICE, RECONCILE_NOTICE
+
+from .conftest import RADARR_CONTAINER, SCRAPARR_CONTAINER
+
+NOTICE = Notice(key=RECONCILE_NOTICE)
+
+
+def _state(debounce: int) -> State:
+    container = dataclasses.replace(RADARR_CONTAINER, notices=[NOTICE])
+    return State(
+        leader=True,
+        containers=[container, SCRAPARR_CONTAINER],
+        config={"reconcile-debounce": debounce},
+    )
+
+
+def test_without_delay_every_hook_reconciles(ctx, mock_k8s):
+    with patch("charm.RadarrCharm._reconcile") as reconcile:
+        ctx.run(ctx.on.config_changed(), _state(0))
+    reconcile.assert_called_once()
+
+
+def test_burst_coalesces_into_one_notice_driven_reconcile(ctx, mock_k8s):
+    """Hooks only arm the timer; the notice runs one reconcile."""
+    state = _state(5)
+    with patch("charm.RadarrCharm._reconcile") as reconcile:
+        for _ in range(3):
+            state = ctx.run(ctx.on.config_changed(), state)
+        reconcile.assert_not_called()
+        assert DEBOUNCE_SERVICE in state.get_container("radarr").plan.services
+
+        container = state.get_container("radarr")
+        state = ctx.run(ctx.on.pebble_custom_notice(container, NOTICE), state)
+        reconcile.assert_called_once()
+
+        # A stale notice with nothing pending is ignored
+        state = ctx.run(ctx.on.pebble_custom_notice(container, NOTICE), state)
+        reconcile.assert_called_once()
+
+    with ctx(ctx.on.update_status(), state) as mgr:
+        metrics = {
+            f.name: (f.type, f.samples[0].value) for f in mgr.charm._debouncer.build_metrics()
+        }
+        mgr.run()
+    assert metrics == {
+        "charmarr_reconcile_coalesced_total": ("counter", 3.0),
+        "charmarr_reconcile_executed_total": ("counter", 1.0),
+    }
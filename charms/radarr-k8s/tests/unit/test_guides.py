@@ -0,0 +1,74 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the local TRaSH guides cache."""
+
+from unittest.mock import MagicMock
+
+import ops
+
+from _radarr import GuidesCache
+from _radarr._guides import build_mirror_settings
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+def _container(*, cached: bool, fetch_fails: bool = False) -> MagicMock:
+    container = MagicMock()
+    container.exists.return_value = cached
+    commands: list[list[str]] = []
+
+    def exec_(command, **_):
+        commands.append(command)
+        process = MagicMock()
+        if fetch_fails and "fetch" in command:
+            process.wait_output.side_effect = ops.pebble.ExecError(command, 128, "", "offline")
+        else:
+            process.wait_output.return_value = (f"{COMMIT}\n", "")
+        return process
+
+    container.exec.side_effect = exec_
+    container.commands = commands
+    return container
+
+
+def test_settings_point_at_local_mirrors():
+    settings = build_mirror_settings("/cache")
+    assert "clone_url: file:///cache/trash-guides.git" in settings
+    assert "clone_url: file:///cache/config-templates.git" in settings
+    assert settings.count("branch: charmarr") == 2
+
+
+def test_without_snapshot_or_cache_recyclarr_clones_upstream(tmp_path):
+    container = _container(cached=False)
+    assert GuidesCache(container, tmp_path).reconcile(ref="master", trash_guides_url="u") is None
+    container.exec.assert_not_called()
+    container.push.assert_not_called()
+
+
+def test_seeds_from_snapshot_then_pins(tmp_path):
+    for name in ("trash-guides", "config-templates"):
+        (tmp_path / f"{name}.tar.gz").write_bytes(b"snapshot")
+    container = _container(cached=False)
+
+    settings = GuidesCache(container, tmp_path).reconcile(ref="master", trash_guides_url="u")
+
+    assert settings == build_mirror_settings()
+    assert any(c[0] == "sh" and "tar -xzf" in c[2] for c in container.commands)
+    assert ["fetch", "--quiet", "--depth", "1", "u", "master"] in [
+        c[3:] for c in container.commands
+    ]
+    # Only the snapshot archives are pushed; settings go to the caller
+    assert {c.args[0].rsplit("/", 1)[-1] for c in container.push.call_args_list} == {
+        "trash-guides.tar.gz",
+        "config-templates.tar.gz",
+    }
+
+
+def test_offline_refresh_falls_back_to_cached_ref(tmp_path):
+    container = _container(cached=True, fetch_fails=True)
+
+    assert GuidesCache(container, tmp_path).reconcile(ref=COMMIT, trash_guides_url="u")
+
+    update_refs = [c[3:] for c in container.commands if "update-ref" in c]
+    assert ["update-ref", "refs/heads/charmarr", f"{COMMIT}^{{commit}}"] in update_refs
@@ -0,0 +1,70 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for drift-gated ownership reconciliation."""
+
+from io import StringIO
+from unittest.mock import MagicMock
+
+import ops
+
+from _radarr import reconcile_ownership
+
+
+def _file(name: str, uid: int = 1000, gid: int = 1000) -> MagicMock:
+    info = MagicMock(user_id=uid, group_id=gid)
+    info.name = name
+    return info
+
+
+def _container(marker: str | None, root_uid: int = 1000, entry_uid: int = 1000) -> MagicMock:
+    container = MagicMock()
+    if marker is None:
+        container.pull.side_effect = ops.pebble.PathError("not-found", "no marker")
+    else:
+        container.pull.return_value = StringIO(marker)
+
+    def list_files(path, itself=False):
+        if itself:
+            return [_file("config", uid=root_uid)]
+        return [_file("config.xml", uid=entry_uid), _file("MediaCover", uid=entry_uid)]
+
+    container.list_files.side_effect = list_files
+    return container
+
+
+def test_skips_chown_when_marker_and_sample_match():
+    """No recursive chown when recorded ids match and sampled entries agree."""
+    container = _container("1000:1000")
+
+    assert reconcile_ownership(container, "/config", 1000, 1000) is None
+    container.exec.assert_not_called()
+    container.push.assert_not_called()
+
+
+def test_chowns_when_marker_missing():
+    """First run applies the chown and records the ids."""
+    container = _container(None)
+
+    duration = reconcile_ownership(container, "/config", 1000, 1000)
+
+    assert duration is not None
+    container.exec.assert_called_once_with(["chown", "-R", "1000:1000", "/config"])
+    container.push.assert_called_once()
+    assert container.push.call_args.args == ("/config/.charmarr-ownership", "1000:1000")
+
+
+def test_chowns_when_ids_change():
+    """Changed PUID/PGID triggers a full chown."""
+    container = _container("1000:1000", root_uid=1234, entry_uid=1234)
+
+    assert reconcile_ownership(container, "/config", 1234, 5678) is not None
+    container.exec.assert_called_once_with(["chown", "-R", "1234:5678", "/config"])
+
+
+def test_chowns_when_sampled_entry_drifted():
+    """A sampled entry owned by root triggers a full chown despite the marker."""
+    container = _container("1000:1000", entry_uid=0)
+
+    assert reconcile_ownership(container, "/config", 1000, 1000) is not None
+    container.exec.assert_called_once()
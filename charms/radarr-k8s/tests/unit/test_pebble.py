@@ -0,0 +1,98 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for plan-diffing Pebble layer reconciliation."""
+
+from unittest.mock import MagicMock
+
+import ops
+import yaml
+
+from _radarr import arm_ready_notice, reconcile_layer
+from _radarr._ready import READY_WAITER_SERVICE
+
+LAYER: ops.pebble.LayerDict = {
+    "services": {
+        "radarr": {
+            "override": "replace",
+            "command": "/app/radarr/bin/Radarr -nobrowser -data=/config",
+            "startup": "enabled",
+        }
+    },
+    "checks": {
+        "radarr-ready": {
+            "override": "replace",
+            "level": "ready",
+            "http": {"url": "http://localhost:7878/ping"},
+        }
+    },
+}
+
+
+def _container(plan: dict, running: bool = True) -> MagicMock:
+    container = MagicMock()
+    container.get_plan.return_value = ops.pebble.Plan(yaml.safe_dump(plan))
+    info = MagicMock(startup=ops.pebble.ServiceStartup.ENABLED)
+    info.is_running.return_value = running
+    container.get_services.return_value = {"radarr": info}
+    return container
+
+
+def test_unchanged_plan_skips_add_layer_and_replan():
+    """Nothing is written when the plan already matches the layer."""
+    container = _container(LAYER)
+
+    diff = reconcile_layer(container, "radarr", LAYER)
+
+    assert not diff.changed
+    container.add_layer.assert_not_called()
+    container.replan.assert_not_called()
+
+
+def test_changed_service_is_restarted():
+    """A changed service definition is written and replanned."""
+    container = _container({"services": {}, "checks": LAYER["checks"]})
+
+    diff = reconcile_layer(container, "radarr", LAYER)
+
+    assert diff.restarted == ("radarr",)
+    assert diff.checks == ()
+    container.add_layer.assert_called_once_with("radarr", LAYER, combine=True)
+    container.replan.assert_called_once()
+
+
+def test_check_only_change_skips_replan():
+    """Checks are applied by add_layer alone, without restarting services."""
+    container = _container({"services": LAYER["services"], "checks": {}})
+
+    diff = reconcile_layer(container, "radarr", LAYER)
+
+    assert diff.restarted == ()
+    assert diff.checks == ("radarr-ready",)
+    container.add_layer.assert_called_once()
+    container.replan.assert_not_called()
+
+
+def test_stopped_service_is_started_without_rewriting_layer():
+    """An unchanged but stopped service is replanned so it starts again."""
+    container = _container(LAYER, running=False)
+
+    diff = reconcile_layer(container, "radarr", LAYER)
+
+    assert diff.started == ("radarr",)
+    container.add_layer.assert_not_called()
+    container.replan.assert_called_once()
+
+
+def test_ready_notice_waiter_is_started_once():
+    container = _container({})
+
+    assert arm_ready_notice(container, "http://localhost:7878/ping")
+    container.add_layer.assert_called_once()
+    container.restart.assert_called_once_with(READY_WAITER_SERVICE)
+
+    layer = container.add_layer.call_args.args[1]
+    container.get_plan.return_value = ops.pebble.Plan(yaml.safe_dump(layer))
+    container.get_service.return_value.is_running.return_value = True
+    assert not arm_ready_notice(container, "http://localhost:7878/ping")
+    container.start.assert_not_called()
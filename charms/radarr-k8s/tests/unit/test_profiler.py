@@ -0,0 +1,72 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the reconcile-step profiler."""
+
+import pytest
+from ops.testing import State
+
+from .conftest import RADARR_CONTAINER, SCRAPARR_CONTAINER
+
+
+def _samples(families, name: str) -> dict[str, float]:
+    family = next(f for f in families if f.name == name)
+    return {s.labels["step"]: s.value for s in family.samples}
+
+
+def test_step_timings_accumulate_across_dispatches(ctx, mock_k8s):
+    """Committed timings feed last/sum/count families on the next dispatch."""
+    state = State(leader=True, containers=[RADARR_CONTAINER, SCRAPARR_CONTAINER])
+    for _ in range(2):
+        with ctx(ctx.on.update_status(), state) as mgr:
+            with mgr.charm._profiler.step("probe"):
+                pass
+            with mgr.charm._profiler.step("probe"):
+                pass
+            state = mgr.run()
+
+    with ctx(ctx.on.update_status(), state) as mgr:
+        families = mgr.charm._profiler.build_metrics()
+        mgr.run()
+
+    assert _samples(families, "charmarr_reconcile_step_runs_total")["probe"] == 2.0
+    last = _samples(families, "charmarr_reconcile_step_last_duration_seconds")["probe"]
+    total = _samples(families, "charmarr_reconcile_step_duration_seconds_total")["probe"]
+    assert 0.0 <= last <= total
+    assert _samples(families, "charmarr_reconcile_step_last_run_timestamp_seconds")["probe"] > 0
+
+
+def test_failing_step_is_timed_and_reraised(ctx, mock_k8s):
+    """An exception inside a step propagates but its duration is still recorded."""
+    state = State(leader=True, containers=[RADARR_CONTAINER, SCRAPARR_CONTAINER])
+    with ctx(ctx.on.update_status(), state) as mgr:
+        profiler = mgr.charm._profiler
+        assert profiler.build_metrics() == []
+        with pytest.raises(RuntimeError), profiler.step("boom"):
+            raise RuntimeError("boom")
+        state = mgr.run()
+
+    with ctx(ctx.on.update_status(), state) as mgr:
+        families = mgr.charm._profiler.build_metrics()
+        mgr.run()
+
+    assert _samples(families, "charmarr_reconcile_step_runs_total")["boom"] == 1.0
+
+
+def test_cumulative_families_are_counters(ctx, mock_k8s):
+    state = State(leader=True, containers=[RADARR_CONTAINER, SCRAPARR_CONTAINER])
+    with ctx(ctx.on.update_status(), state) as mgr:
+        with mgr.charm._profiler.step("probe"):
+            pass
+        state = mgr.run()
+
+    with ctx(ctx.on.update_status(), state) as mgr:
+        types = {f.name: f.type for f in mgr.charm._profiler.build_metrics()}
+        mgr.run()
+
+    assert types == {
+        "charmarr_reconcile_step_last_duration_seconds": "gauge",
+        "charmarr_reconcile_step_duration_seconds_total": "counter",
+        "charmarr_reconcile_step_runs_total": "counter",
+        "charmarr_reconcile_step_last_run_timestamp_seconds": "gauge",
+    }
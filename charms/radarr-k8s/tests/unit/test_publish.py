@@ -0,0 +1,68 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for change-suppressed relation publishing."""
+
+from unittest.mock import MagicMock, patch
+
+from ops.testing import Relation, State
+from pydantic import BaseModel
+
+from _radarr._publish import canonical_payload
+
+from .conftest import RADARR_CONTAINER, SCRAPARR_CONTAINER
+
+
+class Payload(BaseModel):
+    instance_name: str
+    profiles: list[str]
+    labels: dict[str, str] = {}
+    tags: set[str] = set()
+
+
+def test_canonical_payload_ignores_key_and_set_order():
+    a = Payload(instance_name="radarr", profiles=["HD"], labels={"a": "1", "b": "2"}, tags={"x"})
+    b = Payload(instance_name="radarr", profiles=["HD"], labels={"b": "2", "a": "1"}, tags={"x"})
+    assert canonical_payload(a) == canonical_payload(b)
+    assert canonical_payload(a) != canonical_payload(Payload(instance_name="radarr", profiles=[]))
+
+
+def test_canonical_payload_keeps_list_order():
+    """Lists may be ordered (e.g. by priority), so reordering is a real change."""
+    a = Payload(instance_name="radarr", profiles=["HD", "4K"], tags={"x", "y", "z"})
+    b = Payload(instance_name="radarr", profiles=["4K", "HD"], tags={"z", "y", "x"})
+    assert canonical_payload(a) != canonical_payload(b)
+
+
+def test_publish_and_grant_only_when_changed(ctx, mock_k8s):
+    """Equal payloads and repeated grants are suppressed across hooks."""
+    relation = Relation(endpoint="media-manager", interface="media-manager")
+    state = State(
+        leader=True,
+        containers=[RADARR_CONTAINER, SCRAPARR_CONTAINER],
+        relations=[relation],
+    )
+    write = MagicMock()
+    secret = MagicMock(id="secret:api-key")
+    results = []
+
+    with patch("charm.RadarrCharm._reconcile"):
+        for event, profiles in (
+            (ctx.on.update_status(), ["HD", "4K"]),
+            (ctx.on.update_status(), ["HD", "4K"]),
+            (ctx.on.update_status(), ["HD"]),
+            (ctx.on.leader_elected(), None),
+            (ctx.on.update_status(), ["HD"]),
+        ):
+            with ctx(event, state) as mgr:
+                if profiles is not None:
+                    publisher = mgr.charm._publisher
+                    payload = Payload(instance_name="radarr", profiles=profiles)
+                    results.append(publisher.publish("media-manager", payload, write))
+                    publisher.grant(secret, mgr.charm.model.get_relation("media-manager"))
+                state = mgr.run()
+
+    assert results == [True, False, True, True]
+    assert write.call_count == 3
+    # Granted once, then again after leader-elected dropped the tracked state
+    assert secret.grant.call_count == 2
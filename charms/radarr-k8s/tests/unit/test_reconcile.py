@@ -3,13 +3,16 @@
 
 """Unit tests for RadarrCharm reconciliation."""
 
+import dataclasses
 from unittest.mock import patch
 
-from ops.testing import Container, Exec, Mount, Relation, Secret, State
+import ops
+from ops.testing import CheckInfo, Container, Exec, Mount, Notice, Relation, Secret, State
 
+from _radarr import WORKLOAD_READY_NOTICE
 from charmarr_lib.core.interfaces import MediaStorageProviderData
 
-from .conftest import RADARR_CONTAINER, SCRAPARR_CONTAINER
+from .conftest import RADARR_CONTAINER, RADARR_READY_LAYER, SCRAPARR_CONTAINER
 
 CHOWN_EXEC = Exec(["chown", "-R", "1000:1000", "/config"])
 TEST_API_KEY = "testkey123456789012345678901234"
@@ -513,3 +516,21 @@ def test_reconcile_publishes_download_client_requirer(ctx, mock_k8s, tmp_path):
         )
     relation_out = next(r for r in state.relations if r.endpoint == "download-client")
     assert "config" in relation_out.local_app_data
+
+
+def test_workload_ready_events_trigger_reconcile(ctx, mock_k8s):
+    """The ready check recovering or the ready notice runs the reconcile at once."""
+    notice = Notice(key=WORKLOAD_READY_NOTICE)
+    check = CheckInfo("radarr-ready", level=ops.pebble.CheckLevel.READY)
+    container = dataclasses.replace(
+        RADARR_CONTAINER,
+        notices=[notice],
+        layers={"radarr": RADARR_READY_LAYER},
+        check_infos={check},
+    )
+    state = State(leader=True, containers=[container, SCRAPARR_CONTAINER])
+
+    with patch("charm.RadarrCharm._reconcile") as reconcile:
+        ctx.run(ctx.on.pebble_custom_notice(container, notice), state)
+        ctx.run(ctx.on.pebble_check_recovered(container, check), state)
+        assert reconcile.call_count == 2
@@ -0,0 +1,279 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for running Recyclarr in the sidecar or as a Kubernetes Job."""
+
+import base64
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+from lightkube import ApiError
+from lightkube.models.batch_v1 import JobCondition, JobStatus
+from lightkube.models.meta_v1 import ObjectMeta, Status
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.batch_v1 import Job
+from lightkube.resources.core_v1 import Secret, ServiceAccount
+from ops.testing import Container, Exec, Resource, State
+
+from _radarr import (
+    ImageResource,
+    RecyclarrJobStatus,
+    build_recyclarr_config,
+    build_recyclarr_settings,
+    reconcile_recyclarr_job,
+)
+from _radarr._debounce import DEBOUNCE_SERVICE
+from _radarr._recyclarr import APP_LABEL, DIGEST_ANNOTATION, RECYCLARR_BIN
+from charmarr_lib.core import MediaManager, RecyclarrError
+
+from .conftest import RADARR_CONTAINER, SCRAPARR_CONTAINER
+
+_IMAGE = ImageResource("registry.example.com/recyclarr:7", "user", "hunter2")
+
+
+def _api_error_404() -> ApiError:
+    response = MagicMock()
+    response.status_code = 404
+    response.json.return_value = {"code": 404, "message": "not found"}
+    error = ApiError(response=response)
+    error.status = Status(code=404, message="not found")
+    return error
+
+
+def _job(digest: str, condition: str | None = None) -> Job:
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    status = JobStatus(startTime=start)
+    if condition:
+        status.conditions = [JobCondition(type=condition, status="True")]
+        status.completionTime = start + timedelta(seconds=42)
+    metadata = ObjectMeta(
+        name=f"radarr-recyclarr-{digest[:10]}", annotations={DIGEST_ANNOTATION: digest}
+    )
+    return Job(metadata=metadata, status=status)
+
+
+def _k8s(*jobs: Job) -> MagicMock:
+    """K8sResourceManager mock holding jobs (and the app StatefulSet), looked up by name."""
+    k8s = MagicMock()
+    by_name = {job.metadata.name: job for job in jobs if job.metadata}
+    k8s.client.list.return_value = list(jobs)
+
+    def _get(resource, name, namespace=None):
+        if resource is StatefulSet:
+            return StatefulSet(metadata=ObjectMeta(name=name, uid="sts-uid"))
+        if name not in by_name:
+            raise _api_error_404()
+        return by_name[name]
+
+    k8s.get.side_effect = _get
+    return k8s
+
+
+def _reconcile(k8s: MagicMock, digest: str = "abc", image: ImageResource = _IMAGE):
+    return reconcile_recyclarr_job(
+        k8s,
+        namespace="media",
+        app_name="radarr",
+        image=image,
+        digest=digest,
+        config="radarr: {}",
+        settings="repositories: {}",
+        pod_labels={"istio.io/dataplane-mode": "ambient"},
+    )
+
+
+def _applied(k8s: MagicMock) -> dict[tuple[type, str], Any]:
+    return {
+        (type(c.args[0]), c.args[0].metadata.name): c.args[0] for c in k8s.apply.call_args_list
+    }
+
+
+def test_config_targets_the_service_url():
+    config = yaml.safe_load(
+        build_recyclarr_config(
+            MediaManager.RADARR, "key", "http://radarr:7878/radarr", "hd-bluray-web, anime"
+        )
+    )
+    instance = config["radarr"]["radarr"]
+    assert instance["base_url"] == "http://radarr:7878/radarr"
+    assert instance["api_key"] == "key"
+    assert [i["template"] for i in instance["include"]] == [
+        "radarr-quality-definition-movie",
+        "radarr-quality-profile-hd-bluray-web",
+        "radarr-custom-formats-hd-bluray-web",
+        "radarr-quality-profile-anime",
+        "radarr-custom-formats-anime",
+    ]
+
+
+def test_settings_pin_commit_or_branch():
+    assert "sha: 0123abcd" in build_recyclarr_settings("u", "0123abcd")
+    assert "branch: master" in build_recyclarr_settings("u", "master")
+
+
+def test_missing_job_is_created_pending():
+    k8s = _k8s()
+
+    assert _reconcile(k8s).status == RecyclarrJobStatus.PENDING
+
+    applied = _applied(k8s)
+    job = applied[Job, "radarr-recyclarr-abc"]
+    assert (Secret, "radarr-recyclarr-abc") in applied
+    assert job.metadata.labels == {APP_LABEL: "radarr"}
+    assert job.metadata.annotations == {DIGEST_ANNOTATION: "abc"}
+    assert job.spec.backoffLimit == 0
+    # Kept until collected: a TTL could delete it before the charm reads it
+    assert job.spec.ttlSecondsAfterFinished is None
+    # Owned by the app, so removing it garbage-collects Jobs and Secrets
+    for resource in applied.values():
+        owners = resource.metadata.ownerReferences
+        assert [(o.kind, o.name, o.uid) for o in owners] == [("StatefulSet", "radarr", "sts-uid")]
+    # Recyclarr's settings.yml goes to the Job's own app data, named explicitly
+    pod = job.spec.template
+    container = pod.spec.containers[0]
+    assert "--app-data /charmarr-data" in container.command[-1]
+    assert {m.mountPath for m in container.volumeMounts} == {"/charmarr", "/charmarr-data"}
+    # Own mesh identity, without the API token
+    assert pod.metadata.labels == {"istio.io/dataplane-mode": "ambient"}
+    assert pod.spec.serviceAccountName == "radarr-recyclarr"
+    assert pod.spec.automountServiceAccountToken is False
+    assert (ServiceAccount, "radarr-recyclarr") in applied
+
+
+def test_job_pulls_with_the_resource_credentials():
+    """Charmhub images need the resource's registry login to be pulled."""
+    k8s = _k8s()
+
+    _reconcile(k8s)
+
+    job = _applied(k8s)[Job, "radarr-recyclarr-abc"]
+    secret = _applied(k8s)[Secret, "radarr-recyclarr-pull"]
+    assert [r.name for r in job.spec.template.spec.imagePullSecrets] == ["radarr-recyclarr-pull"]
+    assert secret.type == "kubernetes.io/dockerconfigjson"
+    auths = json.loads(secret.stringData[".dockerconfigjson"])["auths"]
+    assert auths["registry.example.com"]["auth"] == base64.b64encode(b"user:hunter2").decode()
+
+
+def test_public_image_needs_no_pull_secret():
+    k8s = _k8s()
+
+    _reconcile(k8s, image=ImageResource("recyclarr/recyclarr:7"))
+
+    job = _applied(k8s)[Job, "radarr-recyclarr-abc"]
+    assert job.spec.template.spec.imagePullSecrets is None
+    assert (Secret, "radarr-recyclarr-pull") not in _applied(k8s)
+
+
+@pytest.mark.parametrize(
+    ("condition", "expected"),
+    [
+        (None, RecyclarrJobStatus.PENDING),
+        ("Complete", RecyclarrJobStatus.SUCCEEDED),
+        ("Failed", RecyclarrJobStatus.FAILED),
+    ],
+)
+def test_existing_job_is_polled_then_collected(condition, expected):
+    k8s = _k8s(_job("abc", condition))
+
+    result = _reconcile(k8s)
+
+    assert result.status == expected
+    k8s.apply.assert_not_called()
+    if expected == RecyclarrJobStatus.PENDING:
+        k8s.delete.assert_not_called()
+    else:
+        assert result.duration == 42
+        assert [c.args[:2] for c in k8s.delete.call_args_list] == [
+            (Job, "radarr-recyclarr-abc"),
+            (Secret, "radarr-recyclarr-abc"),
+        ]
+
+
+def test_job_for_older_inputs_is_removed_and_a_new_one_started():
+    """The new run gets its own name, so it never races the old one's deletion."""
+    k8s = _k8s(_job("old"))
+
+    assert _reconcile(k8s, digest="new").status == RecyclarrJobStatus.PENDING
+
+    assert {c.args[1] for c in k8s.delete.call_args_list} == {"radarr-recyclarr-old"}
+    assert (Job, "radarr-recyclarr-new") in _applied(k8s)
+    assert (Job, "radarr-recyclarr-old") not in _applied(k8s)
+
+
+def test_terminating_job_for_same_inputs_is_waited_for():
+    job = _job("abc", "Failed")
+    assert job.metadata
+    job.metadata.deletionTimestamp = datetime(2025, 1, 1, tzinfo=UTC)
+    k8s = _k8s(job)
+
+    assert _reconcile(k8s).status == RecyclarrJobStatus.PENDING
+    k8s.delete.assert_not_called()
+    k8s.apply.assert_not_called()
+
+
+def _state(recyclarr_image: Resource, **config: str) -> State:
+    return State(
+        leader=True,
+        containers=[
+            RADARR_CONTAINER,
+            SCRAPARR_CONTAINER,
+            Container(
+                name="recyclarr",
+                can_connect=True,
+                execs={Exec([RECYCLARR_BIN, "sync"], stdout="Completed")},
+            ),
+        ],
+        config={"trash-profiles": "hd-bluray-web", **config},
+        resources={recyclarr_image},
+    )
+
+
+def test_sidecar_runs_recyclarr_from_charm_owned_paths(ctx, recyclarr_image):
+    """The default mode execs Recyclarr next to the app, on localhost."""
+    state = _state(recyclarr_image)
+    with ctx(ctx.on.update_status(), state) as mgr:
+        assert mgr.charm._sync_trash_profiles("key") is True
+        assert mgr.charm._stored.trash_sync_success is True
+        state = mgr.run()
+
+    [command] = [e.command for e in ctx.exec_history["recyclarr"]]
+    assert command[2:] == [
+        "--app-data",
+        "/charmarr/app-data",
+        "--config",
+        "/charmarr/recyclarr.yml",
+    ]
+    root = state.get_container("recyclarr").get_filesystem(ctx)
+    config = yaml.safe_load((root / "charmarr/recyclarr.yml").read_text())
+    assert config["radarr"]["radarr"]["base_url"] == "http://localhost:7878/radarr-k8s"
+    assert (root / "charmarr/app-data/settings.yml").exists()
+
+
+def test_job_mode_records_outcome_on_collection(ctx, mock_k8s, recyclarr_image):
+    """The sync is recorded only once the Job finishes; a failure raises."""
+    state = _state(recyclarr_image, **{"recyclarr-mode": "job"})
+    mock_k8s.get.side_effect = _k8s().get.side_effect
+    mock_k8s.client.list.return_value = []
+    with ctx(ctx.on.update_status(), state) as mgr:
+        assert mgr.charm._sync_trash_profiles("key") is False
+        assert mgr.charm._stored.trash_sync_digest == ""
+        job = mock_k8s.apply.call_args_list[-1].args[0]
+        assert job.spec.template.spec.containers[0].image == "ghcr.io/recyclarr/recyclarr:7"
+        secret = mock_k8s.apply.call_args_list[-2].args[0]
+        assert "api_key: key" in secret.stringData["recyclarr.yml"]
+        digest = job.metadata.annotations[DIGEST_ANNOTATION]
+        state = mgr.run()
+    # A reconcile is scheduled to collect the Job soon after it finishes
+    assert DEBOUNCE_SERVICE in state.get_container("radarr").plan.services
+
+    mock_k8s.get.side_effect = None
+    mock_k8s.get.return_value = _job(digest, "Failed")
+    with ctx(ctx.on.update_status(), state) as mgr:
+        with pytest.raises(RecyclarrError):
+            mgr.charm._sync_trash_profiles("key")
+        assert mgr.charm._stored.trash_sync_success is False
+        mgr.run()
@@ -0,0 +1,53 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the hook-scoped secret cache."""
+
+from unittest.mock import patch
+
+import ops
+import pytest
+from ops.testing import Secret, State
+
+from .conftest import RADARR_CONTAINER, SCRAPARR_CONTAINER
+
+
+def _state() -> State:
+    secret = Secret(label="api-key", tracked_content={"api-key": "old"}, owner="app")
+    return State(leader=True, containers=[RADARR_CONTAINER, SCRAPARR_CONTAINER], secrets=[secret])
+
+
+def test_lookups_hit_the_model_once_per_dispatch(ctx, mock_k8s):
+    """Repeated lookups of one secret reuse the first secret-get."""
+    with ctx(ctx.on.update_status(), _state()) as mgr:
+        cache = mgr.charm._secrets
+        with patch.object(ops.Model, "get_secret", wraps=mgr.charm.model.get_secret) as get:
+            first = cache.get(label="api-key")
+            assert cache.get(label="api-key") is first
+            assert cache.get_content(first) == {"api-key": "old"}
+            assert cache.get_content(first) == {"api-key": "old"}
+        mgr.run()
+    get.assert_called_once()
+
+
+def test_set_content_invalidates(ctx, mock_k8s):
+    """Writing content drops the cache so the next read sees the new value."""
+    with ctx(ctx.on.update_status(), _state()) as mgr:
+        cache = mgr.charm._secrets
+        secret = cache.get(label="api-key")
+        cache.get_content(secret)
+
+        cache.set_content(secret, {"api-key": "new"})
+
+        assert cache.get_content(cache.get(label="api-key")) == {"api-key": "new"}
+        mgr.run()
+
+
+def test_missing_secret_is_not_cached(ctx, mock_k8s):
+    """A miss raises every time instead of being remembered."""
+    with ctx(ctx.on.update_status(), _state()) as mgr:
+        with pytest.raises(ops.SecretNotFoundError):
+            mgr.charm._secrets.get(label="missing")
+        with pytest.raises(ops.SecretNotFoundError):
+            mgr.charm._secrets.get(label="missing")
+        mgr.run()
@@ -0,0 +1,57 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the hook-scoped API session pool."""
+
+from unittest.mock import MagicMock
+
+from _radarr import ApiSessionPool, build_session_counters
+
+
+def test_reuses_client_for_same_url_and_key():
+    """Repeated lookups share one client and count as reuses."""
+    factory = MagicMock(side_effect=lambda url, key: MagicMock())
+    pool = ApiSessionPool(factory)
+
+    first = pool.get("http://localhost:7878", "key")
+    second = pool.get("http://localhost:7878", "key")
+
+    assert first is second
+    factory.assert_called_once_with("http://localhost:7878", "key")
+    assert (pool.opened, pool.reused) == (1, 1)
+
+
+def test_new_key_opens_separate_client():
+    """A rotated API key gets its own client."""
+    pool = ApiSessionPool(MagicMock(side_effect=lambda url, key: MagicMock()))
+
+    first = pool.get("http://localhost:7878", "old")
+    second = pool.get("http://localhost:7878", "new")
+
+    assert first is not second
+    assert (pool.opened, pool.reused) == (2, 0)
+
+
+def test_close_closes_clients_and_resets_counters():
+    """Closing the pool closes every client once, even if one fails."""
+    clients = [MagicMock(), MagicMock()]
+    clients[0].close.side_effect = RuntimeError("boom")
+    pool = ApiSessionPool(MagicMock(side_effect=clients))
+    pool.get("http://a", "key")
+    pool.get("http://b", "key")
+
+    pool.close()
+
+    clients[0].close.assert_called_once()
+    clients[1].close.assert_called_once()
+    assert (pool.opened, pool.reused) == (0, 0)
+
+
+def test_session_counters_are_typed_counters():
+    families = build_session_counters(3, 5)
+
+    assert [(f.name, f.type) for f in families] == [
+        ("charmarr_api_connections_opened_total", "counter"),
+        ("charmarr_api_connection_reuses_total", "counter"),
+    ]
+    assert [f.samples[0].value for f in families] == [3.0, 5.0]
@@ -0,0 +1,110 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for folding StatefulSet patches into one per hook."""
+
+from unittest.mock import MagicMock
+
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.core_v1 import Service
+from lightkube.types import PatchType
+
+from _radarr import StatefulSetBatch
+from _radarr._statefulset import strategic_merge
+
+STATEFULSET = {
+    "apiVersion": "apps/v1",
+    "kind": "StatefulSet",
+    "metadata": {"name": "radarr", "namespace": "media"},
+    "spec": {
+        "selector": {"matchLabels": {"app": "radarr"}},
+        "serviceName": "radarr",
+        "template": {
+            "spec": {
+                "containers": [{"name": "radarr", "volumeMounts": [{"mountPath": "/config"}]}],
+                "volumes": [{"name": "config"}],
+            }
+        },
+    },
+}
+
+VOLUME_PATCH = {
+    "spec": {
+        "template": {
+            "spec": {
+                "containers": [{"name": "radarr", "volumeMounts": [{"mountPath": "/data"}]}],
+                "volumes": [{"name": "charmarr-shared"}],
+            }
+        }
+    }
+}
+
+GATEWAY_PATCH = {
+    "spec": {"template": {"spec": {"initContainers": [{"name": "vpn-route", "image": "busybox"}]}}}
+}
+
+
+def _batch() -> tuple[StatefulSetBatch, MagicMock]:
+    manager = MagicMock()
+    manager.get.return_value = StatefulSet.from_dict(STATEFULSET)
+    return StatefulSetBatch(manager, "radarr", "media"), manager
+
+
+def test_strategic_merge_merges_lists_by_key():
+    merged = strategic_merge(STATEFULSET, VOLUME_PATCH)
+    spec = merged["spec"]["template"]["spec"]
+    assert spec["volumes"] == [{"name": "config"}, {"name": "charmarr-shared"}]
+    mounts = spec["containers"][0]["volumeMounts"]
+    assert mounts == [{"mountPath": "/config"}, {"mountPath": "/data"}]
+
+
+def test_helpers_share_one_get_and_one_patch():
+    batch, manager = _batch()
+
+    batch.get(StatefulSet, "radarr", "media")
+    batch.patch(StatefulSet, "radarr", VOLUME_PATCH, "media")
+    # A later helper sees the earlier helper's pending change
+    sts = batch.get(StatefulSet, "radarr", namespace="media")
+    assert [v.name for v in sts.spec.template.spec.volumes] == ["config", "charmarr-shared"]
+    batch.patch(StatefulSet, "radarr", GATEWAY_PATCH, "media")
+
+    assert batch.flush() is True
+    manager.get.assert_called_once()
+    manager.patch.assert_called_once()
+    sent = manager.patch.call_args.args[2]["spec"]["template"]["spec"]
+    assert sent["volumes"] == [{"name": "charmarr-shared"}]
+    assert sent["initContainers"] == [{"name": "vpn-route", "image": "busybox"}]
+    assert batch.flush() is False
+
+
+def test_no_patch_when_template_already_matches():
+    batch, manager = _batch()
+    batch.get(StatefulSet, "radarr", "media")
+    batch.patch(StatefulSet, "radarr", {"spec": {"serviceName": "radarr"}}, "media")
+
+    assert batch.flush() is False
+    manager.patch.assert_not_called()
+
+
+def test_other_resources_pass_through():
+    batch, manager = _batch()
+    batch.get(Service, "radarr", "media")
+    batch.patch(Service, "radarr", {"spec": {}}, "media")
+    batch.get(StatefulSet, "sonarr", "media")
+
+    assert manager.get.call_count == 2
+    manager.patch.assert_called_once_with(
+        Service, "radarr", {"spec": {}}, "media", patch_type=PatchType.STRATEGIC
+    )
+    assert batch.flush() is False
+
+
+def test_non_strategic_patch_flushes_and_passes_through():
+    batch, manager = _batch()
+    batch.get(StatefulSet, "radarr", "media")
+    batch.patch(StatefulSet, "radarr", VOLUME_PATCH, "media")
+    batch.patch(StatefulSet, "radarr", {"spec": {}}, "media", patch_type=PatchType.MERGE)
+
+    assert manager.patch.call_count == 2
+    assert manager.patch.call_args.kwargs["patch_type"] == PatchType.MERGE
+    assert batch.flush() is False
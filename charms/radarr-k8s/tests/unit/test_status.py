@@ -3,14 +3,15 @@
 
 """Unit tests for RadarrCharm status collection."""
 
+import dataclasses
 from unittest.mock import patch
 
 import ops
-from ops.testing import Container, Relation, Secret, State
+from ops.testing import CheckInfo, Container, Relation, Secret, State
 
 from charmarr_lib.core.interfaces import MediaStorageProviderData
 
-from .conftest import RADARR_CONTAINER, SCRAPARR_CONTAINER
+from .conftest import RADARR_CONTAINER, RADARR_READY_LAYER, SCRAPARR_CONTAINER
 
 
 def _make_storage_relation() -> Relation:
@@ -90,7 +91,12 @@ def test_status_waiting_for_workload(ctx, mock_k8s):
 
 
 def test_status_active_when_ready(ctx, mock_k8s):
-    """Status is active when workload is ready."""
+    """Status is active when the Pebble ready check passes, without probing the workload."""
+    container = dataclasses.replace(
+        RADARR_CONTAINER,
+        layers={"radarr": RADARR_READY_LAYER},
+        check_infos={CheckInfo("radarr-ready", level=ops.pebble.CheckLevel.READY)},
+    )
     api_key_secret = Secret(
         label="api-key",
         tracked_content={"api-key": "testkey123456789012345678901234"},
@@ -98,20 +104,21 @@ def test_status_active_when_ready(ctx, mock_k8s):
     )
 
     with (
-        patch("charm.RadarrCharm._is_workload_ready", return_value=True),
+        patch("charm.RadarrCharm._is_workload_ready") as probe,
         patch("charm.reconcile_gateway_client"),
     ):
         state = ctx.run(
             ctx.on.collect_unit_status(),
             State(
                 leader=True,
-                containers=[RADARR_CONTAINER, SCRAPARR_CONTAINER],
+                containers=[container, SCRAPARR_CONTAINER],
                 secrets=[api_key_secret],
                 relations=[_make_storage_relation()],
             ),
         )
 
     assert state.unit_status == ops.ActiveStatus()
+    probe.assert_not_called()
 
 
 def test_status_non_leader_standby(ctx, mock_k8s):
@@ -0,0 +1,106 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the digest-gated Trash Guides sync."""
+
+from unittest.mock import patch
+
+import pytest
+from ops.testing import Container, Resource, State
+
+from _radarr import is_trash_sync_due, trash_sync_digest
+from charmarr_lib.core import RecyclarrError
+
+from .conftest import RADARR_CONTAINER, SCRAPARR_CONTAINER
+
+_DIGEST = trash_sync_digest("hd-bluray-web", "standard", "PackageVersion=6.1.1", "image")
+
+
+def test_digest_changes_with_every_input():
+    """Each input (profiles, variant, version, image) moves the digest."""
+    variants = {
+        trash_sync_digest("uhd-bluray-web", "standard", "PackageVersion=6.1.1", "image"),
+        trash_sync_digest("hd-bluray-web", "4k", "PackageVersion=6.1.1", "image"),
+        trash_sync_digest("hd-bluray-web", "standard", "PackageVersion=6.1.2", "image"),
+        trash_sync_digest("hd-bluray-web", "standard", "PackageVersion=6.1.1", "image2"),
+    }
+    assert _DIGEST not in variants
+    assert len(variants) == 4
+
+
+@pytest.mark.parametrize(
+    ("last_digest", "age_hours", "max_age", "due"),
+    [
+        ("", 0, 24, True),
+        (_DIGEST, 1, 24, False),
+        (_DIGEST, 25, 24, True),
+        (_DIGEST, 1000, 0, False),
+    ],
+)
+def test_is_trash_sync_due(last_digest, age_hours, max_age, due):
+    now = 1_000_000.0
+    last_sync_at = now - age_hours * 3600
+    assert is_trash_sync_due(_DIGEST, last_digest, last_sync_at, max_age, now=now) is due
+
+
+def _state(recyclarr_image: Resource) -> State:
+    return State(
+        leader=True,
+        containers=[
+            RADARR_CONTAINER,
+            SCRAPARR_CONTAINER,
+            Container(name="recyclarr", can_connect=True),
+        ],
+        config={"trash-profiles": "hd-bluray-web"},
+        resources={recyclarr_image},
+    )
+
+
+def test_digest_keys_on_image_path_not_credentials(ctx, recyclarr_image, tmp_path):
+    """Only the registry path of recyclarr-image feeds the digest."""
+    rotated = tmp_path / "rotated.yaml"
+    rotated.write_text("registrypath: ghcr.io/recyclarr/recyclarr:7\npassword: rotated\n")
+    images = []
+    for resource in (recyclarr_image, Resource(name="recyclarr-image", path=rotated)):
+        with ctx(ctx.on.update_status(), _state(resource)) as mgr:
+            image = mgr.charm._get_recyclarr_image()
+            images.append(image.registrypath if image else None)
+            mgr.run()
+    assert images == ["ghcr.io/recyclarr/recyclarr:7"] * 2
+
+
+def test_unchanged_inputs_skip_recyclarr(ctx, mock_k8s, recyclarr_image):
+    """A second dispatch with the same inputs does not run Recyclarr again."""
+    state = _state(recyclarr_image)
+    with patch("charm.run_recyclarr") as sync:
+        for _ in range(2):
+            with ctx(ctx.on.update_status(), state) as mgr:
+                mgr.charm._sync_trash_profiles("key")
+                state = mgr.run()
+    sync.assert_called_once()
+
+    with ctx(ctx.on.update_status(), state) as mgr:
+        names = [f.name for f in mgr.charm._build_trash_sync_metrics()]
+        mgr.run()
+    assert "charmarr_trash_sync_success" in names
+
+
+def test_forced_sync_runs_and_failure_clears_digest(ctx, mock_k8s, recyclarr_image):
+    """force=True bypasses the gate; a failed run makes the next one due."""
+    state = _state(recyclarr_image)
+    with patch("charm.run_recyclarr") as sync:
+        with ctx(ctx.on.update_status(), state) as mgr:
+            mgr.charm._sync_trash_profiles("key")
+            state = mgr.run()
+
+        sync.side_effect = RecyclarrError("boom")
+        with ctx(ctx.on.update_status(), state) as mgr:
+            with pytest.raises(RecyclarrError):
+                mgr.charm._sync_trash_profiles("key", force=True)
+            state = mgr.run()
+
+        sync.side_effect = None
+        with ctx(ctx.on.update_status(), state) as mgr:
+            mgr.charm._sync_trash_profiles("key")
+            mgr.run()
+    assert sync.call_count == 3
@@ -4,6 +4,12 @@
 """SABnzbd-specific utilities."""
 
 from _sabnzbd._api import SABnzbdApi, SABnzbdApiError
+from _sabnzbd._collector import (
+    COLLECTOR_PORT,
+    collector_spec,
+    queue_budget,
+    reconcile_collectors,
+)
 from _sabnzbd._constants import (
     API_KEY_SECRET_LABEL,
     CONFIG_FILE,
@@ -23,9 +29,17 @@ from _sabnzbd._o11y import (
     METRICS_PORT,
     METRICS_SERVICE_NAME,
 )
+from _sabnzbd._ownership import reconcile_ownership
+from _sabnzbd._pebble import LayerDiff, is_check_up, reconcile_layer
+from _sabnzbd._profiler import ReconcileProfiler
+from _sabnzbd._publish import RelationPublisher
+from _sabnzbd._ready import WORKLOAD_READY_NOTICE, arm_ready_notice
+from _sabnzbd._secrets import SecretCache
+from _sabnzbd._statefulset import StatefulSetBatch
 
 __all__ = [
     "API_KEY_SECRET_LABEL",
+    "COLLECTOR_PORT",
     "CONFIG_FILE",
     "CONTAINER_NAME",
     "EXPORTER_COMMAND",
@@ -39,7 +53,20 @@ __all__ = [
     "METRICS_SERVICE_NAME",
     "SERVICE_NAME",
     "WEBUI_PORT",
+    "WORKLOAD_READY_NOTICE",
+    "LayerDiff",
+    "ReconcileProfiler",
+    "RelationPublisher",
     "SABnzbdApi",
     "SABnzbdApiError",
+    "SecretCache",
+    "StatefulSetBatch",
+    "arm_ready_notice",
+    "collector_spec",
+    "is_check_up",
+    "queue_budget",
+    "reconcile_collectors",
+    "reconcile_layer",
+    "reconcile_ownership",
     "reconcile_sabnzbd_config",
 ]
@@ -0,0 +1,72 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Drift-gated ownership reconciliation for the config volume.
+
+Juju storage mounts the config volume as root, so the workload tree has to be
+chowned to PUID/PGID before Pebble starts the service. A recursive chown walks
+every file, which takes minutes on large trees (the arrs' MediaCover, Plex
+metadata bundles, qBittorrent's BT_backup). Instead, the applied ids are
+recorded in a marker file on the volume and the tree is only walked again
+when the ids change or a sample of entries has drifted.
+"""
+
+import logging
+import time
+
+import ops
+
+logger = logging.getLogger(__name__)
+
+OWNERSHIP_MARKER = ".charmarr-ownership"
+OWNERSHIP_SAMPLE_SIZE = 32
+
+
+def _read_marker(container: ops.Container, path: str) -> str | None:
+    """Read the ids recorded by the last full chown, or None if never applied."""
+    try:
+        return container.pull(f"{path}/{OWNERSHIP_MARKER}").read().strip()
+    except (ops.pebble.PathError, FileNotFoundError):
+        return None
+
+
+def _has_drifted(container: ops.Container, path: str, puid: int, pgid: int) -> bool:
+    """Check the root and a sample of top-level entries for foreign ownership."""
+    try:
+        root = container.list_files(path, itself=True)
+        entries = sorted(container.list_files(path), key=lambda f: f.name)
+    except (ops.pebble.PathError, ops.pebble.APIError):
+        return True
+
+    sample = [*root, *entries[:OWNERSHIP_SAMPLE_SIZE]]
+    return any(f.user_id != puid or f.group_id != pgid for f in sample)
+
+
+def reconcile_ownership(container: ops.Container, path: str, puid: int, pgid: int) -> float | None:
+    """Recursively chown path to puid:pgid only when ownership has drifted.
+
+    A full chown runs when no marker exists, the recorded ids differ from
+    the desired ones, or the root or a sampled top-level entry is owned by
+    someone else (e.g. a restored backup or a fresh volume).
+
+    Returns:
+        Duration of the recursive chown in seconds, or None if it was skipped.
+    """
+    ids = f"{puid}:{pgid}"
+    if _read_marker(container, path) == ids and not _has_drifted(container, path, puid, pgid):
+        logger.debug("Ownership of %s already %s, skipping chown", path, ids)
+        return None
+
+    start = time.monotonic()
+    container.exec(["chown", "-R", ids, path]).wait()
+    duration = time.monotonic() - start
+    logger.info("Recursive chown of %s to %s took %.1fs", path, ids, duration)
+
+    container.push(
+        f"{path}/{OWNERSHIP_MARKER}",
+        ids,
+        make_dirs=True,
+        user_id=puid,
+        group_id=pgid,
+    )
+    return duration
@@ -7,7 +7,6 @@
 import logging
 from typing import NamedTuple
 
-import httpx
 import ops
 from charms.grafana_k8s.v0.grafana_dashboard import GrafanaDashboardProvider
 from charms.istio_beacon_k8s.v0.service_mesh import (
@@ -34,6 +33,7 @@ from charms.velero_libs.v0.velero_backup_config import VeleroBackupProvider, Vel
 
 from _sabnzbd import (
     API_KEY_SECRET_LABEL,
+    COLLECTOR_PORT,
     CONFIG_FILE,
     CONTAINER_NAME,
     EXPORTER_COMMAND,
@@ -47,7 +47,19 @@ from _sabnzbd import (
     METRICS_SERVICE_NAME,
     SERVICE_NAME,
     WEBUI_PORT,
+    WORKLOAD_READY_NOTICE,
+    ReconcileProfiler,
+    RelationPublisher,
     SABnzbdApi,
+    SecretCache,
+    StatefulSetBatch,
+    arm_ready_notice,
+    collector_spec,
+    is_check_up,
+    queue_budget,
+    reconcile_collectors,
+    reconcile_layer,
+    reconcile_ownership,
     reconcile_sabnzbd_config,
 )
 from charmarr_lib.core import (
@@ -93,9 +105,14 @@ class SABnzbdCharm(ops.CharmBase):
 
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._secrets = SecretCache(self)
+        self._publisher = RelationPublisher(self)
+        self._profiler = ReconcileProfiler(self)
         self._container = self.unit.get_container(CONTAINER_NAME)
+        self._workload_ready: bool | None = None
         self._exporter_container = self.unit.get_container(METRICS_CONTAINER_NAME)
         self._k8s: K8sResourceManager | None = None
+        self._statefulset: StatefulSetBatch | None = None
 
         self._topology = CharmarrChargedTopology(
             self,
@@ -110,6 +127,7 @@ class SABnzbdCharm(ops.CharmBase):
             self,
             jobs=[
                 {"static_configs": [{"targets": [f"*:{METRICS_PORT}"]}]},
+                {"static_configs": [{"targets": [f"*:{COLLECTOR_PORT}"]}]},
                 self._topology.scrape_job,
             ],
             alert_rules_path=(
@@ -140,7 +158,7 @@ class SABnzbdCharm(ops.CharmBase):
                 ),
                 UnitPolicy(
                     relation="metrics-endpoint",
-                    ports=[METRICS_PORT, self._topology.port],
+                    ports=[METRICS_PORT, self._topology.port, COLLECTOR_PORT],
                 ),
             ],
         )
@@ -165,6 +183,7 @@ class SABnzbdCharm(ops.CharmBase):
         framework.observe(self.on.secret_rotate, self._on_secret_rotate)
         framework.observe(self._ingress.on.ready, self._reconcile)
         framework.observe(self._ingress.on.revoked, self._reconcile)
+        framework.observe(self.on[CONTAINER_NAME].pebble_custom_notice, self._on_workload_ready)
 
     @property
     def k8s(self) -> K8sResourceManager:
@@ -173,6 +192,18 @@ class SABnzbdCharm(ops.CharmBase):
             self._k8s = K8sResourceManager()
         return self._k8s
 
+    @property
+    def statefulset(self) -> K8sResourceManager:
+        """K8s manager that folds this hook's app StatefulSet patches into one."""
+        if self._statefulset is None:
+            self._statefulset = StatefulSetBatch(self.k8s, self.app.name, self.model.name)
+        return self._statefulset
+
+    def _flush_statefulset(self) -> None:
+        """Send this hook's folded app StatefulSet patch, if there is one."""
+        if self._statefulset is not None:
+            self._statefulset.flush()
+
     def _get_secret_id(self, secret: ops.Secret) -> str:
         """Get secret ID reliably (handles ops 2.x quirk with labeled secrets)."""
         if secret.id:
@@ -192,8 +223,8 @@ class SABnzbdCharm(ops.CharmBase):
     def _get_api_key(self) -> ApiKey | None:
         """Retrieve API key from Juju Secret, or None if not yet created."""
         try:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            content = secret.get_content(refresh=True)
+            secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+            content = self._secrets.get_content(secret)
             return ApiKey(
                 api_key=content["api-key"],
                 secret_id=self._get_secret_id(secret),
@@ -239,7 +270,7 @@ class SABnzbdCharm(ops.CharmBase):
             logger.info("Reconciled sabnzbd.ini")
 
     def _prepare_config_directory(self, puid: int, pgid: int) -> None:
-        self._container.exec(["chown", "-R", f"{puid}:{pgid}", "/config"]).wait()
+        reconcile_ownership(self._container, "/config", puid, pgid)
 
     def _is_service_running(self) -> bool:
         services = self._container.get_services(SERVICE_NAME)
@@ -288,11 +319,15 @@ class SABnzbdCharm(ops.CharmBase):
     def _reconcile_vpn(self) -> None:
         """Reconcile VPN client-side patching based on gateway state."""
         if self.model.get_relation("vpn-gateway"):
-            self._vpn_gateway.publish_data(VPNGatewayRequirerData(instance_name=self.app.name))
+            self._publisher.publish(
+                "vpn-gateway",
+                VPNGatewayRequirerData(instance_name=self.app.name),
+                self._vpn_gateway.publish_data,
+            )
 
         gateway_data = self._vpn_gateway.get_gateway()
         reconcile_gateway_client(
-            manager=self.k8s,
+            manager=self.statefulset,
             statefulset_name=self.app.name,
             namespace=self.model.name,
             data=gateway_data,
@@ -312,6 +347,21 @@ class SABnzbdCharm(ops.CharmBase):
         except Exception:
             return False
 
+    def _probe_workload_ready(self, api_key: ApiKey) -> bool:
+        """Probe the workload and remember the result for collect-status."""
+        self._workload_ready = self._is_workload_ready(api_key)
+        return self._workload_ready
+
+    def _observed_workload_ready(self) -> bool:
+        """Workload readiness for collect-status without another request to it.
+
+        Reuses this dispatch's probe from the reconcile if there was one, else
+        reads the state Pebble keeps for the ready check.
+        """
+        if self._workload_ready is not None:
+            return self._workload_ready
+        return is_check_up(self._container, f"{CONTAINER_NAME}-ready")
+
     def _configure_app(self, api_key: ApiKey) -> None:
         """Configure SABnzbd download paths via API."""
         with self._get_api_client(api_key) as api:
@@ -346,10 +396,10 @@ class SABnzbdCharm(ops.CharmBase):
         Grants the API key secret to each related app and publishes
         the DownloadClientProviderData with the secret ID.
         """
-        secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
+        secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
         for relation in self.model.relations.get("download-client", []):
             if relation.app:
-                secret.grant(relation)
+                self._publisher.grant(secret, relation)
 
         data = DownloadClientProviderData(
             api_url=self._internal_url,
@@ -359,7 +409,7 @@ class SABnzbdCharm(ops.CharmBase):
             instance_name=self.app.name,
             base_path=self._get_url_base(),
         )
-        self._download_client.publish_data(data)
+        self._publisher.publish("download-client", data, self._download_client.publish_data)
         logger.info("Published download client provider data")
 
     def _configure_ingress(self) -> None:
@@ -402,7 +452,7 @@ class SABnzbdCharm(ops.CharmBase):
             return
 
         new_api_key = generate_api_key()
-        event.secret.set_content({"api-key": new_api_key})
+        self._secrets.set_content(event.secret, {"api-key": new_api_key})
         logger.info("Rotated API key secret")
 
         if not self._container.can_connect():
@@ -414,6 +464,7 @@ class SABnzbdCharm(ops.CharmBase):
         self._reconcile_config(new_api_key)
         self._container.replan()
         self._reconcile_exporter(new_api_key)
+        self._reconcile_collectors(new_api_key)
 
     def _build_exporter_layer(self, api_key: str) -> ops.pebble.LayerDict:
         return {
@@ -447,16 +498,14 @@ class SABnzbdCharm(ops.CharmBase):
         if not self._exporter_container.can_connect():
             return
         layer = self._build_exporter_layer(api_key)
-        self._exporter_container.add_layer(METRICS_SERVICE_NAME, layer, combine=True)
-        self._exporter_container.replan()
+        reconcile_layer(self._exporter_container, METRICS_SERVICE_NAME, layer)
 
     def _build_charm_gauges(self) -> list[MetricFamily]:
         """Charm-state metrics published alongside topology.
 
         - `charmarr_unsafe_mode_enabled` - whether sab is configured to allow
           downloads without a VPN gateway relation.
-        - `charmarr_queue_item_size_bytes` / `_remaining_bytes` - one series per
-          currently queued NZB, powering the fleet "active downloads" tables.
+        - `charmarr_reconcile_step_*` - reconcile step timings (ReconcileProfiler).
         """
         unsafe = 1.0 if bool(self.config.get("unsafe-mode", False)) else 0.0
         return [
@@ -470,60 +519,37 @@ class SABnzbdCharm(ops.CharmBase):
                 ),
                 samples=[MetricSample(value=unsafe)],
             ),
-            *self._build_queue_gauges(),
+            *self._profiler.build_metrics(),
         ]
 
-    def _build_queue_gauges(self) -> list[MetricFamily]:
-        """Poll SABnzbd's queue endpoint and emit one series per active slot.
+    def _reconcile_collectors(self, api_key: str) -> None:
+        """Point the background collector daemon at SABnzbd's queue.
 
-        SABnzbd returns sizes as MB strings (e.g. `"1.2"`); converted to
-        bytes here. Silent on workload-not-ready or empty queue - topology
-        metrics still ship.
+        The daemon polls mode=queue on its own interval and serves one series
+        per active slot, powering the fleet "active downloads" tables without
+        a queue fetch in every hook.
         """
-        api_key = self._get_api_key()
-        if not api_key:
-            return []
-        try:
-            with self._get_api_client(api_key) as api:
-                slots = api.get_queue()
-        except (httpx.HTTPError, ValueError) as e:
-            logger.debug("Queue poll failed: %s", e)
-            return []
-
-        if not slots:
-            return []
-
-        def mb_str_to_bytes(value: object) -> float:
-            try:
-                return float(str(value)) * 1024 * 1024
-            except (TypeError, ValueError):
-                return 0.0
-
-        size_samples: list[MetricSample] = []
-        remaining_samples: list[MetricSample] = []
-        for slot in slots:
-            labels = {
-                "title": str(slot.get("filename", "")),
-                "status": str(slot.get("status", "")),
-                "category": str(slot.get("cat", "")),
-            }
-            size_samples.append(MetricSample(labels=labels, value=mb_str_to_bytes(slot.get("mb"))))
-            remaining_samples.append(
-                MetricSample(labels=labels, value=mb_str_to_bytes(slot.get("mbleft")))
-            )
+        spec = collector_spec(
+            "sabnzbd-queue",
+            f"http://localhost:{WEBUI_PORT}",
+            api_key,
+            **queue_budget(self.config),
+        )
+        reconcile_collectors([spec])
 
-        return [
-            MetricFamily(
-                name="charmarr_queue_item_size_bytes",
-                help="Total size in bytes of a currently queued NZB.",
-                samples=size_samples,
-            ),
-            MetricFamily(
-                name="charmarr_queue_item_remaining_bytes",
-                help="Bytes remaining to download for a currently queued NZB.",
-                samples=remaining_samples,
-            ),
-        ]
+    def _on_workload_ready(self, event: ops.PebbleCustomNoticeEvent) -> None:
+        """Run the workload-dependent steps as soon as the workload answers.
+
+        The ready check recovering needs no handler here: pebble-check-recovered
+        is already one of the reconcilable events.
+        """
+        if event.notice.key == WORKLOAD_READY_NOTICE:
+            self._reconcile(event)
+
+    def _arm_ready_notice(self) -> None:
+        """Have Pebble notify the charm once the workload answers its readiness URL."""
+        check = self._build_readiness_check()[f"{CONTAINER_NAME}-ready"]
+        arm_ready_notice(self._container, check["http"]["url"])
 
     def _reconcile(self, event: ops.EventBase) -> None:
         """Reconcile charm state with desired configuration.
@@ -541,26 +567,29 @@ class SABnzbdCharm(ops.CharmBase):
         10. Reconcile VPN gateway client (if related)
         11. Configure Pebble layer and start service
         """
-        self._topology.reconcile()
+        with self._profiler.step("topology"):
+            self._topology.reconcile()
         # The topology endpoint is a cluster-internal concern - crowsnest polls
         # it from inside the same K8s cluster. Hardcode the in-cluster Service
         # FQDN; never expose this URL externally.
-        self._crowsnest.publish_data(
+        self._publisher.publish(
+            "crowsnest",
             CrowsnestProviderData(
                 topology_url=(
                     f"http://{self.app.name}.{self.model.name}"
                     f".svc.cluster.local:{self._topology.port}/metrics"
                 )
-            )
+            ),
+            self._crowsnest.publish_data,
         )
 
         # Non-leader: register readiness check so K8s removes from Service endpoints
         if not self.unit.is_leader():
             if self._container.can_connect():
-                self._container.add_layer(
+                reconcile_layer(
+                    self._container,
                     f"{CONTAINER_NAME}-check",
                     {"checks": self._build_readiness_check()},
-                    combine=True,
                 )
             return
 
@@ -572,7 +601,8 @@ class SABnzbdCharm(ops.CharmBase):
                 self.app.name,
             )
 
-        self._configure_ingress()
+        with self._profiler.step("ingress"):
+            self._configure_ingress()
 
         if not self._container.can_connect():
             return
@@ -585,56 +615,74 @@ class SABnzbdCharm(ops.CharmBase):
             return
 
         # Ensure API key exists
-        api_key = self._get_api_key()
-        if api_key:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            sync_secret_rotation_policy(
-                secret, str(self.config.get("credential-rotation", "disabled"))
-            )
-        else:
-            api_key = self._create_api_key()
+        with self._profiler.step("api-key"):
+            api_key = self._get_api_key()
+            if api_key:
+                secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+                sync_secret_rotation_policy(
+                    secret, str(self.config.get("credential-rotation", "disabled"))
+                )
+            else:
+                api_key = self._create_api_key()
 
         # Publish download client data to related media managers
-        self._publish_download_client(api_key)
+        with self._profiler.step("publish-download-client"):
+            self._publish_download_client(api_key)
 
         # Reconcile config - Pebble auto-restarts via __CONFIG_HASH env var
-        self._reconcile_config(api_key.api_key)
+        with self._profiler.step("config"):
+            self._reconcile_config(api_key.api_key)
 
         # Fix config directory ownership for PUID/PGID
-        self._prepare_config_directory(storage.puid, storage.pgid)
+        with self._profiler.step("ownership"):
+            self._prepare_config_directory(storage.puid, storage.pgid)
 
         # Mount shared storage PVC
-        reconcile_storage_volume(
-            manager=self.k8s,
-            statefulset_name=self.app.name,
-            namespace=self.model.name,
-            container_name=CONTAINER_NAME,
-            pvc_name=storage.pvc_name,
-            mount_path=storage.mount_path,
-            pgid=storage.pgid,
-        )
+        with self._profiler.step("storage-volume"):
+            reconcile_storage_volume(
+                manager=self.statefulset,
+                statefulset_name=self.app.name,
+                namespace=self.model.name,
+                container_name=CONTAINER_NAME,
+                pvc_name=storage.pvc_name,
+                mount_path=storage.mount_path,
+                pgid=storage.pgid,
+            )
 
         # Reconcile VPN gateway client
-        self._reconcile_vpn()
+        with self._profiler.step("vpn"):
+            self._reconcile_vpn()
 
-        # Ensure user/group exist for Pebble's user-id/group-id
-        ensure_pebble_user(self._container, storage.puid, storage.pgid, username="sab")
+        # Send the StatefulSet changes above as one patch, so the pod rolls at most once
+        with self._profiler.step("statefulset-patch"):
+            self._flush_statefulset()
 
-        # Configure Pebble layer and start service
-        layer = self._build_pebble_layer(storage.puid, storage.pgid)
-        self._container.add_layer(SERVICE_NAME, layer, combine=True)
-        self._container.replan()
+        # Configure Pebble user and layer, (re)starting the service only if the plan changed
+        with self._profiler.step("pebble-layer"):
+            ensure_pebble_user(self._container, storage.puid, storage.pgid, username="sab")
+            layer = self._build_pebble_layer(storage.puid, storage.pgid)
+            reconcile_layer(self._container, SERVICE_NAME, layer)
 
         # Reconcile sabnzbd-exporter sidecar (Prometheus exporter)
-        self._reconcile_exporter(api_key.api_key)
+        with self._profiler.step("exporter"):
+            self._reconcile_exporter(api_key.api_key)
+
+        # Hand the background collector daemon the queue endpoint it polls
+        with self._profiler.step("collectors"):
+            self._reconcile_collectors(api_key.api_key)
 
         # Expose WebUI port on the Kubernetes Service
-        self.unit.set_ports(WEBUI_PORT, self._topology.port)
+        self.unit.set_ports(WEBUI_PORT, self._topology.port, COLLECTOR_PORT)
 
         # Configure app via API once workload is ready
-        if self._is_workload_ready(api_key):
-            self._configure_app(api_key)
-            self._sync_categories(api_key)
+        if self._probe_workload_ready(api_key):
+            with self._profiler.step("app-config"):
+                self._configure_app(api_key)
+            with self._profiler.step("categories"):
+                self._sync_categories(api_key)
+        else:
+            # Still booting: have Pebble notify the charm once it answers
+            self._arm_ready_notice()
 
     def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
         """Collect all unit statuses. Framework picks the worst."""
@@ -708,7 +756,7 @@ class SABnzbdCharm(ops.CharmBase):
         if not api_key:
             return
 
-        if not self._is_workload_ready(api_key):
+        if not self._observed_workload_ready():
             event.add_status(ops.WaitingStatus("Waiting for workload"))
         else:
             event.add_status(ops.ActiveStatus())
@@ -36,3 +36,10 @@ def mock_k8s():
         mock_instance = MagicMock()
         mock_class.return_value = mock_instance
         yield mock_instance
+
+
+@pytest.fixture(autouse=True)
+def mock_collectors():
+    """Keep reconciles from spawning the background collector daemon."""
+    with patch("charm.reconcile_collectors") as mock_reconcile:
+        yield mock_reconcile
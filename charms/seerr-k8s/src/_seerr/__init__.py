@@ -4,6 +4,7 @@
 """Private module for Seerr charm implementation."""
 
 from _seerr._api import SeerrApi, SeerrApiError
+from _seerr._collector import COLLECTOR_PORT, collector_spec, reconcile_collectors
 from _seerr._constants import (
     API_KEY_SECRET_LABEL,
     CONFIG_DIR,
@@ -14,9 +15,16 @@ from _seerr._constants import (
     SETTINGS_FILE,
     WEBUI_PORT,
 )
+from _seerr._pebble import LayerDiff, is_check_up, reconcile_layer
+from _seerr._profiler import ReconcileProfiler
+from _seerr._publish import RelationPublisher
+from _seerr._ready import WORKLOAD_READY_NOTICE, arm_ready_notice
+from _seerr._secrets import SecretCache
+from _seerr._session import ApiSessionPool, build_session_counters
 
 __all__ = [
     "API_KEY_SECRET_LABEL",
+    "COLLECTOR_PORT",
     "CONFIG_DIR",
     "CONTAINER_NAME",
     "DEFAULT_PGID",
@@ -24,6 +32,18 @@ __all__ = [
     "SERVICE_NAME",
     "SETTINGS_FILE",
     "WEBUI_PORT",
+    "WORKLOAD_READY_NOTICE",
+    "ApiSessionPool",
+    "LayerDiff",
+    "ReconcileProfiler",
+    "RelationPublisher",
+    "SecretCache",
     "SeerrApi",
     "SeerrApiError",
+    "arm_ready_notice",
+    "build_session_counters",
+    "collector_spec",
+    "is_check_up",
+    "reconcile_collectors",
+    "reconcile_layer",
 ]
@@ -0,0 +1,113 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Plan-diffing Pebble layer reconciliation.
+
+Calling add_layer + replan on every hook costs two Pebble writes per container
+(and a new change record) even when the layer matches what Pebble already
+runs. reconcile_layer compares the desired services and checks against the
+current plan and only writes, or replans, when something actually differs.
+"""
+
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import Any
+
+import ops
+
+logger = logging.getLogger(__name__)
+
+PEBBLE_BIN = "/charm/bin/pebble"
+
+
+@dataclass(frozen=True)
+class LayerDiff:
+    """Result of reconciling a layer against the current Pebble plan.
+
+    Attributes:
+        restarted: Services whose definition changed; replan restarts them.
+        started: Unchanged services that were not running and got started.
+        checks: Checks that were added or changed.
+    """
+
+    restarted: tuple[str, ...] = ()
+    started: tuple[str, ...] = ()
+    checks: tuple[str, ...] = ()
+
+    @property
+    def changed(self) -> bool:
+        """True if the layer had to be written to Pebble."""
+        return bool(self.restarted or self.checks)
+
+
+def _as_layer(layer: ops.pebble.LayerDict | ops.pebble.Layer) -> ops.pebble.Layer:
+    return layer if isinstance(layer, ops.pebble.Layer) else ops.pebble.Layer(layer)
+
+
+def _changed(current: Mapping[str, Any], desired: Mapping[str, Any]) -> tuple[str, ...]:
+    # Service/Check equality raises on non-matching types, so test membership first
+    return tuple(
+        sorted(
+            name for name, item in desired.items() if name not in current or current[name] != item
+        )
+    )
+
+
+def diff_layer(plan: ops.pebble.Plan, layer: ops.pebble.LayerDict | ops.pebble.Layer) -> LayerDiff:
+    """Compare a desired layer with the current plan without touching Pebble."""
+    desired = _as_layer(layer)
+    return LayerDiff(
+        restarted=_changed(plan.services, desired.services),
+        checks=_changed(plan.checks, desired.checks),
+    )
+
+
+def reconcile_layer(
+    container: ops.Container,
+    label: str,
+    layer: ops.pebble.LayerDict | ops.pebble.Layer,
+) -> LayerDiff:
+    """Add a layer and replan only when it differs from the current plan.
+
+    Check-only changes are applied by add_layer alone. Unchanged services
+    that are not running (e.g. a start that failed in an earlier hook) are
+    still replanned so the reconcile keeps its "start if stopped" semantics.
+    """
+    diff = diff_layer(container.get_plan(), layer)
+    if diff.changed:
+        container.add_layer(label, layer, combine=True)
+    if diff.restarted:
+        container.replan()
+        return diff
+
+    services = list(_as_layer(layer).services)
+    if not services:
+        return diff
+
+    stopped = tuple(
+        sorted(
+            name
+            for name, info in container.get_services(*services).items()
+            if info.startup == ops.pebble.ServiceStartup.ENABLED and not info.is_running()
+        )
+    )
+    if stopped:
+        container.replan()
+        return replace(diff, started=stopped)
+    return diff
+
+
+def is_check_up(container: ops.Container, name: str) -> bool:
+    """True if the Pebble check is up and its last run passed.
+
+    Reads the state Pebble already keeps for the check, so it costs no
+    request to the workload. Failures below the check's threshold (a
+    workload that is still booting) count as not up.
+    """
+    try:
+        info = container.get_checks(name).get(name)
+    except (ops.pebble.APIError, ops.pebble.ConnectionError) as e:
+        logger.debug("Could not read Pebble check %s: %s", name, e)
+        return False
+    return info is not None and info.status == ops.pebble.CheckStatus.UP and not info.failures
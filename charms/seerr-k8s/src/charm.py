@@ -33,6 +33,7 @@ from charms.velero_libs.v0.velero_backup_config import VeleroBackupProvider, Vel
 
 from _seerr import (
     API_KEY_SECRET_LABEL,
+    COLLECTOR_PORT,
     CONFIG_DIR,
     CONTAINER_NAME,
     DEFAULT_PGID,
@@ -40,8 +41,19 @@ from _seerr import (
     SERVICE_NAME,
     SETTINGS_FILE,
     WEBUI_PORT,
+    WORKLOAD_READY_NOTICE,
+    ApiSessionPool,
+    ReconcileProfiler,
+    RelationPublisher,
+    SecretCache,
     SeerrApi,
     SeerrApiError,
+    arm_ready_notice,
+    build_session_counters,
+    collector_spec,
+    is_check_up,
+    reconcile_collectors,
+    reconcile_layer,
 )
 from charmarr_lib.core import (
     CharmarrChargedTopology,
@@ -49,7 +61,6 @@ from charmarr_lib.core import (
     ContentVariant,
     MediaManager,
     MetricFamily,
-    MetricSample,
     RequestManager,
     generate_api_key,
     get_secret_rotation_policy,
@@ -72,9 +83,18 @@ logger = logging.getLogger(__name__)
 class SeerrCharm(ops.CharmBase):
     """Seerr content request management charm."""
 
+    _stored = ops.StoredState()
+
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
+        self._secrets = SecretCache(self)
+        self._publisher = RelationPublisher(self)
+        self._profiler = ReconcileProfiler(self)
+        self._stored.set_default(api_sessions_opened=0, api_sessions_reused=0)
+        self._api_sessions = ApiSessionPool(SeerrApi)
         self._container = self.unit.get_container(CONTAINER_NAME)
+        self._workload_ready: bool | None = None
+        self._app_initialized: bool | None = None
 
         self._topology = CharmarrChargedTopology(
             self,
@@ -82,11 +102,14 @@ class SeerrCharm(ops.CharmBase):
                 CharmarrTopologyRelation("media-manager", role="requires", required=True),
                 CharmarrTopologyRelation("media-server", role="requires", required=True),
             ],
-            extra_exposition=self._build_request_gauges,
+            extra_exposition=self._build_exposition,
         )
         self._metrics_endpoint = MetricsEndpointProvider(
             self,
-            jobs=[self._topology.scrape_job],
+            jobs=[
+                {"static_configs": [{"targets": [f"*:{COLLECTOR_PORT}"]}]},
+                self._topology.scrape_job,
+            ],
         )
 
         self._media_manager = MediaManagerRequirer(self, "media-manager")
@@ -101,7 +124,7 @@ class SeerrCharm(ops.CharmBase):
                 ),
                 UnitPolicy(
                     relation="metrics-endpoint",
-                    ports=[self._topology.port],
+                    ports=[self._topology.port, COLLECTOR_PORT],
                 ),
             ],
         )
@@ -126,6 +149,8 @@ class SeerrCharm(ops.CharmBase):
         framework.observe(self.on.import_config_action, self._on_import_config_action)
         framework.observe(self._ingress.on.ready, self._reconcile)
         framework.observe(self._ingress.on.revoked, self._reconcile)
+        framework.observe(self.on[CONTAINER_NAME].pebble_custom_notice, self._on_workload_ready)
+        framework.observe(framework.on.pre_commit, self._on_pre_commit)
 
     def _get_api_key(self) -> str | None:
         """Read API key from settings.json."""
@@ -146,10 +171,10 @@ class SeerrCharm(ops.CharmBase):
     def _ensure_api_key_secret(self, api_key: str) -> str:
         """Ensure API key is stored in Juju secret, return secret ID."""
         try:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            stored = secret.get_content(refresh=True)["api-key"]
+            secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+            stored = self._secrets.get_content(secret)["api-key"]
             if stored != api_key:
-                secret.set_content({"api-key": api_key})
+                self._secrets.set_content(secret, {"api-key": api_key})
                 logger.info("Updated API key secret (drift detected)")
             return self._get_secret_id(secret)
         except ops.SecretNotFoundError:
@@ -170,18 +195,49 @@ class SeerrCharm(ops.CharmBase):
         return bool(services) and services[SERVICE_NAME].is_running()
 
     def _get_api_client(self, api_key: str) -> SeerrApi:
-        """Create authenticated API client for Seerr."""
-        return SeerrApi(f"http://localhost:{WEBUI_PORT}", api_key)
+        """Get the hook-scoped, keep-alive API client for Seerr.
+
+        The client is shared by every reconcile step in this dispatch and
+        closed in _on_pre_commit, so callers must not close it themselves.
+        """
+        return self._api_sessions.get(f"http://localhost:{WEBUI_PORT}", api_key)
+
+    def _on_pre_commit(self, _: ops.EventBase) -> None:
+        """Close pooled API clients and persist the connection counters."""
+        self._stored.api_sessions_opened += self._api_sessions.opened
+        self._stored.api_sessions_reused += self._api_sessions.reused
+        self._api_sessions.close()
 
     def _is_workload_ready(self, api_key: str) -> bool:
         """Check if Seerr workload is ready to accept API calls."""
         try:
-            with self._get_api_client(api_key) as api:
-                api.get_status()
-                return True
+            api = self._get_api_client(api_key)
+            api.get_status()
+            return True
         except SeerrApiError:
             return False
 
+    def _is_app_initialized(self, api: SeerrApi) -> bool:
+        """Whether Seerr's setup wizard is done; asked once per dispatch."""
+        if self._app_initialized is None:
+            self._app_initialized = api.is_initialized()
+        return self._app_initialized
+
+    def _probe_workload_ready(self, api_key: str) -> bool:
+        """Probe the workload and remember the result for collect-status."""
+        self._workload_ready = self._is_workload_ready(api_key)
+        return self._workload_ready
+
+    def _observed_workload_ready(self) -> bool:
+        """Workload readiness for collect-status without another request to it.
+
+        Reuses this dispatch's probe from the reconcile if there was one, else
+        reads the state Pebble keeps for the ready check.
+        """
+        if self._workload_ready is not None:
+            return self._workload_ready
+        return is_check_up(self._container, f"{CONTAINER_NAME}-ready")
+
     def _build_readiness_check(self) -> dict:
         """Build Pebble readiness check."""
         return {
@@ -230,8 +286,8 @@ class SeerrCharm(ops.CharmBase):
     def _get_provider_api_key(self, secret_id: str) -> str | None:  # pragma: no cover
         """Retrieve API key from provider's Juju secret."""
         try:
-            secret = self.model.get_secret(id=secret_id)
-            return secret.get_content(refresh=True).get("api-key")
+            secret = self._secrets.get(id=secret_id)
+            return self._secrets.get_content(secret).get("api-key")
         except ops.SecretNotFoundError:
             return None
 
@@ -443,7 +499,7 @@ class SeerrCharm(ops.CharmBase):
             requester=RequestManager.SEERR,
             instance_name=self.app.name,
         )
-        self._media_manager.publish_data(data)
+        self._publisher.publish("media-manager", data, self._media_manager.publish_data)
         logger.info("Published media manager requirer data")
 
     def _configure_ingress(self) -> None:
@@ -482,60 +538,65 @@ class SeerrCharm(ops.CharmBase):
         self._istio_ingress.submit_config(config)
         logger.info("Submitted ingress route config for Seerr")
 
-    def _build_request_gauges(self) -> list[MetricFamily]:
-        """Poll seerr's /api/v1/request/count and emit per-status gauges.
-
-        Backs the `request-fulfillment-availability` SLO in
-        charmarr-crowsnest. Errors during the poll (workload not ready,
-        API key not yet provisioned, http timeout) are swallowed by
-        CharmarrChargedTopology; topology metrics still ship.
-        """
-        api_key = self._get_api_key()
-        if not api_key:
-            return []
-        with self._get_api_client(api_key) as api:
-            counts = api.get_request_counts()
-
-        samples = [
-            MetricSample(labels={"status": status}, value=float(value))
-            for status, value in counts.items()
-            if isinstance(value, int | float)
-        ]
-        if not samples:
-            return []
+    def _build_exposition(self) -> list[MetricFamily]:
+        """Extra topology exposition: API counters and step timings."""
         return [
-            MetricFamily(
-                name="charmarr_requests_total",
-                help=(
-                    "Current count of seerr requests bucketed by status "
-                    "(pending, approved, processing, available, declined). "
-                    "Backs the request-fulfillment-availability SLO."
-                ),
-                samples=samples,
+            *build_session_counters(
+                self._stored.api_sessions_opened + self._api_sessions.opened,
+                self._stored.api_sessions_reused + self._api_sessions.reused,
             ),
+            *self._profiler.build_metrics(),
         ]
 
+    def _reconcile_collectors(self, api_key: str) -> None:
+        """Point the background collector daemon at seerr's request counts.
+
+        The daemon polls /api/v1/request/count on its own interval and serves
+        per-status gauges backing the `request-fulfillment-availability` SLO
+        in charmarr-crowsnest, fresh between hooks.
+        """
+        reconcile_collectors(
+            [collector_spec("seerr-requests", f"http://localhost:{WEBUI_PORT}", api_key)]
+        )
+
+    def _on_workload_ready(self, event: ops.PebbleCustomNoticeEvent) -> None:
+        """Run the workload-dependent steps as soon as the workload answers.
+
+        The ready check recovering needs no handler here: pebble-check-recovered
+        is already one of the reconcilable events.
+        """
+        if event.notice.key == WORKLOAD_READY_NOTICE:
+            self._reconcile(event)
+
+    def _arm_ready_notice(self) -> None:
+        """Have Pebble notify the charm once the workload answers its readiness URL."""
+        check = self._build_readiness_check()[f"{CONTAINER_NAME}-ready"]
+        arm_ready_notice(self._container, check["http"]["url"])
+
     def _reconcile(self, _: ops.EventBase) -> None:
         """Reconcile charm state with desired configuration."""
-        self._topology.reconcile()
+        with self._profiler.step("topology"):
+            self._topology.reconcile()
         # The topology endpoint is a cluster-internal concern - crowsnest polls
         # it from inside the same K8s cluster. Hardcode the in-cluster Service
         # FQDN; never expose this URL externally.
-        self._crowsnest.publish_data(
+        self._publisher.publish(
+            "crowsnest",
             CrowsnestProviderData(
                 topology_url=(
                     f"http://{self.app.name}.{self.model.name}"
                     f".svc.cluster.local:{self._topology.port}/metrics"
                 )
-            )
+            ),
+            self._crowsnest.publish_data,
         )
 
         if not self.unit.is_leader():
             if self._container.can_connect():
-                self._container.add_layer(
+                reconcile_layer(
+                    self._container,
                     f"{CONTAINER_NAME}-check",
                     {"checks": self._build_readiness_check()},
-                    combine=True,
                 )
             return
 
@@ -546,41 +607,54 @@ class SeerrCharm(ops.CharmBase):
                 self.app.name,
             )
 
-        self._configure_ingress()
+        with self._profiler.step("ingress"):
+            self._configure_ingress()
 
         if not self._container.can_connect():
             return
 
-        self._container.exec(["chown", "-R", f"{DEFAULT_PUID}:{DEFAULT_PGID}", CONFIG_DIR]).wait()
+        with self._profiler.step("ownership"):
+            self._container.exec(
+                ["chown", "-R", f"{DEFAULT_PUID}:{DEFAULT_PGID}", CONFIG_DIR]
+            ).wait()
 
-        layer = self._build_pebble_layer()
-        self._container.add_layer(SERVICE_NAME, layer, combine=True)
-        self._container.replan()
+        with self._profiler.step("pebble-layer"):
+            layer = self._build_pebble_layer()
+            reconcile_layer(self._container, SERVICE_NAME, layer)
 
-        self.unit.set_ports(WEBUI_PORT, self._topology.port)
+        self.unit.set_ports(WEBUI_PORT, self._topology.port, COLLECTOR_PORT)
 
-        self._publish_requirer_data()
+        with self._profiler.step("publish-requirers"):
+            self._publish_requirer_data()
 
         api_key = self._get_api_key()
         if not api_key:
             logger.info("API key not yet available, waiting for Seerr to start")
             return
 
-        self._ensure_api_key_secret(api_key)
+        with self._profiler.step("api-key"):
+            self._ensure_api_key_secret(api_key)
 
-        try:
-            secret = self.model.get_secret(label=API_KEY_SECRET_LABEL)
-            sync_secret_rotation_policy(
-                secret, str(self.config.get("api-key-rotation", "disabled"))
-            )
-        except ops.SecretNotFoundError:
-            logger.warning("API key secret not found when syncing rotation policy")
+            try:
+                secret = self._secrets.get(label=API_KEY_SECRET_LABEL)
+                sync_secret_rotation_policy(
+                    secret, str(self.config.get("api-key-rotation", "disabled"))
+                )
+            except ops.SecretNotFoundError:
+                logger.warning("API key secret not found when syncing rotation policy")
 
-        if not self._is_workload_ready(api_key):
+        # Hand the background collector daemon the request-count endpoint it polls
+        with self._profiler.step("collectors"):
+            self._reconcile_collectors(api_key)
+
+        if not self._probe_workload_ready(api_key):
+            # Still booting: have Pebble notify the charm once it answers
+            self._arm_ready_notice()
             return
 
-        with self._get_api_client(api_key) as api:
-            if api.is_initialized():
+        api = self._get_api_client(api_key)
+        if self._is_app_initialized(api):
+            with self._profiler.step("media-managers"):
                 self._reconcile_media_managers(api)
 
     def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
@@ -623,14 +697,14 @@ class SeerrCharm(ops.CharmBase):
             event.add_status(ops.WaitingStatus("Waiting for API key"))
             return
 
-        if not self._is_workload_ready(api_key):
+        if not self._observed_workload_ready():
             event.add_status(ops.WaitingStatus("Waiting for workload"))
             return
 
-        with self._get_api_client(api_key) as api:
-            if not api.is_initialized():
-                event.add_status(ops.WaitingStatus("Complete setup in web UI"))
-                return
+        api = self._get_api_client(api_key)
+        if not self._is_app_initialized(api):
+            event.add_status(ops.WaitingStatus("Complete setup in web UI"))
+            return
 
         event.add_status(ops.ActiveStatus())
 
@@ -642,7 +716,7 @@ class SeerrCharm(ops.CharmBase):
             return
 
         new_api_key = generate_api_key()
-        event.secret.set_content({"api-key": new_api_key})
+        self._secrets.set_content(event.secret, {"api-key": new_api_key})
         logger.info("Rotated API key secret")
 
         if not self._container.can_connect():
@@ -695,6 +769,8 @@ class SeerrCharm(ops.CharmBase):
             self._container.start(SERVICE_NAME)
             logger.info("Restarted Seerr after API key rotation")
 
+        self._reconcile_collectors(new_api_key)
+
         event.set_results({"result": "API key rotated successfully"})
 
     def _on_import_config_action(self, event: ops.ActionEvent) -> None:
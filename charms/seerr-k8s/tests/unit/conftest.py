@@ -6,6 +6,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from ops.pebble import Layer
 from ops.testing import Container, Context, Exec
 
 from charm import SeerrCharm
@@ -18,6 +19,24 @@ SEERR_CONTAINER = Container(
     },
 )
 
+# The ready check as the charm layers it; Scenario only accepts a CheckInfo
+# that matches a check in the container's plan
+SEERR_READY_LAYER = Layer(
+    {
+        "checks": {
+            "seerr-ready": {
+                "override": "replace",
+                "level": "ready",
+                "http": {"url": "http://localhost:5055/api/v1/status"},
+                "period": "10s",
+                "timeout": "5s",
+                "threshold": 3,
+                "startup": "enabled",
+            }
+        }
+    }
+)
+
 
 @pytest.fixture
 def ctx() -> Context[SeerrCharm]:
@@ -33,3 +52,10 @@ def mock_httpx():
         mock_class.return_value.__enter__ = MagicMock(return_value=mock_instance)
         mock_class.return_value.__exit__ = MagicMock(return_value=None)
         yield mock_instance
+
+
+@pytest.fixture(autouse=True)
+def mock_collectors():
+    """Keep reconciles from spawning the background collector daemon."""
+    with patch("charm.reconcile_collectors") as mock_reconcile:
+        yield mock_reconcile
@@ -1,12 +1,15 @@
 # Copyright 2025 The Charmarr Project
 # See LICENSE file for licensing details.
 
-"""Unit tests for the Seerr o11y metric callback."""
+"""Unit tests for the Seerr request-count collector."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from ops.testing import Container, Exec, State
 
+import _collector_daemon
+from _seerr import WEBUI_PORT
+
 SEERR_CONTAINER = Container(
     name="seerr",
     can_connect=True,
@@ -16,58 +19,36 @@ SEERR_CONTAINER = Container(
 )
 
 
-def test_returns_empty_when_no_api_key(ctx):
+def _collect(counts: dict) -> list:
+    with patch.object(_collector_daemon, "_fetch_json", return_value=counts) as fetch:
+        families = _collector_daemon.collect_seerr_requests("http://localhost:5055", "key", 5)
+    fetch.assert_called_once_with(
+        "http://localhost:5055/api/v1/request/count", 5, headers={"X-Api-Key": "key"}
+    )
+    return families
+
+
+def test_collector_points_at_request_counts(ctx, mock_collectors):
     state = State(leader=True, containers=[SEERR_CONTAINER])
     with ctx(ctx.on.update_status(), state) as mgr:
-        with patch.object(mgr.charm, "_get_api_key", return_value=None):
-            families = mgr.charm._build_request_gauges()
+        mgr.charm._reconcile_collectors("sentinel-key")
         mgr.run()
 
-    assert families == []
+    (spec,) = mock_collectors.call_args.args[0]
+    assert spec["kind"] == "seerr-requests"
+    assert spec["url"] == f"http://localhost:{WEBUI_PORT}"
+    assert spec["api_key"] == "sentinel-key"
 
 
-def test_emits_one_family_per_request_status(ctx):
-    state = State(leader=True, containers=[SEERR_CONTAINER])
-    api = MagicMock()
-    api.get_request_counts.return_value = {
-        "pending": 2,
-        "approved": 5,
-        "available": 18,
-        "declined": 1,
-    }
-    api_ctx = MagicMock()
-    api_ctx.__enter__.return_value = api
-    api_ctx.__exit__.return_value = None
-
-    with ctx(ctx.on.update_status(), state) as mgr:
-        with (
-            patch.object(mgr.charm, "_get_api_key", return_value="sentinel-key"),
-            patch.object(mgr.charm, "_get_api_client", return_value=api_ctx),
-        ):
-            families = mgr.charm._build_request_gauges()
-        mgr.run()
+def test_emits_one_family_per_request_status():
+    families = _collect({"pending": 2, "approved": 5, "available": 18, "declined": 1})
 
     assert len(families) == 1
-    family = families[0]
-    assert family.name == "charmarr_requests_total"
-    by_status = {s.labels["status"]: s.value for s in family.samples}
+    name, _, samples = families[0]
+    assert name == "charmarr_requests_total"
+    by_status = {labels["status"]: value for labels, value in samples}
     assert by_status == {"pending": 2.0, "approved": 5.0, "available": 18.0, "declined": 1.0}
 
 
-def test_returns_empty_when_api_returns_no_numeric_counts(ctx):
-    state = State(leader=True, containers=[SEERR_CONTAINER])
-    api = MagicMock()
-    api.get_request_counts.return_value = {"meta": "not a count"}
-    api_ctx = MagicMock()
-    api_ctx.__enter__.return_value = api
-    api_ctx.__exit__.return_value = None
-
-    with ctx(ctx.on.update_status(), state) as mgr:
-        with (
-            patch.object(mgr.charm, "_get_api_key", return_value="sentinel-key"),
-            patch.object(mgr.charm, "_get_api_client", return_value=api_ctx),
-        ):
-            families = mgr.charm._build_request_gauges()
-        mgr.run()
-
-    assert families == []
+def test_returns_empty_when_api_returns_no_numeric_counts():
+    assert _collect({"meta": "not a count"}) == []
@@ -80,7 +80,7 @@ def test_reconcile_sets_log_level(ctx):
 
 
 def test_reconcile_sets_port(ctx):
-    """Reconcile opens port 5055."""
+    """Reconcile opens the web UI, topology and collector ports."""
     state = ctx.run(
         ctx.on.config_changed(),
         State(
@@ -90,7 +90,7 @@ def test_reconcile_sets_port(ctx):
     )
 
     opened = {p.port for p in state.opened_ports}
-    assert opened == {5055, 9099}
+    assert opened == {5055, 9099, 9097}
     assert all(p.protocol == "tcp" for p in state.opened_ports)
 
 
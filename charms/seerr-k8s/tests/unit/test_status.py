@@ -6,9 +6,9 @@
 from unittest.mock import patch
 
 import ops
-from ops.testing import Container, State
+from ops.testing import CheckInfo, Container, State
 
-from .conftest import SEERR_CONTAINER
+from .conftest import SEERR_CONTAINER, SEERR_READY_LAYER
 
 
 def test_status_waiting_for_pebble(ctx):
@@ -69,23 +69,26 @@ def test_status_scaling_blocked(ctx):
 
 
 def test_status_active_when_ready(ctx):
-    """Report active when workload is running and API key exists."""
+    """Report active from the Pebble ready check without probing the workload."""
     container = Container(
         name="seerr",
         can_connect=True,
         service_statuses={"seerr": ops.pebble.ServiceStatus.ACTIVE},
+        layers={"seerr": SEERR_READY_LAYER},
+        check_infos={CheckInfo("seerr-ready", level=ops.pebble.CheckLevel.READY)},
     )
 
     with (
         patch("charm.SeerrCharm._get_api_key", return_value="test-api-key"),
         patch("charm.SeerrCharm._is_service_running", return_value=True),
-        patch("charm.SeerrCharm._is_workload_ready", return_value=True),
+        patch("charm.SeerrCharm._is_workload_ready") as probe,
         patch("charm.SeerrCharm._get_api_client") as mock_api_client,
     ):
-        mock_api_client.return_value.__enter__.return_value.is_initialized.return_value = True
+        mock_api_client.return_value.is_initialized.return_value = True
         state = ctx.run(
             ctx.on.collect_unit_status(),
             State(leader=True, containers=[container]),
         )
 
     assert state.unit_status == ops.ActiveStatus()
+    probe.assert_not_called()
@@ -0,0 +1,149 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Shared HTTP core for the charm-spawned daemons.
+
+The graph and collector daemons are scraped by Prometheus and polled by
+Grafana at the same time, so one slow client must not hold up the rest,
+and a scrape must not cost file I/O or re-serialization. This core gives
+them:
+
+- a ``ThreadingHTTPServer`` (one thread per connection, HTTP/1.1
+  keep-alive);
+- ``Payload``: a body serialized once, with its gzip encoding and a
+  strong ``ETag`` computed up front, so requests only pick bytes;
+- ``FilePayload``: a data file held in memory and reloaded only when its
+  mtime or size changes (writers must replace the file atomically);
+- gzip when the client accepts it and ``304 Not Modified`` on a matching
+  ``If-None-Match``.
+
+Standard library only, and copied next to the daemon script when it is
+spawned: the charm's virtualenv is not on the path of a detached child.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from collections.abc import Callable, Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Bodies smaller than this are not worth a gzip round trip
+GZIP_MIN_BYTES = 512
+
+
+class Payload:
+    """An immutable response body with its gzip encoding and ETag."""
+
+    def __init__(self, body: bytes, content_type: str) -> None:
+        self.body = body
+        self.content_type = content_type
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self.gzipped = gzip.compress(body, 6) if len(body) >= GZIP_MIN_BYTES else None
+
+
+class FilePayload:
+    """A file's contents as a Payload, reloaded when the file changes."""
+
+    def __init__(self, path: str, content_type: str, default: bytes) -> None:
+        self._path = path
+        self._content_type = content_type
+        self._default = Payload(default, content_type)
+        self._lock = threading.Lock()
+        self._signature: tuple[int, int] | None = None
+        self._payload = self._default
+
+    def __call__(self) -> Payload:
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return self._default
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self._signature:
+            return self._payload
+        with self._lock:
+            if signature != self._signature:
+                try:
+                    with open(self._path, "rb") as fh:
+                        self._payload = Payload(fh.read(), self._content_type)
+                except FileNotFoundError:
+                    return self._default
+                self._signature = signature
+            return self._payload
+
+
+Route = Callable[[], Payload]
+
+
+def _accepts_gzip(header: str | None) -> bool:
+    for part in (header or "").split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        name, _, value = params.partition("=")
+        if name.strip() != "q":
+            return True
+        try:
+            return float(value) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    tags = [tag.strip().removeprefix("W/") for tag in (header or "").split(",")]
+    return "*" in tags or etag in tags
+
+
+def make_handler(
+    routes: Mapping[str, Route], headers: Mapping[str, str] | None = None
+) -> type[BaseHTTPRequestHandler]:
+    """A request handler serving routes (path -> Payload source) via GET."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; with Nagle on, the
+        # body waits for the client's delayed ACK (~40ms per keep-alive GET)
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            del format, args  # silence access logs
+
+        def _send_headers(self, status: int, payload: Payload) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", payload.content_type)
+            self.send_header("ETag", payload.etag)
+            self.send_header("Vary", "Accept-Encoding")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+
+        def do_GET(self) -> None:
+            route = routes.get(self.path.split("?", 1)[0])
+            if route is None:
+                self.send_error(404)
+                return
+            payload = route()
+            if _etag_matches(self.headers.get("If-None-Match"), payload.etag):
+                self._send_headers(304, payload)
+                self.end_headers()
+                return
+            body, encoding = payload.body, None
+            if payload.gzipped is not None and _accepts_gzip(self.headers.get("Accept-Encoding")):
+                body, encoding = payload.gzipped, "gzip"
+            self._send_headers(200, payload)
+            self.send_header("Content-Length", str(len(body)))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def serve(
+    port: int, routes: Mapping[str, Route], headers: Mapping[str, str] | None = None
+) -> None:
+    """Serve routes on port until the process is killed."""
+    server = ThreadingHTTPServer(("0.0.0.0", port), make_handler(routes, headers))
+    server.daemon_threads = True
+    server.serve_forever()
@@ -8,3 +8,4 @@ SERVICE_NAME = "sonarr"
 WEBUI_PORT = 8989
 CONFIG_FILE = "/config/config.xml"
 API_KEY_SECRET_LABEL = "api-key"
+PACKAGE_INFO_FILE = "/app/sonarr/package_info"
@@ -0,0 +1,69 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Pebble notice raised once a (re)started workload answers.
+
+reconcile_layer (in _pebble) starts the workload; arm_ready_notice covers the
+other end of that (re)start: it has Pebble raise a custom notice once the
+workload answers, so the workload-dependent steps do not wait for the next
+unrelated hook. Kept apart from _pebble so only the charms that wait on it
+carry it.
+"""
+
+import logging
+import shlex
+
+import ops
+
+from ._pebble import PEBBLE_BIN, diff_layer
+
+logger = logging.getLogger(__name__)
+
+WORKLOAD_READY_NOTICE = "charmarr.io/workload-ready"
+READY_WAITER_SERVICE = "charmarr-ready-waiter"
+READY_WAIT_TIMEOUT = 900
+
+
+def arm_ready_notice(
+    container: ops.Container, url: str, timeout: int = READY_WAIT_TIMEOUT
+) -> bool:
+    """Start a waiter that raises WORKLOAD_READY_NOTICE once url answers.
+
+    For reconciles that find the workload still booting: the charm gets a
+    pebble-custom-notice as soon as it is up instead of waiting for the next
+    unrelated hook. A waiter that is already polling is left alone; one
+    polling a stale url is restarted. Best effort, never raises.
+
+    Returns:
+        True if a waiter was (re)started.
+    """
+    probe = f"{{ curl -fs -o /dev/null {url} || wget -q -O /dev/null {url}; }} 2>/dev/null"
+    script = (
+        f"i=0; while [ $i -lt {timeout} ] && sleep 2; do i=$((i + 2)); "
+        f"if {probe}; then exec {PEBBLE_BIN} notify {WORKLOAD_READY_NOTICE}; fi; done; exit 1"
+    )
+    layer: ops.pebble.LayerDict = {
+        "summary": "Workload ready notifier",
+        "services": {
+            READY_WAITER_SERVICE: {
+                "override": "replace",
+                "summary": "Raise the workload-ready notice once the workload answers",
+                "command": f"sh -c {shlex.quote(script)}",
+                "startup": "disabled",
+                "on-success": "ignore",
+                "on-failure": "ignore",
+            }
+        },
+    }
+    try:
+        if diff_layer(container.get_plan(), layer).changed:
+            container.add_layer(READY_WAITER_SERVICE, layer, combine=True)
+            container.restart(READY_WAITER_SERVICE)
+            return True
+        if container.get_service(READY_WAITER_SERVICE).is_running():
+            return False
+        container.start(READY_WAITER_SERVICE)
+        return True
+    except (ops.pebble.APIError, ops.pebble.ChangeError, ops.ModelError) as e:
+        logger.warning("Could not start workload ready notifier: %s", e)
+        return False
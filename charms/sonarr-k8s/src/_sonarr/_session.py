@@ -0,0 +1,80 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Per-dispatch pool of keep-alive API clients.
+
+Every reconcile step used to open its own API client, i.e. a new HTTP
+connection pool and TCP handshake per step, six or more times per hook.
+ApiSessionPool hands out one client per (base URL, API key) for the whole
+dispatch and closes them all once at the end of the hook.
+"""
+
+import logging
+from collections.abc import Callable
+from typing import Protocol
+
+from charmarr_lib.core import MetricFamily, MetricSample
+
+logger = logging.getLogger(__name__)
+
+
+class _Closable(Protocol):
+    def close(self) -> None: ...
+
+
+class ApiSessionPool[ClientT: _Closable]:
+    """Lazily created, hook-scoped API clients keyed by base URL and API key.
+
+    Attributes:
+        opened: Clients created during this dispatch.
+        reused: Requests served by an already open client.
+    """
+
+    def __init__(self, factory: Callable[[str, str], ClientT]) -> None:
+        self._factory = factory
+        self._clients: dict[tuple[str, str], ClientT] = {}
+        self.opened = 0
+        self.reused = 0
+
+    def get(self, base_url: str, api_key: str) -> ClientT:
+        """Return the open client for base_url/api_key, creating it on first use."""
+        key = (base_url, api_key)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._factory(base_url, api_key)
+            self._clients[key] = client
+            self.opened += 1
+        else:
+            self.reused += 1
+        return client
+
+    def close(self) -> None:
+        """Close every pooled client and reset the counters."""
+        for client in self._clients.values():
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug("Failed to close API client: %s", e)
+        if self.opened:
+            logger.debug("API sessions: %d opened, %d reused", self.opened, self.reused)
+        self._clients.clear()
+        self.opened = 0
+        self.reused = 0
+
+
+def build_session_counters(opened: int, reused: int) -> list[MetricFamily]:
+    """Build the cumulative API connection counters for the topology exposition."""
+    return [
+        MetricFamily(
+            name="charmarr_api_connections_opened_total",
+            type="counter",
+            help="API client connections opened by the charm across hooks.",
+            samples=[MetricSample(value=float(opened))],
+        ),
+        MetricFamily(
+            name="charmarr_api_connection_reuses_total",
+            type="counter",
+            help="API calls served by an already open, pooled connection.",
+            samples=[MetricSample(value=float(reused))],
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Digest gate for the Trash Guides (Recyclarr) sync.
+
+A Recyclarr run fetches the TRaSH guides and diffs every custom format
+against the arr API, which takes tens of seconds. Running it on every hook
+(update-status included) is wasted work when none of its inputs changed.
+The sync is keyed by a digest of the resolved profiles, variant, arr
+version and recyclarr image, and reruns only when that digest changes,
+when the last sync is older than the staleness window, or when forced.
+"""
+
+import hashlib
+import time
+
+from charmarr_lib.core import MetricFamily, MetricSample
+
+SECONDS_PER_HOUR = 3600
+
+
+def trash_sync_digest(
+    profiles_config: str,
+    variant: str,
+    app_version: str,
+    recyclarr_image: str,
+    guides: str = "",
+) -> str:
+    """SHA-256 over every input that can change what a Recyclarr run does.
+
+    guides identifies the pinned TRaSH guides source (URL and ref).
+    """
+    digest = hashlib.sha256()
+    for part in (profiles_config.strip(), variant, app_version, recyclarr_image, guides):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def is_trash_sync_due(
+    digest: str,
+    last_digest: str,
+    last_sync_at: float,
+    max_age_hours: float,
+    now: float | None = None,
+) -> bool:
+    """True if the inputs changed or the last sync is older than max_age_hours.
+
+    A max_age_hours of 0 (or less) disables the staleness window, so only a
+    digest change triggers a sync.
+    """
+    if digest != last_digest:
+        return True
+    if max_age_hours <= 0:
+        return False
+    now = time.time() if now is None else now
+    return now - last_sync_at >= max_age_hours * SECONDS_PER_HOUR
+
+
+def build_trash_sync_metrics(
+    duration: float, success: bool, timestamp: float
+) -> list[MetricFamily]:
+    """Build the last-sync families for the topology exposition."""
+    return [
+        MetricFamily(
+            name="charmarr_trash_sync_duration_seconds",
+            help="Duration of the last Recyclarr Trash Guides sync.",
+            samples=[MetricSample(value=float(duration))],
+        ),
+        MetricFamily(
+            name="charmarr_trash_sync_success",
+            help="1 if the last Recyclarr Trash Guides sync succeeded, else 0.",
+            samples=[MetricSample(value=1.0 if success else 0.0)],
+        ),
+        MetricFamily(
+            name="charmarr_trash_sync_last_run_timestamp_seconds",
+            help="Unix time of the last Recyclarr Trash Guides sync attempt.",
+            samples=[MetricSample(value=float(timestamp))],
+        ),
+    ]
@@ -6,6 +6,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from ops.pebble import Layer
 from ops.testing import Container, Context, Exec
 
 from charm import SonarrCharm
@@ -16,6 +17,24 @@ SONARR_CONTAINER = Container(
     execs={Exec(["chown", "-R", "1000:1000", "/config"])},
 )
 
+# The ready check as the charm layers it; Scenario only accepts a CheckInfo
+# that matches a check in the container's plan
+SONARR_READY_LAYER = Layer(
+    {
+        "checks": {
+            "sonarr-ready": {
+                "override": "replace",
+                "level": "ready",
+                "http": {"url": "http://localhost:8989/ping"},
+                "period": "10s",
+                "timeout": "3s",
+                "threshold": 3,
+                "startup": "enabled",
+            }
+        }
+    }
+)
+
 SCRAPARR_CONTAINER = Container(name="scraparr", can_connect=True)
 
 
@@ -32,3 +51,10 @@ def mock_k8s():
         mock_instance = MagicMock()
         mock_class.return_value = mock_instance
         yield mock_instance
+
+
+@pytest.fixture(autouse=True)
+def mock_collectors():
+    """Keep reconciles from spawning the background collector daemon."""
+    with patch("charm.reconcile_collectors") as mock_reconcile:
+        yield mock_reconcile
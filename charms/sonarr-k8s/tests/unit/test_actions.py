@@ -94,7 +94,7 @@ def test_sync_trash_profiles_action(ctx, mock_k8s, tmp_path):
                 config={"trash-profiles": "web-1080p"},
             ),
         )
-        mock_sync.assert_called_once_with("testkey123456789012345678901234")
+        mock_sync.assert_called_once_with("testkey123456789012345678901234", force=True)
 
 
 def test_sync_trash_profiles_action_not_leader(ctx, mock_k8s):
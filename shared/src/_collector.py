@@ -0,0 +1,158 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Background workload collectors, fed by the charm.
+
+The queue and request gauges used to be polled inside every hook as
+extra topology exposition, so they were only as fresh as the last hook
+and every hook paid for a full queue fetch. They are now polled by a
+detached daemon (src/_collector_daemon.py) on its own interval, with
+timeouts and backoff, and served from its last good snapshot on
+COLLECTOR_PORT. Hooks only hand it the workload URL and API key.
+
+The topology daemon belongs to charmarr_lib and cannot host extra
+collectors, so this one is spawned alongside it the same way crowsnest
+spawns its graph daemon.
+"""
+
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+COLLECTOR_PORT = 9097
+COLLECTOR_INTERVAL = 30
+COLLECTOR_TIMEOUT = 5
+QUEUE_TITLE_MODES = ("full", "truncate", "hash")
+
+COLLECTOR_DAEMON_SCRIPT = Path(__file__).parent.parent / "_collector_daemon.py"
+DAEMON_CORE_SCRIPT = Path(__file__).parent.parent / "_daemon_core.py"
+COLLECTOR_PID_FILE = Path("/tmp/charmarr-collector.pid")
+COLLECTOR_CONFIG_FILE = Path("/tmp/charmarr-collector.json")
+COLLECTOR_SCRIPT_FILE = Path("/tmp/charmarr-collector.py")
+# Imported by the daemon script, so it must sit next to it under this name
+DAEMON_CORE_FILE = Path("/tmp/_daemon_core.py")
+
+
+def collector_spec(kind: str, url: str, api_key: str, **options: Any) -> dict[str, Any]:
+    """One collector entry for the daemon's config file.
+
+    options are passed to the collector itself, e.g. the queue collectors'
+    max_series and title (see queue_budget()).
+    """
+    return {
+        "kind": kind,
+        "url": url,
+        "api_key": api_key,
+        "interval": COLLECTOR_INTERVAL,
+        "timeout": COLLECTOR_TIMEOUT,
+        **options,
+    }
+
+
+def queue_budget(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Queue collector series budget from the queue-metrics-* config options."""
+    title = str(config.get("queue-metrics-title", "truncate"))
+    if title not in QUEUE_TITLE_MODES:
+        logger.warning("Unknown queue-metrics-title %r, truncating titles", title)
+        title = "truncate"
+    return {
+        "max_series": max(0, int(config.get("queue-metrics-max-series", 20))),
+        "title": title,
+    }
+
+
+def _write_config(collectors: list[dict[str, Any]]) -> bool:
+    """Write the collector config atomically, only if it changed.
+
+    The daemon rebuilds its collectors (dropping their snapshots) whenever
+    the file's mtime moves, so an unchanged config must not be rewritten.
+    """
+    content = json.dumps({"collectors": collectors}, sort_keys=True)
+    try:
+        if COLLECTOR_CONFIG_FILE.read_text() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = COLLECTOR_CONFIG_FILE.with_suffix(".tmp")
+    # Carries the workload API key: owner-only from the moment it exists
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as fh:
+        fh.write(content)
+    os.replace(tmp, COLLECTOR_CONFIG_FILE)
+    return True
+
+
+def _read_pid() -> int | None:
+    try:
+        return int(COLLECTOR_PID_FILE.read_text().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _pid_alive(pid: int | None) -> bool:
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except (OSError, ProcessLookupError):
+        return False
+    return True
+
+
+def _installed(path: Path) -> str | None:
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def _ensure_daemon_running() -> None:
+    script = COLLECTOR_DAEMON_SCRIPT.read_text()
+    core = DAEMON_CORE_SCRIPT.read_text()
+    pid = _read_pid()
+    if _pid_alive(pid):
+        if _installed(COLLECTOR_SCRIPT_FILE) == script and _installed(DAEMON_CORE_FILE) == core:
+            return
+        # The charm was upgraded underneath a running daemon: replace it
+        os.kill(pid, signal.SIGTERM)  # type: ignore[arg-type]
+        for _ in range(20):
+            if not _pid_alive(pid):
+                break
+            time.sleep(0.1)
+
+    DAEMON_CORE_FILE.write_text(core)
+    COLLECTOR_SCRIPT_FILE.write_text(script)
+
+    # `start_new_session=True` is LOAD-BEARING for the same reason as the
+    # topology daemon - detaches the child from the charm hook's process
+    # group so it survives hook exit. See charmarr_lib.core._topology.
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            str(COLLECTOR_SCRIPT_FILE),
+            str(COLLECTOR_PORT),
+            str(COLLECTOR_CONFIG_FILE),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        stdin=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    COLLECTOR_PID_FILE.write_text(str(proc.pid))
+    logger.info("Spawned charmarr-collector on port %d (pid=%d)", COLLECTOR_PORT, proc.pid)
+
+
+def reconcile_collectors(collectors: list[dict[str, Any]]) -> None:
+    """Hand the collector daemon its config and make sure it is running."""
+    if _write_config(collectors):
+        logger.info("Updated collector config (%d collectors)", len(collectors))
+    _ensure_daemon_running()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Detached workload poller serving live charmarr metrics.
+
+Usage:
+    _collector_daemon.py <port> <config_file>
+
+`config_file` is a JSON file written by the charm reconciler (mode 0600,
+it carries the workload API key):
+
+    {"collectors": [{"kind": "arr-queue", "url": "http://localhost:7878",
+                     "api_key": "...", "interval": 30, "timeout": 5,
+                     "max_series": 20, "title": "truncate"}]}
+
+and is re-read whenever its mtime changes. Each collector polls the
+workload API on its own interval with a per-request timeout, backs off
+exponentially while the workload is unreachable, and keeps the last good
+snapshot in memory. Queue collectors export at most `max_series` per-item
+series (largest remaining download first, the rest summed into an "other"
+series) with the title label shaped per `title`, plus per-status rollups.
+The server serves:
+
+- ``GET /metrics`` -> the last good snapshot of every collector, plus
+  ``charmarr_collector_up`` and
+  ``charmarr_collector_last_success_timestamp_seconds`` per collector
+
+The exposition is rendered once per change, not per scrape; threading,
+gzip and ETag handling come from _daemon_core, copied alongside.
+
+Standard library only: the charm's virtualenv is not on the path of a
+detached child.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+from collections.abc import Callable
+from typing import Any
+
+from _daemon_core import Payload, serve
+
+MAX_BACKOFF = 600.0
+CONFIG_POLL_INTERVAL = 5.0
+TITLE_MAX_LENGTH = 48
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OTHER = "other"
+
+_SPEC_KEYS = frozenset({"kind", "url", "api_key", "interval", "timeout"})
+
+# (name, help, [(labels, value), ...])
+Family = tuple[str, str, list[tuple[dict[str, str], float]]]
+
+# Families exposed with "# TYPE counter"; every other family is a gauge
+COUNTER_FAMILIES = frozenset(
+    {
+        "charmarr_queue_status_items",
+        "charmarr_queue_status_size_bytes",
+        "charmarr_queue_status_remaining_bytes",
+    }
+)
+
+
+def _fetch_json(url: str, timeout: float, headers: dict[str, str] | None = None) -> Any:
+    headers = {"Accept": "application/json", **(headers or {})}
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.load(response)
+
+
+def shape_title(title: str, mode: str) -> str:
+    """Shape a release name for the title label: full, truncate or hash."""
+    if mode == "full":
+        return title
+    if mode == "hash":
+        return hashlib.sha256(title.encode()).hexdigest()[:12]
+    if len(title) <= TITLE_MAX_LENGTH:
+        return title
+    return title[: TITLE_MAX_LENGTH - 3] + "..."
+
+
+def _queue_families(
+    noun: str,
+    items: list[tuple[dict[str, str], float, float]],
+    max_series: int,
+    title: str,
+) -> list[Family]:
+    """Per-item queue series within a series budget, plus per-status rollups.
+
+    The max_series items with the most bytes left keep their own series
+    (title shaped per `title`); the rest are summed into one series with
+    every label set to "other", so sums over the family stay exact.
+    """
+    if not items:
+        return []
+    per_item: dict[tuple[tuple[str, str], ...], list[float]] = {}
+    per_status: dict[str, list[float]] = {}
+    ranked = sorted(items, key=lambda item: item[2], reverse=True)
+    for rank, (labels, size, left) in enumerate(ranked):
+        if rank < max(0, int(max_series)):
+            shaped = {**labels, "title": shape_title(labels["title"], title)}
+        else:
+            shaped = dict.fromkeys(labels, OTHER)
+        # Shaped titles can collide; a scrape must not carry duplicate series
+        totals = per_item.setdefault(tuple(shaped.items()), [0.0, 0.0])
+        totals[0] += size
+        totals[1] += left
+        status = per_status.setdefault(labels["status"], [0.0, 0.0, 0.0])
+        status[0] += 1
+        status[1] += size
+        status[2] += left
+
+    def by_status(i: int) -> list[tuple[dict[str, str], float]]:
+        return [({"status": s}, totals[i]) for s, totals in sorted(per_status.items())]
+
+    return [
+        (
+            "charmarr_queue_item_size_bytes",
+            f"Total size in bytes of a currently queued {noun}.",
+            [(dict(key), totals[0]) for key, totals in per_item.items()],
+        ),
+        (
+            "charmarr_queue_item_remaining_bytes",
+            f"Bytes remaining to download for a currently queued {noun}.",
+            [(dict(key), totals[1]) for key, totals in per_item.items()],
+        ),
+        ("charmarr_queue_status_items", f"Queued {noun}s by status.", by_status(0)),
+        (
+            "charmarr_queue_status_size_bytes",
+            f"Total size in bytes of queued {noun}s by status.",
+            by_status(1),
+        ),
+        (
+            "charmarr_queue_status_remaining_bytes",
+            f"Bytes remaining to download for queued {noun}s by status.",
+            by_status(2),
+        ),
+    ]
+
+
+def collect_arr_queue(
+    url: str, api_key: str, timeout: float, max_series: int = 20, title: str = "truncate"
+) -> list[Family]:
+    """Radarr/Sonarr /api/v3/queue, one series per queued item."""
+    payload = _fetch_json(
+        f"{url}/api/v3/queue?pageSize=1000", timeout, headers={"X-Api-Key": api_key}
+    )
+    items = []
+    for record in payload.get("records", []):
+        labels = {
+            "title": str(record.get("title", "")),
+            "status": str(record.get("status", "")),
+            "protocol": str(record.get("protocol", "")),
+        }
+        items.append((labels, float(record.get("size") or 0), float(record.get("sizeleft") or 0)))
+    return _queue_families("media item", items, max_series, title)
+
+
+def collect_sabnzbd_queue(
+    url: str, api_key: str, timeout: float, max_series: int = 20, title: str = "truncate"
+) -> list[Family]:
+    """SABnzbd mode=queue, one series per active slot (sizes arrive as MB strings)."""
+    query = urllib.parse.urlencode({"mode": "queue", "output": "json", "apikey": api_key})
+    payload = _fetch_json(f"{url}/api?{query}", timeout)
+
+    def mb_to_bytes(value: object) -> float:
+        try:
+            return float(str(value)) * 1024 * 1024
+        except (TypeError, ValueError):
+            return 0.0
+
+    items = []
+    for slot in payload.get("queue", {}).get("slots", []):
+        labels = {
+            "title": str(slot.get("filename", "")),
+            "status": str(slot.get("status", "")),
+            "category": str(slot.get("cat", "")),
+        }
+        items.append((labels, mb_to_bytes(slot.get("mb")), mb_to_bytes(slot.get("mbleft"))))
+    return _queue_families("NZB", items, max_series, title)
+
+
+def collect_seerr_requests(url: str, api_key: str, timeout: float) -> list[Family]:
+    """Seerr /api/v1/request/count, one series per request status."""
+    counts = _fetch_json(f"{url}/api/v1/request/count", timeout, headers={"X-Api-Key": api_key})
+    samples = [
+        ({"status": str(status)}, float(value))
+        for status, value in counts.items()
+        if isinstance(value, int | float) and not isinstance(value, bool)
+    ]
+    if not samples:
+        return []
+    return [
+        # Stays a gauge despite the _total suffix: it predates the typed
+        # exposition and existing dashboards and alerts treat it as one
+        (
+            "charmarr_requests_total",
+            "Current count of seerr requests bucketed by status "
+            "(pending, approved, processing, available, declined). "
+            "Backs the request-fulfillment-availability SLO.",
+            samples,
+        )
+    ]
+
+
+COLLECTORS: dict[str, Callable[..., list[Family]]] = {
+    "arr-queue": collect_arr_queue,
+    "sabnzbd-queue": collect_sabnzbd_queue,
+    "seerr-requests": collect_seerr_requests,
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render(families: list[Family]) -> str:
+    """Prometheus text exposition of families, typed per COUNTER_FAMILIES."""
+    lines: list[str] = []
+    for name, help_text, samples in families:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {'counter' if name in COUNTER_FAMILIES else 'gauge'}")
+        for labels, value in samples:
+            label_str = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_str}}} {value}" if label_str else f"{name} {value}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+class Collector:
+    """One configured collector: schedule, backoff and last good snapshot."""
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        self.kind = str(spec["kind"])
+        self.url = str(spec["url"]).rstrip("/")
+        self.api_key = str(spec.get("api_key", ""))
+        self.interval = float(spec.get("interval", 30))
+        self.timeout = float(spec.get("timeout", 5))
+        # Anything else in the spec is passed to the collector function
+        self.options = {k: v for k, v in spec.items() if k not in _SPEC_KEYS}
+        self.snapshot: list[Family] = []
+        self.up = False
+        self.last_success = 0.0
+        self.failures = 0
+        self.next_due = 0.0
+
+    def poll(self, now: float) -> None:
+        try:
+            collect = COLLECTORS[self.kind]
+            self.snapshot = collect(self.url, self.api_key, self.timeout, **self.options)
+        except Exception:
+            # Keep serving the last good snapshot; back off while the workload is away
+            self.up = False
+            self.failures += 1
+            self.next_due = now + min(self.interval * 2**self.failures, MAX_BACKOFF)
+            return
+        self.up = True
+        self.failures = 0
+        self.last_success = now
+        self.next_due = now + self.interval
+
+
+class Collectors:
+    """Collectors built from the config file, rebuilt when it changes."""
+
+    def __init__(self, config_file: str) -> None:
+        self._config_file = config_file
+        self._mtime = 0.0
+        self._lock = threading.Lock()
+        self._collectors: list[Collector] = []
+        self._payload: Payload | None = None
+
+    def reload_if_changed(self) -> None:
+        try:
+            mtime = os.stat(self._config_file).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self._config_file) as fh:
+                specs = json.load(fh).get("collectors", [])
+            collectors = [Collector(s) for s in specs if s.get("kind") in COLLECTORS]
+        except (OSError, ValueError, KeyError):
+            return
+        with self._lock:
+            self._collectors = collectors
+            self._payload = None
+        self._mtime = mtime
+
+    def run_due(self) -> float:
+        """Poll every due collector; return seconds until the next one is due."""
+        with self._lock:
+            collectors = list(self._collectors)
+        now = time.time()
+        due = [c for c in collectors if c.next_due <= now]
+        for collector in due:
+            collector.poll(now)
+        if due:
+            self._payload = None
+        return min((c.next_due for c in collectors), default=now + CONFIG_POLL_INTERVAL) - now
+
+    def exposition(self) -> str:
+        with self._lock:
+            collectors = list(self._collectors)
+        families: list[Family] = []
+        for collector in collectors:
+            families.extend(collector.snapshot)
+        families.append(
+            (
+                "charmarr_collector_up",
+                "1 if the collector's last workload poll succeeded, 0 otherwise.",
+                [({"collector": c.kind}, 1.0 if c.up else 0.0) for c in collectors],
+            )
+        )
+        families.append(
+            (
+                "charmarr_collector_last_success_timestamp_seconds",
+                "Unix time of the collector's last successful workload poll.",
+                [({"collector": c.kind}, c.last_success) for c in collectors],
+            )
+        )
+        return render(families)
+
+    def payload(self) -> Payload:
+        """The current exposition, rendered and compressed once per change."""
+        payload = self._payload
+        if payload is None:
+            payload = self._payload = Payload(self.exposition().encode(), METRICS_CONTENT_TYPE)
+        return payload
+
+    def loop(self) -> None:
+        while True:
+            self.reload_if_changed()
+            wait = self.run_due()
+            time.sleep(max(0.5, min(wait, CONFIG_POLL_INTERVAL)))
+
+
+if __name__ == "__main__":
+    collectors = Collectors(sys.argv[2])
+    threading.Thread(target=collectors.loop, daemon=True).start()
+    serve(int(sys.argv[1]), {"/metrics": collectors.payload})
@@ -0,0 +1,135 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Debounced reconcile driven by a Pebble custom notice.
+
+A single integrate or config change fans out into a burst of
+relation-changed, secret-changed and config-changed hooks, and each one
+runs the full reconcile. With a settle delay configured, ReconcileDebouncer
+turns those hooks into "mark dirty and (re)arm a timer": a one-shot Pebble
+service in the workload container sleeps for the delay and then raises a
+custom notice. Every new hook restarts the timer, so the notice - and the
+single consolidated reconcile it triggers - fires once the burst settles.
+The same timer backs schedule(), for a single reconcile after a set delay.
+"""
+
+import logging
+from collections.abc import Callable
+
+import ops
+
+from charmarr_lib.core import MetricFamily, MetricSample
+
+from ._pebble import PEBBLE_BIN, diff_layer
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_NOTICE = "charmarr.io/reconcile"
+DEBOUNCE_SERVICE = "charmarr-reconcile-debounce"
+
+
+class ReconcileDebouncer(ops.Object):
+    """Coalesces reconcile-triggering hooks into one notice-driven reconcile."""
+
+    _stored = ops.StoredState()
+
+    def __init__(
+        self,
+        charm: ops.CharmBase,
+        container_name: str,
+        reconcile: Callable[[ops.EventBase], None],
+    ) -> None:
+        super().__init__(charm, "reconcile-debouncer")
+        self._charm = charm
+        self._container = charm.unit.get_container(container_name)
+        self._reconcile = reconcile
+        self._stored.set_default(dirty=False, coalesced=0, executed=0)
+        charm.framework.observe(
+            charm.on[container_name].pebble_custom_notice, self._on_custom_notice
+        )
+
+    @property
+    def delay(self) -> int:
+        """Settle delay in seconds from reconcile-debounce; 0 disables debouncing."""
+        return max(int(self._charm.config.get("reconcile-debounce", 0)), 0)
+
+    def request(self, event: ops.EventBase) -> None:
+        """Reconcile now, or mark the unit dirty and re-arm the settle timer.
+
+        Observe reconcile-triggering events with this method.
+        """
+        if isinstance(event, ops.PebbleCustomNoticeEvent) and event.notice.key == RECONCILE_NOTICE:
+            return  # handled by _on_custom_notice
+        if not self.delay or not self._container.can_connect():
+            self._run(event)
+            return
+        try:
+            self._arm(self.delay)
+        except (ops.pebble.APIError, ops.pebble.ChangeError) as e:
+            logger.warning("Could not arm debounce timer, reconciling now: %s", e)
+            self._run(event)
+            return
+        self._stored.dirty = True
+        self._stored.coalesced += 1
+
+    def schedule(self, delay: int) -> None:
+        """Run one reconcile delay seconds from now, e.g. to collect a running Job.
+
+        Best effort: if the timer cannot be armed, a later hook reconciles.
+        """
+        if not self._container.can_connect():
+            return
+        try:
+            self._arm(delay)
+        except (ops.pebble.APIError, ops.pebble.ChangeError) as e:
+            logger.warning("Could not schedule a reconcile: %s", e)
+            return
+        self._stored.dirty = True
+
+    def _arm(self, delay: int) -> None:
+        command = f"sleep {delay} && {PEBBLE_BIN} notify {RECONCILE_NOTICE}"
+        layer: ops.pebble.LayerDict = {
+            "summary": "Debounced reconcile timer",
+            "services": {
+                DEBOUNCE_SERVICE: {
+                    "override": "replace",
+                    "summary": "Raise the reconcile notice once hooks settle",
+                    "command": f"sh -c '{command}'",
+                    "startup": "disabled",
+                    "on-success": "ignore",
+                    "on-failure": "ignore",
+                }
+            },
+        }
+        if diff_layer(self._container.get_plan(), layer).changed:
+            self._container.add_layer(DEBOUNCE_SERVICE, layer, combine=True)
+        # Restarting kills a pending timer, so the notice fires delay seconds
+        # after the last hook of the burst
+        self._container.restart(DEBOUNCE_SERVICE)
+
+    def _on_custom_notice(self, event: ops.PebbleCustomNoticeEvent) -> None:
+        if event.notice.key != RECONCILE_NOTICE or not self._stored.dirty:
+            return
+        self._stored.dirty = False
+        self._run(event)
+
+    def _run(self, event: ops.EventBase) -> None:
+        self._stored.executed += 1
+        self._reconcile(event)
+
+    def build_metrics(self) -> list[MetricFamily]:
+        """Build the coalesced/executed reconcile counters for the exposition."""
+        return [
+            MetricFamily(
+                name="charmarr_reconcile_coalesced_total",
+                type="counter",
+                help="Hooks that deferred to a debounced reconcile instead of running one.",
+                samples=[MetricSample(value=float(self._stored.coalesced))],
+            ),
+            MetricFamily(
+                name="charmarr_reconcile_executed_total",
+                type="counter",
+                help="Full reconciles executed by this unit.",
+                samples=[MetricSample(value=float(self._stored.executed))],
+            ),
+        ]
@@ -0,0 +1,376 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Recyclarr runs for the Trash Guides sync, in the sidecar or as a Job.
+
+By default (recyclarr-mode=sidecar) Recyclarr is exec'd in the recyclarr
+container of this pod and reaches the app on localhost; the hook waits for
+the sync. With recyclarr-mode=job the charm instead creates a short-lived
+Kubernetes Job (plus a Secret holding the Recyclarr config) through
+K8sResourceManager and collects the outcome from the Job's status, so hooks
+don't wait on Recyclarr and Jobs of different arr instances run in parallel.
+
+Job and config Secret are named after the sync digest, so a new run never
+reuses the name of one that is still being deleted. Finished Jobs are kept
+until the charm collects them; Jobs for older digests are removed on the
+next run. Everything the Job needs is owned by the app's StatefulSet, so
+removing the application garbage-collects it. The Job pod runs under its
+own service account, which the charm's mesh policy lets reach the WebUI.
+
+In both modes the config and Recyclarr's app data (its settings.yml and
+guide clones) live in charm-owned paths passed with --config and
+--app-data, so the pinned guides settings never touch a settings file the
+user maintains. The sidecar's settings point at the local guides cache
+(see _guides.py) when it is available.
+"""
+
+import base64
+import json
+import logging
+import re
+from dataclasses import dataclass
+from enum import StrEnum
+
+import ops
+import yaml
+from lightkube import ApiError
+from lightkube.models.batch_v1 import JobSpec
+from lightkube.models.core_v1 import (
+    Container,
+    EmptyDirVolumeSource,
+    LocalObjectReference,
+    PodSpec,
+    PodTemplateSpec,
+    SecretVolumeSource,
+    Volume,
+    VolumeMount,
+)
+from lightkube.models.meta_v1 import ObjectMeta, OwnerReference
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.batch_v1 import Job
+from lightkube.resources.core_v1 import Secret, ServiceAccount
+
+from charmarr_lib.core import K8sResourceManager, MediaManager, RecyclarrError
+
+logger = logging.getLogger(__name__)
+
+RECYCLARR_BIN = "/app/recyclarr/recyclarr"
+RECYCLARR_TIMEOUT = 120.0
+RECYCLARR_JOB_DEADLINE = 900
+RECYCLARR_JOB_POLL = 30
+DIGEST_ANNOTATION = "charmarr.io/trash-sync-digest"
+APP_LABEL = "charmarr.io/recyclarr-for"
+SIDECAR_DIR = "/charmarr"
+_CONFIG_MOUNT = "/charmarr"
+_APP_DATA = "/charmarr-data"
+_DOCKER_HUB = "https://index.docker.io/v1/"
+
+# Recyclarr templates are not includable as such: each expands to the
+# quality definition plus its quality profile and custom formats includes
+_INCLUDES: dict[MediaManager, tuple[str, ...]] = {
+    MediaManager.RADARR: (
+        "radarr-quality-definition-movie",
+        "radarr-quality-profile-{}",
+        "radarr-custom-formats-{}",
+    ),
+    MediaManager.SONARR: (
+        "sonarr-quality-definition-series",
+        "sonarr-v4-quality-profile-{}",
+        "sonarr-v4-custom-formats-{}",
+    ),
+}
+
+
+class RecyclarrJobStatus(StrEnum):
+    """State of the Recyclarr Job for the current sync digest."""
+
+    PENDING = "pending"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class RecyclarrJobResult:
+    """Outcome of reconciling the Recyclarr Job.
+
+    Attributes:
+        status: PENDING while the Job runs (or was just created).
+        duration: Seconds between Job start and completion, once finished.
+    """
+
+    status: RecyclarrJobStatus
+    duration: float = 0.0
+
+
+@dataclass(frozen=True)
+class ImageResource:
+    """An oci-image resource as Juju attaches it.
+
+    Attributes:
+        registrypath: Image reference to pull.
+        username: Registry user, empty for public images.
+        password: Registry password, empty for public images.
+    """
+
+    registrypath: str
+    username: str = ""
+    password: str = ""
+
+
+def build_recyclarr_config(
+    manager: MediaManager, api_key: str, base_url: str, profiles_config: str
+) -> str:
+    """Recyclarr YAML config for one arr instance, reached at base_url.
+
+    profiles_config is the comma-separated list of TRaSH template names.
+    """
+    if manager not in _INCLUDES:
+        raise RecyclarrError(f"Unsupported media manager for Recyclarr: {manager}")
+    templates = [t.strip() for t in profiles_config.split(",") if t.strip()]
+    includes = dict.fromkeys(i.format(t) for t in templates for i in _INCLUDES[manager])
+    instance = {
+        "base_url": base_url,
+        "api_key": api_key,
+        "include": [{"template": include} for include in includes],
+    }
+    return yaml.safe_dump({manager.value: {manager.value: instance}}, sort_keys=False)
+
+
+def build_recyclarr_settings(guides_url: str, guides_ref: str) -> str:
+    """Recyclarr settings.yml pinning the TRaSH guides repository."""
+    pin = "sha" if re.fullmatch(r"[0-9a-f]{7,40}", guides_ref) else "branch"
+    settings = {"repositories": {"trash_guides": {"clone_url": guides_url, pin: guides_ref}}}
+    return yaml.safe_dump(settings, sort_keys=False)
+
+
+def parse_image_resource(content: str) -> ImageResource | None:
+    """Parse an oci-image resource file; None if it has no registrypath."""
+    try:
+        data = yaml.safe_load(content)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(data, dict) or not data.get("registrypath"):
+        return None
+    return ImageResource(
+        str(data["registrypath"]), str(data.get("username") or ""), str(data.get("password") or "")
+    )
+
+
+def run_recyclarr(container: ops.Container, config: str, settings: str) -> None:
+    """Run a Recyclarr sync in the recyclarr sidecar, from charm-owned paths.
+
+    Raises:
+        RecyclarrError: If Recyclarr exits non-zero or times out.
+    """
+    config_file, app_data = f"{SIDECAR_DIR}/recyclarr.yml", f"{SIDECAR_DIR}/app-data"
+    container.push(config_file, config, make_dirs=True)
+    container.push(f"{app_data}/settings.yml", settings, make_dirs=True)
+    process = container.exec(
+        [RECYCLARR_BIN, "sync", "--app-data", app_data, "--config", config_file],
+        timeout=RECYCLARR_TIMEOUT,
+    )
+    try:
+        stdout, _ = process.wait_output()
+    except (ops.pebble.ExecError, ops.pebble.ChangeError) as e:
+        raise RecyclarrError(f"Recyclarr sync failed: {e}") from e
+    logger.info("Recyclarr sync completed: %s", stdout)
+
+
+def recyclarr_service_account(app_name: str) -> str:
+    """Name of the service account (and mesh identity) the Recyclarr Job runs as."""
+    return f"{app_name}-recyclarr"
+
+
+def _job_name(app_name: str, digest: str) -> str:
+    return f"{app_name}-recyclarr-{digest[:10]}"
+
+
+def _job_result(job: Job) -> RecyclarrJobResult:
+    status = job.status
+    conditions = {c.type: c.status for c in (status.conditions or [])} if status else {}
+    if conditions.get("Complete") == "True":
+        outcome = RecyclarrJobStatus.SUCCEEDED
+    elif conditions.get("Failed") == "True":
+        outcome = RecyclarrJobStatus.FAILED
+    else:
+        return RecyclarrJobResult(RecyclarrJobStatus.PENDING)
+
+    duration = 0.0
+    if status and status.startTime:
+        finished = status.completionTime or max(
+            (c.lastTransitionTime for c in status.conditions or [] if c.lastTransitionTime),
+            default=status.startTime,
+        )
+        duration = (finished - status.startTime).total_seconds()
+    return RecyclarrJobResult(outcome, duration)
+
+
+def delete_recyclarr_job(k8s: K8sResourceManager, namespace: str, name: str) -> None:
+    """Remove a Recyclarr Job (with its pods) and its config Secret, if present."""
+    for resource in (Job, Secret):
+        try:
+            k8s.delete(resource, name, namespace)
+        except ApiError as e:
+            if e.status.code != 404:
+                raise
+
+
+def _delete_stale_jobs(k8s: K8sResourceManager, namespace: str, app_name: str, keep: str) -> None:
+    for job in k8s.client.list(Job, namespace=namespace, labels={APP_LABEL: app_name}):
+        metadata = job.metadata
+        if metadata and metadata.name and metadata.name != keep and not metadata.deletionTimestamp:
+            logger.info("Removing Recyclarr job %s started for older inputs", metadata.name)
+            delete_recyclarr_job(k8s, namespace, metadata.name)
+
+
+def _registry(registrypath: str) -> str:
+    """Registry host of an image reference, as keyed in a dockerconfigjson."""
+    host, _, rest = registrypath.partition("/")
+    if rest and ("." in host or ":" in host or host == "localhost"):
+        return host
+    return _DOCKER_HUB
+
+
+def _pull_secret(metadata: ObjectMeta, image: ImageResource) -> Secret:
+    """dockerconfigjson Secret with the resource's registry credentials."""
+    auth = base64.b64encode(f"{image.username}:{image.password}".encode()).decode()
+    config = {
+        "auths": {
+            _registry(image.registrypath): {
+                "username": image.username,
+                "password": image.password,
+                "auth": auth,
+            }
+        }
+    }
+    return Secret(
+        metadata=metadata,
+        type="kubernetes.io/dockerconfigjson",
+        stringData={".dockerconfigjson": json.dumps(config)},
+    )
+
+
+def _owner(k8s: K8sResourceManager, namespace: str, app_name: str) -> OwnerReference:
+    """Reference to the app StatefulSet, so removing the app collects the Job."""
+    metadata = k8s.get(StatefulSet, app_name, namespace).metadata or ObjectMeta()
+    return OwnerReference(
+        apiVersion="apps/v1", kind="StatefulSet", name=app_name, uid=metadata.uid or ""
+    )
+
+
+def _metadata(name: str, namespace: str, app_name: str, owner: OwnerReference) -> ObjectMeta:
+    return ObjectMeta(
+        name=name, namespace=namespace, labels={APP_LABEL: app_name}, ownerReferences=[owner]
+    )
+
+
+def _build_job(
+    metadata: ObjectMeta,
+    image: ImageResource,
+    service_account: str,
+    pull_secret: str | None,
+    pod_labels: dict[str, str],
+) -> Job:
+    command = (
+        f"cp {_CONFIG_MOUNT}/settings.yml {_APP_DATA}/settings.yml && "
+        f"exec recyclarr sync --app-data {_APP_DATA} --config {_CONFIG_MOUNT}/recyclarr.yml"
+    )
+    return Job(
+        metadata=metadata,
+        spec=JobSpec(
+            backoffLimit=0,
+            activeDeadlineSeconds=RECYCLARR_JOB_DEADLINE,
+            template=PodTemplateSpec(
+                metadata=ObjectMeta(labels=pod_labels) if pod_labels else None,
+                spec=PodSpec(
+                    restartPolicy="Never",
+                    serviceAccountName=service_account,
+                    automountServiceAccountToken=False,
+                    imagePullSecrets=(
+                        [LocalObjectReference(name=pull_secret)] if pull_secret else None
+                    ),
+                    containers=[
+                        Container(
+                            name="recyclarr",
+                            image=image.registrypath,
+                            command=["sh", "-c", command],
+                            volumeMounts=[
+                                VolumeMount(
+                                    name="charmarr", mountPath=_CONFIG_MOUNT, readOnly=True
+                                ),
+                                VolumeMount(name="app-data", mountPath=_APP_DATA),
+                            ],
+                        )
+                    ],
+                    volumes=[
+                        Volume(
+                            name="charmarr", secret=SecretVolumeSource(secretName=metadata.name)
+                        ),
+                        Volume(name="app-data", emptyDir=EmptyDirVolumeSource()),
+                    ],
+                ),
+            ),
+        ),
+    )
+
+
+def reconcile_recyclarr_job(
+    k8s: K8sResourceManager,
+    *,
+    namespace: str,
+    app_name: str,
+    image: ImageResource,
+    digest: str,
+    config: str,
+    settings: str,
+    pod_labels: dict[str, str] | None = None,
+) -> RecyclarrJobResult:
+    """Start, poll or collect the Recyclarr Job for digest.
+
+    A finished Job for digest is collected (deleted) and its outcome
+    returned. Jobs for older digests are removed. Otherwise a new Job is
+    created and PENDING returned; the caller checks again later.
+
+    pod_labels are added to the Job's pod, e.g. to put it on the mesh.
+    """
+    name = _job_name(app_name, digest)
+    _delete_stale_jobs(k8s, namespace, app_name, keep=name)
+    try:
+        job = k8s.get(Job, name, namespace)
+    except ApiError as e:
+        if e.status.code != 404:
+            raise
+        job = None
+
+    if job is not None:
+        if job.metadata and job.metadata.deletionTimestamp:
+            # A collected run for the same inputs is still going away
+            return RecyclarrJobResult(RecyclarrJobStatus.PENDING)
+        result = _job_result(job)
+        if result.status is not RecyclarrJobStatus.PENDING:
+            delete_recyclarr_job(k8s, namespace, name)
+        return result
+
+    owner = _owner(k8s, namespace, app_name)
+    service_account = recyclarr_service_account(app_name)
+    k8s.apply(
+        ServiceAccount(
+            metadata=_metadata(service_account, namespace, app_name, owner),
+            automountServiceAccountToken=False,
+        )
+    )
+    pull_secret = None
+    if image.username:
+        pull_secret = f"{service_account}-pull"
+        k8s.apply(_pull_secret(_metadata(pull_secret, namespace, app_name, owner), image))
+    k8s.apply(
+        Secret(
+            metadata=_metadata(name, namespace, app_name, owner),
+            stringData={"recyclarr.yml": config, "settings.yml": settings},
+        )
+    )
+    job_meta = _metadata(name, namespace, app_name, owner)
+    job_meta.annotations = {DIGEST_ANNOTATION: digest}
+    k8s.apply(_build_job(job_meta, image, service_account, pull_secret, pod_labels or {}))
+    logger.info("Started Recyclarr job %s", name)
+    return RecyclarrJobResult(RecyclarrJobStatus.PENDING)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Copy the shared charm modules into every charm that carries them.
+
+Each charm is packed from its own directory, so a module shared between
+charms has to exist in each of them. shared/src holds the one copy that is
+edited and tested; this script writes it over the charm copies listed in
+MODULES.
+
+Usage:
+    python3 shared/sync.py          # rewrite the charm copies
+    python3 shared/sync.py --check  # exit 1 if any charm copy has drifted
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "shared" / "src"
+
+# Shared module -> charm source directories holding a copy
+MODULES = {
+    "_collector.py": [
+        "radarr-k8s/src/_radarr",
+        "sabnzbd-k8s/src/_sabnzbd",
+        "seerr-k8s/src/_seerr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_collector_daemon.py": [
+        "radarr-k8s/src",
+        "sabnzbd-k8s/src",
+        "seerr-k8s/src",
+        "sonarr-k8s/src",
+    ],
+    "_daemon_core.py": [
+        "charmarr-crowsnest-k8s/src",
+        "radarr-k8s/src",
+        "sabnzbd-k8s/src",
+        "seerr-k8s/src",
+        "sonarr-k8s/src",
+    ],
+    "_debounce.py": [
+        "radarr-k8s/src/_radarr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_guides.py": [
+        "radarr-k8s/src/_radarr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_k8s_cache.py": [
+        "charmarr-storage-k8s/src/_storage",
+        "gluetun-k8s/src",
+    ],
+    "_ownership.py": [
+        "plex-k8s/src/_plex",
+        "qbittorrent-k8s/src/_qbittorrent",
+        "radarr-k8s/src/_radarr",
+        "sabnzbd-k8s/src/_sabnzbd",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_pebble.py": [
+        "flaresolverr-k8s/src",
+        "gluetun-k8s/src",
+        "overseerr-k8s/src/_overseerr",
+        "plex-k8s/src/_plex",
+        "prowlarr-k8s/src/_prowlarr",
+        "qbittorrent-k8s/src/_qbittorrent",
+        "radarr-k8s/src/_radarr",
+        "sabnzbd-k8s/src/_sabnzbd",
+        "seerr-k8s/src/_seerr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_profiler.py": [
+        "charmarr-storage-k8s/src/_storage",
+        "gluetun-k8s/src",
+        "plex-k8s/src/_plex",
+        "prowlarr-k8s/src/_prowlarr",
+        "qbittorrent-k8s/src/_qbittorrent",
+        "radarr-k8s/src/_radarr",
+        "sabnzbd-k8s/src/_sabnzbd",
+        "seerr-k8s/src/_seerr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_publish.py": [
+        "charmarr-storage-k8s/src/_storage",
+        "flaresolverr-k8s/src",
+        "gluetun-k8s/src",
+        "overseerr-k8s/src/_overseerr",
+        "plex-k8s/src/_plex",
+        "prowlarr-k8s/src/_prowlarr",
+        "qbittorrent-k8s/src/_qbittorrent",
+        "radarr-k8s/src/_radarr",
+        "sabnzbd-k8s/src/_sabnzbd",
+        "seerr-k8s/src/_seerr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_ready.py": [
+        "prowlarr-k8s/src/_prowlarr",
+        "qbittorrent-k8s/src/_qbittorrent",
+        "radarr-k8s/src/_radarr",
+        "sabnzbd-k8s/src/_sabnzbd",
+        "seerr-k8s/src/_seerr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_recyclarr.py": [
+        "radarr-k8s/src/_radarr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_secrets.py": [
+        "gluetun-k8s/src",
+        "overseerr-k8s/src/_overseerr",
+        "prowlarr-k8s/src/_prowlarr",
+        "qbittorrent-k8s/src/_qbittorrent",
+        "radarr-k8s/src/_radarr",
+        "sabnzbd-k8s/src/_sabnzbd",
+        "seerr-k8s/src/_seerr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_session.py": [
+        "prowlarr-k8s/src/_prowlarr",
+        "radarr-k8s/src/_radarr",
+        "seerr-k8s/src/_seerr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_statefulset.py": [
+        "gluetun-k8s/src",
+        "plex-k8s/src/_plex",
+        "prowlarr-k8s/src/_prowlarr",
+        "qbittorrent-k8s/src/_qbittorrent",
+        "radarr-k8s/src/_radarr",
+        "sabnzbd-k8s/src/_sabnzbd",
+        "sonarr-k8s/src/_sonarr",
+    ],
+    "_trash_sync.py": [
+        "radarr-k8s/src/_radarr",
+        "sonarr-k8s/src/_sonarr",
+    ],
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="report drift instead of fixing it")
+    args = parser.parse_args()
+
+    drifted = []
+    for module, targets in MODULES.items():
+        content = (SOURCE / module).read_text()
+        for target in targets:
+            path = ROOT / "charms" / target / module
+            if path.exists() and path.read_text() == content:
+                continue
+            drifted.append(path.relative_to(ROOT))
+            if not args.check:
+                path.write_text(content)
+
+    for path in drifted:
+        print(f"{'out of sync' if args.check else 'updated'}: {path}")
+    if args.check and drifted:
+        print("Edit shared/src and run: python3 shared/sync.py")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())